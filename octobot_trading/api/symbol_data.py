@@ -42,7 +42,7 @@ def has_symbol_klines(symbol_data, time_frame) -> bool:
 
 
 def get_symbol_klines(symbol_data, time_frame) -> list:
-    return symbol_data.symbol_klines[TimeFrames(time_frame)].kline
+    return symbol_data.symbol_klines[TimeFrames(time_frame)].get_kline().tolist()
 
 
 def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
@@ -26,6 +26,12 @@ def get_trade_history(exchange_manager, symbol=None, since=None, as_dict=False)
             if _trade_filter(trade, symbol, since)]
 
 
+def get_full_trade_history(exchange_manager, symbol=None, since=None, limit=None) -> list:
+    return exchange_manager.exchange_personal_data.trades_manager.get_trades_history(symbol=symbol,
+                                                                                     since=since,
+                                                                                     limit=limit)
+
+
 def _trade_filter(trade, symbol=None, timestamp=None) -> bool:
     if symbol is None and timestamp is None:
         return True
@@ -21,14 +21,24 @@ from octobot_trading.channels.exchange_channel import ExchangeChannel, ExchangeC
 
 
 class OrderBookProducer(ExchangeChannelProducer):
-    async def push(self, symbol, asks, bids):
-        await self.perform(symbol, asks, bids)
+    async def push(self, symbol, asks, bids, is_delta=False):
+        await self.perform(symbol, asks, bids, is_delta=is_delta)
 
-    async def perform(self, symbol, asks, bids):
+    async def perform(self, symbol, asks, bids, is_delta=False):
+        """
+        :param is_delta: when True, asks and bids are L2 levels updates (0 sized levels are removed)
+        and consumers receive the updated order book levels
+        """
         try:
             if self.channel.get_filtered_consumers(symbol=CHANNEL_WILDCARD) or self.channel.get_filtered_consumers(
                     symbol=symbol):  # and symbol_data.order_book_is_initialized()
-                self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
+                symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+                if is_delta:
+                    symbol_data.handle_order_book_delta(asks, bids)
+                    asks, bids = symbol_data.order_book_manager.get_asks(), \
+                        symbol_data.order_book_manager.get_bids()
+                else:
+                    symbol_data.handle_order_book_update(asks, bids)
                 await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
                                 get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
@@ -36,6 +36,18 @@ CONFIG_TRADER_REFERENCE_MARKET = "reference-market"
 DEFAULT_REFERENCE_MARKET = "BTC"
 CURRENCY_DEFAULT_MAX_PRICE_DIGITS = 8
 
+# Candles history
+CONFIG_CANDLES_HISTORY = "candles-history"
+CONFIG_CANDLES_HISTORY_TIME_FRAMES = "time-frames"
+CONFIG_CANDLES_HISTORY_MEMORY_BUDGET = "memory-budget"
+MIN_CANDLES_HISTORY_SIZE = 200
+CONFIG_CANDLES_HISTORY_STORAGE_PATH = "storage-path"
+
+# Trades history
+CONFIG_TRADES_HISTORY = "trades-history"
+CONFIG_TRADES_HISTORY_STORAGE_PATH = "storage-path"
+TRADES_HISTORY_FILE_EXTENSION = ".sqlite"
+
 # Order creation
 ORDER_DATA_FETCHING_TIMEOUT = 60
 
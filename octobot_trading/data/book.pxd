@@ -14,16 +14,19 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from octobot_trading.data_manager.order_book_manager cimport OrderBookManager
 
 cdef class Book:
-    cdef public timestamp
+    cdef public double timestamp
 
-    cdef public object orders
+    cdef public OrderBookManager order_book_manager
 
     cpdef void reset(self)
     cpdef void handle_book_update(self, list orders, str id_key=*)
     cpdef void handle_book_delta_delete(self, list orders, str id_key=*)
     cpdef void handle_book_delta_update(self, list orders, str id_key=*)
     cpdef void handle_book_delta_insert(self, list orders, str id_key=*)
-    cpdef list get_asks(self, str side=*)
-    cpdef list get_bids(self, str side=*)
\ No newline at end of file
+    cpdef list get_asks(self, object side=*)
+    cpdef list get_bids(self, object side=*)
+
+    cdef list _get_side_levels(self, object side)
\ No newline at end of file
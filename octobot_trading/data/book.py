@@ -13,42 +13,52 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import pandas as pd
 from time import time
 
+from octobot_trading.data_manager.order_book_manager import OrderBookManager
 from octobot_trading.enums import TradeOrderSide
 
 
 class Book:
+    """
+    L3 order book: orders are aggregated into the price levels of an OrderBookManager
+    """
     def __init__(self):
-        self.orders = pd.DataFrame()
+        self.order_book_manager = OrderBookManager()
         self.timestamp = 0
 
     def reset(self):
-        self.orders = pd.DataFrame()
+        self.order_book_manager.reset_order_book()
         self.timestamp = 0
 
     def handle_book_update(self, orders, id_key="id"):
-        self.orders = pd.json_normalize(orders).set_index(id_key).sort_index(ascending=False)
+        self.order_book_manager.order_book_orders_update(orders, id_key=id_key)
         self.timestamp = time()
 
     def handle_book_delta_delete(self, orders, id_key="id"):
-        ids = [order[id_key] for order in orders]
-        self.orders.drop(index=ids, errors='ignore')
+        self.order_book_manager.order_book_orders_delta_delete(orders, id_key=id_key)
+        self.timestamp = time()
 
     def handle_book_delta_update(self, orders, id_key="id"):
-        update_list = pd.json_normalize(orders).set_index(id_key)
-        self.orders.update(update_list)
-        self.orders = self.orders.sort_index(ascending=False)
+        self.order_book_manager.order_book_orders_delta_update(orders, id_key=id_key)
         self.timestamp = time()
 
     def handle_book_delta_insert(self, orders, id_key="id"):
-        insert_list = pd.json_normalize(orders).set_index(id_key)
-        self.orders.update(insert_list)
-        self.orders = self.orders.sort_index(ascending=False)
+        self.order_book_manager.order_book_orders_delta_insert(orders, id_key=id_key)
+        self.timestamp = time()
+
+    def get_asks(self, side=TradeOrderSide.SELL):
+        return self._get_side_levels(side)
 
-    def get_asks(self, side=TradeOrderSide.SELL.value):
-        return self.orders.query(f"side.str.contains('{side}')", engine='python').values.tolist()
+    def get_bids(self, side=TradeOrderSide.BUY):
+        return self._get_side_levels(side)
 
-    def get_bids(self, side=TradeOrderSide.BUY.value):
-        return self.orders.query(f"side.str.contains('{side}')", engine='python').values.tolist()
+    def _get_side_levels(self, side):
+        """
+        :param side: TradeOrderSide.SELL for asks, TradeOrderSide.BUY for bids
+        """
+        if side is TradeOrderSide.SELL:
+            return self.order_book_manager.get_asks()
+        if side is TradeOrderSide.BUY:
+            return self.order_book_manager.get_bids()
+        raise ValueError(f"Invalid order book side: {side!r}, expected a TradeOrderSide")
@@ -0,0 +1,28 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class CurrencyConversionGraph:
+    cdef public list symbols
+    cdef public dict markets
+    cdef public dict conversion_paths
+
+    cpdef object get_conversion_path(self, str currency, str reference_market)
+    cpdef dict get_conversion_paths(self, str reference_market)
+
+    cdef void _add_symbol(self, str symbol)
+    cdef void _add_market(self, str currency, str market, str symbol, bint inverted)
+    cdef dict _compute_conversion_paths(self, str reference_market)
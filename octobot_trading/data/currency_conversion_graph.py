@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_commons.symbol_util import split_symbol
+
+
+class CurrencyConversionGraph:
+    """
+    Graph of the currencies linked by exchange symbols.
+    Shortest conversion paths into a reference market are computed once by reference market with a breadth first
+    search and cached until the graph is rebuilt. Among paths of the same length, paths through the currencies
+    with the most markets (usually the most liquid ones) are preferred.
+    """
+
+    def __init__(self, symbols):
+        # kept as given to identify the symbols list this graph has been built from
+        self.symbols = symbols
+        # {currency: {market: (symbol, inverted)}}
+        self.markets = {}
+        for symbol in symbols:
+            self._add_symbol(symbol)
+        # {reference market: {currency: [(symbol, inverted), ...] hops converting currency into reference market}}
+        self.conversion_paths = {}
+
+    def get_conversion_path(self, currency, reference_market):
+        """
+        :return: the (symbol, inverted) hops converting currency into reference_market, None if there is none
+        """
+        return self.get_conversion_paths(reference_market).get(currency, None)
+
+    def get_conversion_paths(self, reference_market):
+        """
+        :return: the conversion path into reference_market of every currency that can be converted into it
+        """
+        try:
+            return self.conversion_paths[reference_market]
+        except KeyError:
+            self.conversion_paths[reference_market] = self._compute_conversion_paths(reference_market)
+            return self.conversion_paths[reference_market]
+
+    def _add_symbol(self, symbol):
+        currency, market = split_symbol(symbol)
+        self._add_market(currency, market, symbol, False)
+        self._add_market(market, currency, symbol, True)
+
+    def _add_market(self, currency, market, symbol, inverted):
+        currency_markets = self.markets.setdefault(currency, {})
+        # prefer the currency/market symbol over the market/currency one
+        if market not in currency_markets or (currency_markets[market][1] and not inverted):
+            currency_markets[market] = (symbol, inverted)
+
+    def _compute_conversion_paths(self, reference_market):
+        conversion_paths = {reference_market: []}
+        currencies_to_visit = [reference_market]
+        while currencies_to_visit:
+            next_currencies_to_visit = []
+            # currencies with the most markets first: they are the first to link the next currencies
+            visit_order = []
+            for index, currency in enumerate(currencies_to_visit):
+                visit_order.append((-len(self.markets.get(currency, {})), index, currency))
+            visit_order.sort()
+            for _, _, currency in visit_order:
+                for market in self.markets.get(currency, {}):
+                    if market not in conversion_paths:
+                        # convert market into currency then currency into reference market
+                        conversion_paths[market] = [self.markets[market][currency]] + conversion_paths[currency]
+                        next_currencies_to_visit.append(market)
+            currencies_to_visit = next_currencies_to_visit
+        return conversion_paths
@@ -0,0 +1,61 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns
+
+
+class LastPrices:
+    """
+    Time sorted (timestamp, price) columns of a recent trades batch with the lowest and highest price
+    of the trades since each timestamp: the extremum price since a given time is a single lookup
+    """
+
+    def __init__(self, timestamps, prices):
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        valid_prices = ~np.isnan(prices)
+        ordered_indexes = np.argsort(timestamps[valid_prices], kind="stable")
+        self.timestamps = timestamps[valid_prices][ordered_indexes]
+        self.prices = prices[valid_prices][ordered_indexes]
+        # min and max of prices[i:] at i
+        self.min_prices_since = np.minimum.accumulate(self.prices[::-1])[::-1]
+        self.max_prices_since = np.maximum.accumulate(self.prices[::-1])[::-1]
+
+    @staticmethod
+    def from_recent_trades(recent_trades):
+        """
+        :param recent_trades: recent trades dicts
+        :return: the LastPrices of recent_trades
+        """
+        return LastPrices([recent_trade[ExchangeConstantsOrderColumns.TIMESTAMP.value]
+                           for recent_trade in recent_trades],
+                          [recent_trade[ExchangeConstantsOrderColumns.PRICE.value]
+                           for recent_trade in recent_trades])
+
+    def get_min_price(self, since=-np.inf):
+        """
+        :return: the lowest price of the trades that happened at or after since, inf when there is no such trade
+        """
+        since_index = np.searchsorted(self.timestamps, since, side="left")
+        return self.min_prices_since[since_index] if since_index < len(self.timestamps) else np.inf
+
+    def get_max_price(self, since=-np.inf):
+        """
+        :return: the highest price of the trades that happened at or after since, -inf when there is no such trade
+        """
+        since_index = np.searchsorted(self.timestamps, since, side="left")
+        return self.max_prices_since[since_index] if since_index < len(self.timestamps) else -np.inf
@@ -19,6 +19,8 @@
 from octobot_trading.data.portfolio cimport Portfolio
 
 cdef class MarginPortfolio(Portfolio):
+    cdef int margin_index
+
     cdef void _reset_currency_portfolio(self, str currency)
     cdef dict _parse_currency_balance(self, dict currency_balance)
     cdef dict _create_currency_portfolio(self, double available, double total, double margin=*)
@@ -19,6 +19,12 @@ from octobot_trading.data.portfolio import Portfolio
 
 
 class MarginPortfolio(Portfolio):
+    PORTFOLIO_COLUMNS = (PORTFOLIO_AVAILABLE, MARGIN_PORTFOLIO, PORTFOLIO_TOTAL)
+
+    def __init__(self, exchange_name, is_simulated=False):
+        super().__init__(exchange_name, is_simulated=is_simulated)
+        self.margin_index = self.columns_indexes[MARGIN_PORTFOLIO]
+
     async def update_portfolio_from_position(self, position):
         pass  # TODO
 
@@ -40,9 +46,9 @@ class MarginPortfolio(Portfolio):
         self._set_currency_portfolio(currency=currency, available=0, total=0, margin=0)
 
     def _set_currency_portfolio(self, currency, available, total, margin=0):
-        self.portfolio[currency] = self._create_currency_portfolio(available=available, total=total, margin=margin)
+        super()._set_currency_portfolio(currency, available, total)
+        self.holdings[self.margin_index, self.currencies_indexes[currency]] = margin
 
     def _update_currency_portfolio(self, currency, available=0, total=0, margin=0):
-        self.portfolio[currency][PORTFOLIO_AVAILABLE] += available
-        self.portfolio[currency][MARGIN_PORTFOLIO] += margin
-        self.portfolio[currency][PORTFOLIO_TOTAL] += total
+        super()._update_currency_portfolio(currency, available=available, total=total)
+        self.holdings[self.margin_index, self.currencies_indexes[currency]] += margin
@@ -26,9 +26,9 @@ cdef class Order:
     cdef public object exchange_manager
 
     cdef public object side # TradeOrderSide
-    cdef public object status # OrderStatus
+    cdef object _status # OrderStatus
     cdef public object order_type # TraderOrderType
-    cdef public object lock # Lock
+    cdef object _lock # Lock
 
     cdef public Order linked_to
     cdef public Portfolio linked_portfolio
@@ -86,7 +86,7 @@ cdef class Order:
     cdef void __update_taker_maker_from_raw(self)
 
     cpdef str to_string(self)
-    cpdef bint check_last_prices(self, list last_prices, double price_to_check, bint inferior)
+    cpdef bint check_last_prices(self, object last_prices, double price_to_check, bint inferior)
     cpdef add_linked_order(self, Order order)
     cpdef tuple get_currency_and_market(self)
     cpdef double get_total_fees(self, str currency)
@@ -15,12 +15,12 @@
 #  License along with this library.
 import time
 from asyncio import Lock
-import math
 
 from octobot_commons.logging.logging_util import get_logger
+from octobot_trading.data.last_prices import LastPrices
 from octobot_trading.enums import TradeOrderSide, OrderStatus, TraderOrderType, \
     FeePropertyColumns, ExchangeConstantsMarketPropertyColumns, \
-    ExchangeConstantsOrderColumns as ECOC, ExchangeConstantsOrderColumns, TradeOrderType
+    ExchangeConstantsOrderColumns, TradeOrderType
 from octobot_trading.orders.order_util import get_fees_for_currency
 
 
@@ -30,14 +30,20 @@ class Order:
     In simulation it will also define rules to be filled / canceled
     It is also use to store creation & fill values of the order
     """
+    __slots__ = ("trader", "exchange_manager", "_status", "creation_time", "executed_time", "_lock", "linked_orders",
+                 "order_id", "simulated", "symbol", "currency", "market", "taker_or_maker", "timestamp",
+                 "origin_price", "created_last_price", "origin_quantity", "origin_stop_price", "order_type", "side",
+                 "filled_quantity", "linked_portfolio", "linked_to", "canceled_time", "fee", "filled_price",
+                 "order_profitability", "total_cost", "exchange_order_type", "is_from_this_octobot")
 
     def __init__(self, trader):
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
-        self.status = OrderStatus.OPEN
+        self._status = OrderStatus.OPEN
         self.creation_time = time.time()
         self.executed_time = 0
-        self.lock = Lock()
+        # created on first use: most orders are never locked
+        self._lock = None
         self.linked_orders = []
 
         self.order_id = trader.parse_order_id(None)
@@ -66,6 +72,24 @@ class Order:
         # raw exchange order type, used to create order dict
         self.exchange_order_type = None
 
+    @property
+    def lock(self):
+        if self._lock is None:
+            self._lock = Lock()
+        return self._lock
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        self._status = status
+        # keep the orders manager status indexes up to date
+        if self.exchange_manager is not None and self.exchange_manager.exchange_personal_data is not None \
+                and self.exchange_manager.exchange_personal_data.orders_manager is not None:
+            self.exchange_manager.exchange_personal_data.orders_manager.update_order_index(self)
+
     @classmethod
     def get_name(cls):
         return cls.__name__
@@ -154,7 +178,7 @@ class Order:
                 self.executed_time = self.trader.exchange_manager.exchange.get_uniform_timestamp(timestamp)
         return changed
 
-    async def update_order_status(self, last_prices: list):
+    async def update_order_status(self, last_prices: LastPrices):
         """
         Update_order_status will define the rules for a simulated order to be filled / canceled
         """
@@ -162,25 +186,25 @@ class Order:
 
     # check_last_prices is used to collect data to perform the order update_order_status process
     def check_last_prices(self, last_prices, price_to_check, inferior) -> bool:
+        """
+        :param last_prices: a LastPrices or a list of recent trades
+        :return: True when a price of the trades that happened since the order creation is lower (when inferior)
+        or higher than price_to_check
+        """
         if last_prices:
-            prices = [p[ECOC.PRICE.value]
-                      for p in last_prices
-                      if not math.isnan(p[ECOC.PRICE.value]) and (
-                              p[ECOC.TIMESTAMP.value] >= self.creation_time)]
-
-            if prices:
-                if inferior:
-                    if float(min(prices)) < price_to_check:
-                        get_logger(self.get_name()).debug(f"{self.symbol} last prices: {prices}, "
-                                                          f"ask for {'inferior' if inferior else 'superior'} "
-                                                          f"to {price_to_check}")
-                        return True
-                else:
-                    if float(max(prices)) > price_to_check:
-                        get_logger(self.get_name()).debug(f"{self.symbol} last prices: {prices}, "
-                                                          f"ask for {'inferior' if inferior else 'superior'} "
-                                                          f"to {price_to_check}")
-                        return True
+            if not isinstance(last_prices, LastPrices):
+                last_prices = LastPrices.from_recent_trades(last_prices)
+            if inferior:
+                extremum_price = last_prices.get_min_price(self.creation_time)
+                is_crossed = extremum_price < price_to_check
+            else:
+                extremum_price = last_prices.get_max_price(self.creation_time)
+                is_crossed = extremum_price > price_to_check
+            if is_crossed:
+                get_logger(self.get_name()).debug(f"{self.symbol} last {'min' if inferior else 'max'} price: "
+                                                  f"{extremum_price}, ask for "
+                                                  f"{'inferior' if inferior else 'superior'} to {price_to_check}")
+                return True
         return False
 
     async def cancel_order(self):
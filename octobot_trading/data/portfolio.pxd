@@ -19,7 +19,11 @@
 """ Order class will represent an open order in the specified exchange
 In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
+cimport numpy as np
+np.import_array()
+
 from octobot_trading.data.order cimport Order
+from octobot_trading.data.portfolio_snapshot cimport PortfolioSnapshot
 from octobot_trading.util.initializable cimport Initializable
 
 cdef class Portfolio(Initializable):
@@ -30,18 +34,41 @@ cdef class Portfolio(Initializable):
 
     cdef public bint is_simulated
 
-    cdef public dict portfolio
+    cdef public dict columns_indexes
+    cdef public int available_index
+    cdef public int total_index
+
+    cdef public list currencies
+    cdef public dict currencies_indexes
+    cdef public np.ndarray holdings
+
+    cdef public long long version
+    cdef public bint is_holdings_shared
+    cdef public bint is_currencies_shared
+
+    cdef object portfolio_view
 
     cpdef double get_currency_portfolio(self, str currency, str portfolio_type=*)
     cpdef void update_portfolio_available(self, Order order, bint is_new_order=*)
     cpdef void reset_portfolio_available(self, str reset_currency=*, object reset_quantity=*)
     cpdef double get_currency_from_given_portfolio(self, str currency, str portfolio_type=*)
+    cpdef PortfolioSnapshot get_snapshot(self)
+    cpdef bint has_changed_since(self, PortfolioSnapshot snapshot)
+    cpdef dict get_changed_currencies_since(self, PortfolioSnapshot snapshot)
+    cpdef np.ndarray get_holdings(self, str portfolio_type=*)
 
-    cdef void _update_portfolio_data(self, str currency, double value, bint total=*, bint available=*)
+    cdef void _update_portfolio_data(self, list currencies, np.ndarray values, np.ndarray total, np.ndarray available)
     cdef void _update_portfolio_available(self, Order order, bint factor=*)
     cdef bint _check_available_should_update(self, Order order)
     cdef void _reset_currency_portfolio(self, str currency)
     cdef dict _parse_currency_balance(self, dict currency_balance)
     cdef dict _create_currency_portfolio(self, double available, double total)
+    cdef void _set_portfolio(self, dict portfolio)
+    cdef void _prepare_holdings_write(self)
+    cdef tuple _add_currencies(self, list currencies)
+    cpdef void _set_currency_holdings(self, str currency, object currency_portfolio)
+    cpdef void _set_currency_column(self, str currency, str column, double quantity)
+    cpdef void _remove_currency(self, str currency)
+    cpdef dict _get_portfolio_dict(self, list currencies, np.ndarray holdings)
     cdef void _set_currency_portfolio(self, str currency, double available, double total)
     cdef void _update_currency_portfolio(self, str currency, double available=*, double total=*)
@@ -14,8 +14,11 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from asyncio import Lock
-from copy import deepcopy
+from collections.abc import MutableMapping
 
+import numpy as np
+
+from octobot_trading.data.portfolio_snapshot import PortfolioSnapshot
 from octobot_trading.orders.types import TraderOrderTypeClasses
 from octobot_trading.util.initializable import Initializable
 from octobot_trading.constants import CURRENT_PORTFOLIO_STRING, CONFIG_PORTFOLIO_FREE, CONFIG_PORTFOLIO_TOTAL
@@ -32,38 +35,111 @@ class Portfolio(Initializable):
     This class also manage the availability of each currency in the portfolio:
     - When an order is created it will subtract the quantity of the total
     - When an order is filled or canceled restore the availability with the real quantity
+    Currencies are interned to slots of a (len(PORTFOLIO_COLUMNS), capacity) float64 holdings array,
+    the portfolio attribute is a {currency: {column: quantity}} mapping view of this array: reads and writes
+    go through to the holdings.
+    Copies and snapshots share the holdings array and the currencies: they are copied on write,
+    on the first update that follows.
     """
+    PORTFOLIO_COLUMNS = (PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL)
+    INITIAL_CURRENCIES_CAPACITY = 16
+
     def __init__(self, exchange_name, is_simulated=False):
         super().__init__()
         self.exchange_name = exchange_name
         self.is_simulated = is_simulated
 
-        self.portfolio = {}
+        self.columns_indexes = {column: index for index, column in enumerate(self.PORTFOLIO_COLUMNS)}
+        self.available_index = self.columns_indexes[PORTFOLIO_AVAILABLE]
+        self.total_index = self.columns_indexes[PORTFOLIO_TOTAL]
+
+        # append only currencies slots: copied before adding a currency when shared
+        self.currencies = []
+        self.currencies_indexes = {}
+        self.holdings = np.zeros((len(self.PORTFOLIO_COLUMNS), self.INITIAL_CURRENCIES_CAPACITY), dtype=np.float64)
+
         self.logger = get_logger(
             f"{self.__class__.__name__}{'Simulator' if is_simulated else ''}[{exchange_name}]")
         self.lock = Lock()
 
+        # incremented on each update
+        self.version = 0
+        # True when self.holdings is shared with a copy or a snapshot
+        self.is_holdings_shared = False
+        # True when self.currencies and self.currencies_indexes are shared with a copy or a snapshot
+        self.is_currencies_shared = False
+
+        # live mapping view of the holdings, created on first use
+        self.portfolio_view = None
+
     async def initialize_impl(self):
-        self.portfolio = {}
+        self._set_portfolio({})
+
+    @property
+    def portfolio(self):
+        """
+        :return: a {currency: {column: quantity}} PortfolioView of the portfolio, updates are written to the holdings
+        """
+        if self.portfolio_view is None:
+            self.portfolio_view = PortfolioView(self)
+        return self.portfolio_view
+
+    @portfolio.setter
+    def portfolio(self, portfolio):
+        self._set_portfolio(portfolio)
 
     async def copy(self):
-        pf: Portfolio = Portfolio(self.exchange_name, self.is_simulated)
+        pf: Portfolio = self.__class__(self.exchange_name, self.is_simulated)
         await pf.initialize()
-        pf.portfolio = deepcopy(self.portfolio)
+        pf.currencies = self.currencies
+        pf.currencies_indexes = self.currencies_indexes
+        pf.holdings = self.holdings
+        pf.version = self.version
+        pf.is_holdings_shared = pf.is_currencies_shared = \
+            self.is_holdings_shared = self.is_currencies_shared = True
         return pf
 
+    def get_snapshot(self):
+        """
+        :return: a PortfolioSnapshot of the current portfolio, in O(1)
+        """
+        self.is_holdings_shared = self.is_currencies_shared = True
+        return PortfolioSnapshot(self.PORTFOLIO_COLUMNS, self.currencies, self.currencies_indexes,
+                                 self.holdings, self.version)
+
+    def has_changed_since(self, snapshot):
+        return self.version != snapshot.version
+
+    def get_changed_currencies_since(self, snapshot):
+        """
+        :return: the {currency: (snapshot currency portfolio, current currency portfolio)} of the currencies which
+        holdings changed since snapshot
+        """
+        if not self.has_changed_since(snapshot):
+            return {}
+        return snapshot.get_changed_currencies(self.currencies, self.currencies_indexes, self.holdings)
+
+    def get_holdings(self, portfolio_type=PORTFOLIO_TOTAL):
+        """
+        :return: a read-only view of the portfolio_type quantity of each currency by currency slot
+        """
+        holdings = self.holdings[self.columns_indexes[portfolio_type], :len(self.currencies)]
+        holdings.flags.writeable = False
+        return holdings
+
     async def update_portfolio_from_balance(self, balance) -> bool:
         if balance == self.portfolio:
             return False
-        self.portfolio = {currency: self._parse_currency_balance(balance[currency]) for currency in balance}
+        self._set_portfolio({currency: self._parse_currency_balance(balance[currency]) for currency in balance})
         self.logger.debug(f"Portfolio updated | {CURRENT_PORTFOLIO_STRING} {self.portfolio}")
         return False
 
     def get_currency_from_given_portfolio(self, currency, portfolio_type=PORTFOLIO_AVAILABLE):
-        if currency in self.portfolio:
-            return self.portfolio[currency][portfolio_type]
-        self._reset_currency_portfolio(currency)
-        return self.portfolio[currency][portfolio_type]
+        try:
+            return float(self.holdings[self.columns_indexes[portfolio_type], self.currencies_indexes[currency]])
+        except KeyError:
+            # unknown currency: nothing is held
+            return 0
 
     # Get specified currency quantity in the portfolio
     def get_currency_portfolio(self, currency, portfolio_type=PORTFOLIO_AVAILABLE):
@@ -82,23 +158,6 @@ class Portfolio(Initializable):
 
         currency, market = order.get_currency_and_market()
 
-        # update currency
-        if order.side == TradeOrderSide.BUY:
-            new_quantity = order.filled_quantity - order.get_total_fees(currency)
-            self._update_portfolio_data(currency, new_quantity, True, True)
-        else:
-            new_quantity = -order.filled_quantity
-            self._update_portfolio_data(currency, new_quantity, True, False)
-
-        # update market
-        if order.side == TradeOrderSide.BUY:
-            new_quantity = -(order.filled_quantity * order.filled_price)
-            self._update_portfolio_data(market, new_quantity, True, False)
-        else:
-            new_quantity = (order.filled_quantity * order.filled_price) - order.get_total_fees(market)
-            self._update_portfolio_data(market, new_quantity, True, True)
-
-        # Only for log purpose
         if order.side == TradeOrderSide.BUY:
             currency_portfolio_num = order.filled_quantity - order.get_total_fees(currency)
             market_portfolio_num = -order.filled_quantity * order.filled_price
@@ -107,6 +166,13 @@ class Portfolio(Initializable):
             market_portfolio_num = \
                 order.filled_quantity * order.filled_price - order.get_total_fees(market)
 
+        # update currency and market at once: the available quantity of the sold one is already updated
+        is_buy = order.side == TradeOrderSide.BUY
+        self._update_portfolio_data([currency, market],
+                                    np.array([currency_portfolio_num, market_portfolio_num], dtype=np.float64),
+                                    total=np.array([True, True]),
+                                    available=np.array([is_buy, not is_buy]))
+
         self.logger.debug(f"Portfolio updated from order | {currency} {currency_portfolio_num} | {market} "
                           f"{market_portfolio_num} | {CURRENT_PORTFOLIO_STRING} {self.portfolio}")
 
@@ -132,16 +198,14 @@ class Portfolio(Initializable):
     # Resets available amount with total amount CAREFUL: if no currency is given, resets all the portfolio !
     def reset_portfolio_available(self, reset_currency=None, reset_quantity=None):
         if not reset_currency:
-            self.portfolio.update({currency: self._create_currency_portfolio(
-                available=self.portfolio[currency][PORTFOLIO_TOTAL],
-                total=self.portfolio[currency][PORTFOLIO_TOTAL])
-                for currency in self.portfolio})
+            self._prepare_holdings_write()
+            currencies_count = len(self.currencies)
+            self.holdings[self.available_index, :currencies_count] = self.holdings[self.total_index, :currencies_count]
         else:
-            if reset_currency in self.portfolio:
+            if reset_currency in self.currencies_indexes:
                 if reset_quantity is None:
-                    self._set_currency_portfolio(currency=reset_currency,
-                                                 available=self.portfolio[reset_currency][PORTFOLIO_TOTAL],
-                                                 total=self.portfolio[reset_currency][PORTFOLIO_TOTAL])
+                    total = self.get_currency_from_given_portfolio(reset_currency, PORTFOLIO_TOTAL)
+                    self._set_currency_portfolio(currency=reset_currency, available=total, total=total)
                 else:
                     self._update_currency_portfolio(currency=reset_currency, available=reset_quantity)
 
@@ -151,14 +215,20 @@ class Portfolio(Initializable):
         return {currency: self._create_currency_portfolio(available=total, total=total)
                 for currency, total in amount_dict.items()}
 
-    # Set new currency quantity in the portfolio
-    def _update_portfolio_data(self, currency, value, total=True, available=False):
-        if currency in self.portfolio:
-            self._update_currency_portfolio(currency,
-                                            available=value if available else 0,
-                                            total=value if total else 0)
-        else:
-            self._set_currency_portfolio(currency=currency, available=value, total=value)
+    # Set new currencies quantities in the portfolio
+    def _update_portfolio_data(self, currencies, values, total, available):
+        """
+        Adds values to the total and / or available quantities of currencies
+        :param currencies: the distinct currencies to update
+        :param values: the quantities to add by currency
+        :param total: True by currency when the total quantity is to be updated
+        :param available: True by currency when the available quantity is to be updated
+        """
+        self._prepare_holdings_write()
+        currencies_indexes, new_currencies = self._add_currencies(currencies)
+        # a new currency gets the given quantity as total and available quantity
+        self.holdings[self.total_index, currencies_indexes] += np.where(total | new_currencies, values, 0)
+        self.holdings[self.available_index, currencies_indexes] += np.where(available | new_currencies, values, 0)
 
     # Check if the order has impact on availability
     def _check_available_should_update(self, order):
@@ -172,13 +242,15 @@ class Portfolio(Initializable):
 
         # when buy order
         if order.side == TradeOrderSide.BUY:
+            updated_currency = market
             new_quantity = - order.origin_quantity * order.origin_price * factor
-            self._update_portfolio_data(market, new_quantity, False, True)
 
         # when sell order
         else:
+            updated_currency = currency
             new_quantity = - order.origin_quantity * factor
-            self._update_portfolio_data(currency, new_quantity, False, True)
+        self._update_portfolio_data([updated_currency], np.array([new_quantity], dtype=np.float64),
+                                    total=np.array([False]), available=np.array([True]))
 
     # parse the exchange balance
     def _parse_currency_balance(self, currency_balance):
@@ -191,12 +263,188 @@ class Portfolio(Initializable):
     def _create_currency_portfolio(self, available, total):
         return {PORTFOLIO_AVAILABLE: available, PORTFOLIO_TOTAL: total}
 
+    def _set_portfolio(self, portfolio):
+        """
+        Replaces the whole portfolio by the given {currency: {column: quantity}} dict
+        """
+        self.currencies = list(portfolio)
+        self.currencies_indexes = {currency: index for index, currency in enumerate(self.currencies)}
+        self.holdings = np.zeros((len(self.PORTFOLIO_COLUMNS),
+                                  max(self.INITIAL_CURRENCIES_CAPACITY, len(self.currencies))), dtype=np.float64)
+        for column, column_index in self.columns_indexes.items():
+            self.holdings[column_index, :len(self.currencies)] = [currency_portfolio.get(column, 0)
+                                                                  for currency_portfolio in portfolio.values()]
+        self.version += 1
+        self.is_holdings_shared = self.is_currencies_shared = False
+
+    def _prepare_holdings_write(self):
+        """
+        Copies the shared holdings array before its update
+        """
+        self.version += 1
+        if self.is_holdings_shared:
+            self.holdings = self.holdings.copy()
+            self.is_holdings_shared = False
+
+    def _add_currencies(self, currencies):
+        """
+        Adds the missing currencies to the portfolio, must be called after _prepare_holdings_write
+        :return: the currencies slots and a mask of the added currencies
+        """
+        new_currencies = np.array([currency not in self.currencies_indexes for currency in currencies], dtype=bool)
+        if new_currencies.any():
+            if self.is_currencies_shared:
+                self.currencies = list(self.currencies)
+                self.currencies_indexes = dict(self.currencies_indexes)
+                self.is_currencies_shared = False
+            for currency, is_new_currency in zip(currencies, new_currencies):
+                if is_new_currency:
+                    self.currencies_indexes[currency] = len(self.currencies)
+                    self.currencies.append(currency)
+            if len(self.currencies) > self.holdings.shape[1]:
+                holdings = np.zeros((self.holdings.shape[0], 2 * len(self.currencies)), dtype=np.float64)
+                holdings[:, :self.holdings.shape[1]] = self.holdings
+                self.holdings = holdings
+        return np.array([self.currencies_indexes[currency] for currency in currencies], dtype=np.int64), \
+            new_currencies
+
+    def _set_currency_holdings(self, currency, currency_portfolio):
+        """
+        Replaces the quantities of currency by the given {column: quantity} mapping, missing columns are set to 0
+        """
+        self._prepare_holdings_write()
+        currency_index = self._add_currencies([currency])[0][0]
+        for column, column_index in self.columns_indexes.items():
+            self.holdings[column_index, currency_index] = currency_portfolio.get(column, 0)
+
+    def _set_currency_column(self, currency, column, quantity):
+        self._prepare_holdings_write()
+        currency_index = self._add_currencies([currency])[0][0]
+        self.holdings[self.columns_indexes[column], currency_index] = quantity
+
+    def _remove_currency(self, currency):
+        """
+        Removes currency from the portfolio: the currencies slots are rebuilt, they are not shared anymore
+        """
+        currency_index = self.currencies_indexes[currency]
+        self.currencies = self.currencies[:currency_index] + self.currencies[currency_index + 1:]
+        self.currencies_indexes = {kept_currency: index for index, kept_currency in enumerate(self.currencies)}
+        self.holdings = np.delete(self.holdings, currency_index, axis=1)
+        self.version += 1
+        self.is_holdings_shared = self.is_currencies_shared = False
+
+    def _get_portfolio_dict(self, currencies, holdings):
+        return {currency: dict(zip(self.PORTFOLIO_COLUMNS, currency_holdings))
+                for currency, currency_holdings in zip(currencies, holdings[:, :len(currencies)].T.tolist())}
+
     def _reset_currency_portfolio(self, currency):
         self._set_currency_portfolio(currency=currency, available=0, total=0)
 
     def _set_currency_portfolio(self, currency, available, total):
-        self.portfolio[currency] = self._create_currency_portfolio(available=available, total=total)
+        self._prepare_holdings_write()
+        currency_index = self._add_currencies([currency])[0][0]
+        self.holdings[self.available_index, currency_index] = available
+        self.holdings[self.total_index, currency_index] = total
 
     def _update_currency_portfolio(self, currency, available=0, total=0):
-        self.portfolio[currency][PORTFOLIO_AVAILABLE] += available
-        self.portfolio[currency][PORTFOLIO_TOTAL] += total
+        self._prepare_holdings_write()
+        currency_index = self._add_currencies([currency])[0][0]
+        self.holdings[self.available_index, currency_index] += available
+        self.holdings[self.total_index, currency_index] += total
+
+
+class PortfolioView(MutableMapping):
+    """
+    {currency: {column: quantity}} mapping of a Portfolio holdings.
+    Reads are made on the current holdings and writes are applied to them through the portfolio,
+    which keeps copies and snapshots unchanged.
+    """
+
+    def __init__(self, portfolio):
+        self.portfolio = portfolio
+
+    def __getitem__(self, currency):
+        if currency not in self.portfolio.currencies_indexes:
+            raise KeyError(currency)
+        return CurrencyPortfolioView(self.portfolio, currency)
+
+    def __setitem__(self, currency, currency_portfolio):
+        self.portfolio._set_currency_holdings(currency, currency_portfolio)
+
+    def __delitem__(self, currency):
+        if currency not in self.portfolio.currencies_indexes:
+            raise KeyError(currency)
+        self.portfolio._remove_currency(currency)
+
+    def __contains__(self, currency):
+        return currency in self.portfolio.currencies_indexes
+
+    def __iter__(self):
+        return iter(list(self.portfolio.currencies))
+
+    def __len__(self):
+        return len(self.portfolio.currencies)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def pop(self, currency, *default):
+        if currency not in self.portfolio.currencies_indexes:
+            if default:
+                return default[0]
+            raise KeyError(currency)
+        currency_portfolio = self[currency].copy()
+        del self[currency]
+        return currency_portfolio
+
+    def copy(self):
+        """
+        :return: a {currency: {column: quantity}} dict of the current holdings
+        """
+        return self.portfolio._get_portfolio_dict(self.portfolio.currencies, self.portfolio.holdings)
+
+
+class CurrencyPortfolioView(MutableMapping):
+    """
+    {column: quantity} mapping of a currency holdings in a Portfolio, columns can't be removed.
+    """
+
+    def __init__(self, portfolio, currency):
+        self.portfolio = portfolio
+        self.currency = currency
+
+    def __getitem__(self, column):
+        try:
+            return float(self.portfolio.holdings[self.portfolio.columns_indexes[column],
+                                                 self.portfolio.currencies_indexes[self.currency]])
+        except KeyError:
+            raise KeyError(column)
+
+    def __setitem__(self, column, quantity):
+        if column not in self.portfolio.columns_indexes:
+            raise KeyError(column)
+        self.portfolio._set_currency_column(self.currency, column, quantity)
+
+    def __delitem__(self, column):
+        raise TypeError(f"{column} column can't be removed from portfolio")
+
+    def __iter__(self):
+        return iter(self.portfolio.PORTFOLIO_COLUMNS)
+
+    def __len__(self):
+        return len(self.portfolio.PORTFOLIO_COLUMNS)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def copy(self):
+        """
+        :return: a {column: quantity} dict of the current holdings of the currency
+        """
+        return dict(self.items())
@@ -20,6 +20,7 @@
 In simulation it will also define rules to be filled / canceled
 It is also use to store creation & fill values of the order """
 from octobot_trading.data.portfolio cimport Portfolio
+from octobot_trading.data.portfolio_valuator cimport PortfolioValuator
 from octobot_trading.data_manager.portfolio_manager cimport PortfolioManager
 from octobot_trading.exchanges.exchange_manager cimport ExchangeManager
 from octobot_trading.traders.trader cimport Trader
@@ -38,20 +39,32 @@ cdef class PortfolioProfitabilty:
     cdef public double market_profitability_percent
     cdef public double portfolio_origin_value
     cdef public double portfolio_current_value
+    cdef public double origin_portfolio_current_value
     cdef public double initial_portfolio_current_profitability
     cdef public set initializing_symbol_prices
 
     cdef public dict currencies_last_prices
     cdef public dict origin_crypto_currencies_values
     cdef public dict current_crypto_currencies_values
+    cdef public dict portfolio_current_values
+    cdef public dict origin_portfolio_current_values
+    cdef public dict market_profitabilities
+
+    cdef public double market_profitabilities_sum
 
     cdef public Portfolio origin_portfolio
+    cdef public PortfolioValuator portfolio_valuator
 
     cdef set traded_currencies_without_market_specific
 
     cdef public str reference_market
 
-    cdef dict _only_symbol_currency_filter(self, dict currency_dict)
+    cdef bint _update_profitability_values(self, double previous_profitability_percent)
+    cdef double _get_average_market_profitability(self)
+    cdef bint _is_traded_currency(self, str currency)
+    cdef void _fill_origin_crypto_currencies_values(self)
+    cdef PortfolioValuator _get_portfolio_valuator(self)
+    cdef void _update_currency_value(self, str currency, double value)
+    cdef void _update_currency_contributions(self, str currency)
     cdef void _init_traded_currencies_without_market_specific(self)
     cdef void _inform_no_matching_symbol(self, str currency, bint force=*)
-
@@ -13,13 +13,18 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from math import isnan
+
+import numpy as np
+
 from octobot_commons.constants import PORTFOLIO_TOTAL, CONFIG_CRYPTO_CURRENCIES
 from octobot_commons.logging.logging_util import get_logger
-from octobot_commons.symbol_util import split_symbol, merge_currencies
+from octobot_commons.symbol_util import split_symbol
 
 from octobot_trading.constants import TICKER_CHANNEL
 from octobot_trading.channels.exchange_channel import get_chan
 from octobot_trading.constants import CONFIG_PORTFOLIO_TOTAL
+from octobot_trading.data.portfolio_valuator import PortfolioValuator
 from octobot_trading.enums import ExchangeConstantsTickersColumns
 from octobot_trading.exchanges.exchange_simulator import ExchangeSimulator
 from octobot_trading.util import get_reference_market
@@ -28,7 +33,9 @@ from octobot_trading.util import get_reference_market
 class PortfolioProfitabilty:
     """
     PortfolioProfitabilty calculates the portfolio profitability
-    by subtracting portfolio_current_value and portfolio_origin_value
+    by subtracting portfolio_current_value and portfolio_origin_value.
+    Portfolio values are stored as per currency contributions: a ticker update only
+    re-evaluates the contributions of the currency it prices.
     """
 
     def __init__(self, config, trader, portfolio_manager, exchange_manager):
@@ -48,11 +55,21 @@ class PortfolioProfitabilty:
 
         self.portfolio_origin_value = 0
         self.portfolio_current_value = 0
+        self.origin_portfolio_current_value = 0
 
         self.currencies_last_prices = {}
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
         self.origin_portfolio = None
+        self.portfolio_valuator = None
+
+        # value of each currency holdings in the current portfolio and in the origin portfolio (at current prices)
+        self.portfolio_current_values = {}
+        self.origin_portfolio_current_values = {}
+
+        # current value / origin value of each traded currency, used to compute market average profitability
+        self.market_profitabilities = {}
+        self.market_profitabilities_sum = 0
 
         # buffer of currencies excluding market only used currencies ex: conf = btc/usd, eth/btc, ltc/btc, here usd
         # is market only => not used to compute market average profitability
@@ -61,75 +78,80 @@ class PortfolioProfitabilty:
         self.reference_market = get_reference_market(self.config)
 
     async def handle_ticker_update(self, symbol, ticker):
-        force_recompute_origin_portfolio = False
+        last_price = ticker[ExchangeConstantsTickersColumns.LAST.value]
+        self.currencies_last_prices[symbol] = last_price
+        portfolio_valuator = self._get_portfolio_valuator()
+        portfolio_valuator.set_price(symbol, last_price)
+        if not self.origin_portfolio:
+            return await self._update_profitability()
+        previous_profitability_percent = self.profitability_percent
         try:
-            # will fail if symbol doesn't have a price in self.origin_crypto_currencies_values and therefore
-            # requires the origin portfolio value to be recomputed using this price info in case this price is relevant
-            self.origin_crypto_currencies_values[symbol]
-        except KeyError:
-            force_recompute_origin_portfolio = True
-            self.origin_crypto_currencies_values[symbol] = ticker[ExchangeConstantsTickersColumns.LAST.value]
-        self.currencies_last_prices[symbol] = ticker[ExchangeConstantsTickersColumns.LAST.value]
-        return await self._update_profitability(force_recompute_origin_portfolio)
+            for currency in portfolio_valuator.get_symbol_currencies(symbol):
+                currency_value = portfolio_valuator.get_currency_value(currency)
+                if not isnan(currency_value):
+                    self._update_currency_value(currency, currency_value)
+                    if currency_value > 0:
+                        self.initializing_symbol_prices.discard(currency)
+            return self._update_profitability_values(previous_profitability_percent)
+        except KeyError as e:
+            self.logger.warning(f"Missing {e} ticker data to calculate profitability")
+        except Exception as e:
+            self.logger.exception(e, True, str(e))
 
     async def handle_balance_update(self, balance):
         return await self._update_profitability()
 
     """ Get profitability calls get_currencies_prices to update required data
-    Then calls get_portfolio_current_value to set the current value of portfolio_current_value attribute
+    Then calls update_portfolio_and_currencies_current_value to re-evaluate every portfolio currency contribution
     Returns True if changed else False
     """
 
-    async def _update_profitability(self, force_recompute_origin_portfolio=False):
-        self.profitability_diff = self.profitability_percent
+    async def _update_profitability(self):
+        previous_profitability_percent = self.profitability_percent
         self.profitability = 0
         self.profitability_percent = 0
         self.market_profitability_percent = 0
         self.initial_portfolio_current_profitability = 0
 
         try:
-            await self.update_portfolio_and_currencies_current_value()
-
             if not self.origin_portfolio:
                 await self._init_origin_portfolio_and_currencies_value()
-            if force_recompute_origin_portfolio:
-                await self._recompute_origin_portfolio_initial_value()
+            await self.update_portfolio_and_currencies_current_value()
+            return self._update_profitability_values(previous_profitability_percent)
+        except KeyError as e:
+            self.logger.warning(f"Missing {e} ticker data to calculate profitability")
+        except Exception as e:
+            self.logger.exception(e, True, str(e))
 
-            initial_portfolio_current_value = await self._get_origin_portfolio_current_value()
+    def _update_profitability_values(self, previous_profitability_percent):
+        self.profitability = self.portfolio_current_value - self.portfolio_origin_value
 
-            self.profitability = self.portfolio_current_value - self.portfolio_origin_value
+        if self.portfolio_origin_value > 0:
+            self.profitability_percent = (100 * self.portfolio_current_value / self.portfolio_origin_value) - 100
+            self.initial_portfolio_current_profitability = \
+                (100 * self.origin_portfolio_current_value / self.portfolio_origin_value) - 100
+        else:
+            self.profitability_percent = 0
+            self.initial_portfolio_current_profitability = 0
 
-            if self.portfolio_origin_value > 0:
-                self.profitability_percent = (100 * self.portfolio_current_value / self.portfolio_origin_value) - 100
-                self.initial_portfolio_current_profitability = \
-                    (100 * initial_portfolio_current_value / self.portfolio_origin_value) - 100
-            else:
-                self.profitability_percent = 0
+        # calculate difference with the last current portfolio
+        self.profitability_diff = self.profitability_percent - previous_profitability_percent
 
-            # calculate difference with the last current portfolio
-            self.profitability_diff = self.profitability_percent - self.profitability_diff
+        self.market_profitability_percent = self._get_average_market_profitability()
 
-            self.market_profitability_percent = await self.get_average_market_profitability()
-
-            return self.profitability_diff != 0
-        except KeyError as e:
-            self.logger.warning(f"Missing ticker data to calculate profitability")
-            self.logger.warning(f"Missing {e} ticker data to calculate profitability")
-        except Exception as e:
-            self.logger.exception(e, True, str(e))
+        return self.profitability_diff != 0
 
     """ Returns the % move average of all the watched cryptocurrencies between bot's start time and now
     """
 
     async def get_average_market_profitability(self):
         await self.get_current_crypto_currencies_values()
+        return self._get_average_market_profitability()
 
-        origin_values = [value / self.origin_crypto_currencies_values[currency]
-                         for currency, value
-                         in self._only_symbol_currency_filter(self.current_crypto_currencies_values).items()
-                         if self.origin_crypto_currencies_values[currency] > 0]
-
-        return sum(origin_values) / len(origin_values) * 100 - 100 if origin_values else 0
+    def _get_average_market_profitability(self):
+        if not self.market_profitabilities:
+            return 0
+        return self.market_profitabilities_sum / len(self.market_profitabilities) * 100 - 100
 
     async def get_current_crypto_currencies_values(self):
         if not self.current_crypto_currencies_values:
@@ -142,11 +164,10 @@ class PortfolioProfitabilty:
         return {currency: await self._get_currency_value(self.portfolio_manager.portfolio.portfolio, currency, holdings)
                 for currency in holdings.keys()}
 
-    def _only_symbol_currency_filter(self, currency_dict):
+    def _is_traded_currency(self, currency):
         if not self.traded_currencies_without_market_specific:
             self._init_traded_currencies_without_market_specific()
-        return {currency: v for currency, v in currency_dict.items()
-                if currency in self.traded_currencies_without_market_specific}
+        return currency in self.traded_currencies_without_market_specific
 
     def _init_traded_currencies_without_market_specific(self):
         for cryptocurrency in self.config[CONFIG_CRYPTO_CURRENCIES]:
@@ -156,39 +177,92 @@ class PortfolioProfitabilty:
                     self.traded_currencies_without_market_specific.add(symbol)
 
     async def update_portfolio_and_currencies_current_value(self):
-        self.portfolio_current_value = await self.update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+        """
+        Re-evaluates every configured and held currency and rebuilds the portfolio values from scratch
+        """
+        portfolio = self.portfolio_manager.portfolio
+        portfolios_currencies = [portfolio.currencies]
+        if self.origin_portfolio:
+            portfolios_currencies.append(self.origin_portfolio.currencies)
+        self.current_crypto_currencies_values = \
+            await self._evaluate_config_crypto_currencies_and_portfolio_values(*portfolios_currencies)
+        portfolio_valuator = self._get_portfolio_valuator()
+        currencies = list(self.current_crypto_currencies_values)
+        currencies_indexes = portfolio_valuator.add_currencies(currencies)
+        values = np.fromiter(self.current_crypto_currencies_values.values(), dtype=np.float64, count=len(currencies))
+
+        current_values = portfolio_valuator.get_portfolio_holdings(portfolio)[currencies_indexes] * values
+        self.portfolio_current_value = float(current_values.sum())
+        self.portfolio_current_values = dict(zip(currencies, current_values.tolist()))
+        self.origin_portfolio_current_value = 0
+        self.origin_portfolio_current_values = {}
+        if self.origin_portfolio:
+            self._fill_origin_crypto_currencies_values()
+            origin_holdings = portfolio_valuator.get_portfolio_holdings(self.origin_portfolio)
+            origin_current_values = origin_holdings[currencies_indexes] * values
+            self.origin_portfolio_current_value = float(origin_current_values.sum())
+            self.origin_portfolio_current_values = dict(zip(currencies, origin_current_values.tolist()))
+            origin_currencies_indexes = portfolio_valuator.add_currencies(list(self.origin_crypto_currencies_values))
+            origin_values = np.fromiter(self.origin_crypto_currencies_values.values(), dtype=np.float64,
+                                        count=len(self.origin_crypto_currencies_values))
+            self.portfolio_origin_value = float(np.dot(origin_holdings[origin_currencies_indexes], origin_values))
+
+        self.market_profitabilities = {
+            currency: value / self.origin_crypto_currencies_values[currency]
+            for currency, value in self.current_crypto_currencies_values.items()
+            if self.origin_crypto_currencies_values.get(currency, 0) > 0 and self._is_traded_currency(currency)
+        }
+        self.market_profitabilities_sum = sum(self.market_profitabilities.values())
 
     async def _init_origin_portfolio_and_currencies_value(self):
         self.origin_portfolio = await self.portfolio_manager.portfolio.copy()
         self.origin_crypto_currencies_values = \
-            await self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio)
-        await self._recompute_origin_portfolio_initial_value()
-
-    async def _recompute_origin_portfolio_initial_value(self):
-        self.portfolio_origin_value = \
-            await self.update_portfolio_current_value(self.origin_portfolio.portfolio,
-                                                      currencies_values=self.origin_crypto_currencies_values,
-                                                      fill_currencies_values=True)
-
-    async def _get_origin_portfolio_current_value(self, refresh_values=False):
-        if refresh_values:
-            self.current_crypto_currencies_values = \
-                await self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio)
-        return await self.update_portfolio_current_value(self.origin_portfolio.portfolio,
-                                                         currencies_values=self.current_crypto_currencies_values)
-
-    async def update_portfolio_current_value(self, portfolio, currencies_values=None, fill_currencies_values=False):
-        values = currencies_values
-        if values is None or fill_currencies_values:
-            self.current_crypto_currencies_values = \
-                await self._evaluate_config_crypto_currencies_and_portfolio_values(portfolio)
-            if fill_currencies_values:
-                for currency, value in self.current_crypto_currencies_values.items():
-                    if currency not in currencies_values:
-                        currencies_values[currency] = value
-            values = self.current_crypto_currencies_values
-        return await self._evaluate_portfolio_value(portfolio, values)
+            await self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.currencies)
+
+    def _fill_origin_crypto_currencies_values(self):
+        # currencies that could not be evaluated when the origin portfolio was created use their first known value
+        for currency, value in self.current_crypto_currencies_values.items():
+            if currency not in self.origin_crypto_currencies_values:
+                self.origin_crypto_currencies_values[currency] = value
+
+    def _get_portfolio_valuator(self):
+        currency_conversion_graph = self.exchange_manager.get_currency_conversion_graph()
+        # conversion routes are recomputed when markets are reloaded
+        if self.portfolio_valuator is None \
+                or self.portfolio_valuator.currency_conversion_graph is not currency_conversion_graph:
+            self.portfolio_valuator = PortfolioValuator(self.reference_market, currency_conversion_graph)
+            for symbol, price in self.currencies_last_prices.items():
+                self.portfolio_valuator.set_price(symbol, price)
+        return self.portfolio_valuator
+
+    def _update_currency_value(self, currency, value):
+        self.current_crypto_currencies_values[currency] = value
+        if currency not in self.origin_crypto_currencies_values:
+            # first known value of this currency: it is its origin value
+            self.origin_crypto_currencies_values[currency] = value
+            self.portfolio_origin_value += value * self.origin_portfolio.get_currency_portfolio(currency,
+                                                                                                PORTFOLIO_TOTAL)
+        self._update_currency_contributions(currency)
+
+    def _update_currency_contributions(self, currency):
+        value = self.current_crypto_currencies_values[currency]
+
+        current_value = value * self.portfolio_manager.portfolio.get_currency_portfolio(currency, PORTFOLIO_TOTAL)
+        self.portfolio_current_value += current_value - self.portfolio_current_values.get(currency, 0)
+        self.portfolio_current_values[currency] = current_value
+
+        if self.origin_portfolio:
+            origin_current_value = value * self.origin_portfolio.get_currency_portfolio(currency, PORTFOLIO_TOTAL)
+            self.origin_portfolio_current_value += \
+                origin_current_value - self.origin_portfolio_current_values.get(currency, 0)
+            self.origin_portfolio_current_values[currency] = origin_current_value
+
+        origin_value = self.origin_crypto_currencies_values.get(currency, 0)
+        if origin_value > 0 and self._is_traded_currency(currency):
+            market_profitability = value / origin_value
+            self.market_profitabilities_sum += \
+                market_profitability - self.market_profitabilities.get(currency, 0)
+            self.market_profitabilities[currency] = market_profitability
 
     """ try_get_value_of_currency will try to obtain the current value of the currency quantity
     in the reference currency.
@@ -197,32 +271,19 @@ class PortfolioProfitabilty:
     """
 
     async def _try_get_value_of_currency(self, currency, quantity, raise_error):
-        symbol = merge_currencies(currency, self.reference_market)
-        symbol_inverted = merge_currencies(self.reference_market, currency)
-
-        try:
-            if self.exchange_manager.symbol_exists(symbol):
-                return self.currencies_last_prices[symbol] * quantity
-
-            elif self.exchange_manager.symbol_exists(symbol_inverted) and \
-                    self.currencies_last_prices[symbol_inverted] != 0:
-                return quantity / self.currencies_last_prices[symbol_inverted]
-
+        portfolio_valuator = self._get_portfolio_valuator()
+        currency_value = portfolio_valuator.get_currency_value(currency)
+        if not isnan(currency_value):
+            return currency_value * quantity
+        if not portfolio_valuator.has_route(currency):
             self._inform_no_matching_symbol(currency)
             return 0
-        except KeyError as e:
-            symbols_to_add = []
-            if self.exchange_manager.symbol_exists(symbol):
-                symbols_to_add = [symbol]
-            elif self.exchange_manager.symbol_exists(symbol_inverted):
-                symbols_to_add = [symbol_inverted]
-
-            if symbols_to_add:
-                await get_chan(TICKER_CHANNEL, self.exchange_manager.id).modify(added_pairs=symbols_to_add)
-                self.initializing_symbol_prices.add(currency)
-            if raise_error:
-                raise e
-            return 0
+        symbols_to_add = portfolio_valuator.get_missing_price_symbols(currency)
+        await get_chan(TICKER_CHANNEL, self.exchange_manager.id).modify(added_pairs=symbols_to_add)
+        self.initializing_symbol_prices.add(currency)
+        if raise_error:
+            raise KeyError(symbols_to_add[0])
+        return 0
 
     def _inform_no_matching_symbol(self, currency, force=False):
         if not isinstance(self.exchange_manager.exchange, ExchangeSimulator):
@@ -231,48 +292,39 @@ class PortfolioProfitabilty:
         else:
             self.logger.debug(f"Can't find matching symbol for {currency} and {self.reference_market}")
 
-    async def _evaluate_config_crypto_currencies_and_portfolio_values(self, portfolio):
-        values_dict = {}
-        evaluated_currencies = set()
-        missing_tickers = set()
-        # evaluate config currencies
+    async def _evaluate_config_crypto_currencies_and_portfolio_values(self, *portfolios_currencies):
+        currencies = []
+        # config currencies
         for cryptocurrency in self.config[CONFIG_CRYPTO_CURRENCIES]:
             pairs = self.exchange_manager.exchange_config.get_traded_pairs(cryptocurrency)
             if pairs:
-                currency, market = split_symbol(pairs[0])
-                currency_to_evaluate = currency
+                currencies += split_symbol(pairs[0])
+        # portfolios currencies
+        for portfolio_currencies in portfolios_currencies:
+            currencies += portfolio_currencies
+        portfolio_valuator = self._get_portfolio_valuator()
+        currencies_indexes = portfolio_valuator.add_currencies(currencies)
+        currencies_values = portfolio_valuator.get_currencies_values()[currencies_indexes].tolist()
+
+        values_dict = {}
+        missing_tickers = set()
+        for currency, value in zip(currencies, currencies_values):
+            if currency in values_dict or currency in missing_tickers:
+                continue
+            if isnan(value):
+                # either no route (valued 0) or missing prices: request them
                 try:
-                    if currency not in evaluated_currencies:
-                        values_dict[currency] = await self.evaluate_value(currency, 1)
-                        evaluated_currencies.add(currency)
-                    if market not in evaluated_currencies:
-                        currency_to_evaluate = market
-                        values_dict[market] = await self.evaluate_value(market, 1)
-                        evaluated_currencies.add(market)
+                    value = await self.evaluate_value(currency, 1)
                 except KeyError:
-                    missing_tickers.add(currency_to_evaluate)
-        # evaluate portfolio currencies
-        for currency in portfolio:
-            try:
-                if currency not in evaluated_currencies:
-                    values_dict[currency] = await self.evaluate_value(currency, 1)
-                    evaluated_currencies.add(currency)
-            except KeyError:
-                missing_tickers.add(currency)
+                    missing_tickers.add(currency)
+                    continue
+            elif value > 0:
+                self.initializing_symbol_prices.discard(currency)
+            values_dict[currency] = value
         if missing_tickers:
             self.logger.warning(f"Missing price data for {missing_tickers}, impossible to evaluate currencies value")
         return values_dict
 
-    """ evaluate_portfolio_value performs evaluate_value with a portfolio configuration
-    Returns the calculated quantity value in reference (attribute) currency
-    """
-
-    async def _evaluate_portfolio_value(self, portfolio, currencies_values=None):
-        return sum([
-            await self._get_currency_value(portfolio, currency, currencies_values)
-            for currency in portfolio
-        ])
-
     async def _get_currency_value(self, portfolio, currency, currencies_values=None, raise_error=False):
         if currency in portfolio and portfolio[currency][CONFIG_PORTFOLIO_TOTAL] != 0:
             if currencies_values and currency in currencies_values:
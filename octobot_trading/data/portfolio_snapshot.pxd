@@ -0,0 +1,32 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cimport numpy as np
+np.import_array()
+
+cdef class PortfolioSnapshot:
+    cdef public tuple columns
+    cdef public list currencies
+    cdef public dict currencies_indexes
+    cdef public np.ndarray holdings
+    cdef public int currencies_count
+    cdef public long long version
+    cdef dict portfolio_dict
+
+    cpdef double get_currency_portfolio(self, str currency, str portfolio_type=*)
+    cpdef dict get_changed_currencies(self, list currencies, dict currencies_indexes, np.ndarray holdings)
+    cdef dict _get_currencies_portfolios(self, object currencies_indexes, list currencies, np.ndarray holdings)
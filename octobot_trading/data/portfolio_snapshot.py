@@ -0,0 +1,98 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.constants import PORTFOLIO_AVAILABLE
+
+
+class PortfolioSnapshot:
+    """
+    Read-only view of a portfolio at a given version.
+    Taking a snapshot does not copy the portfolio: the portfolio copies its holdings array on its first update
+    after a snapshot and its currencies before adding a new one. As currencies slots are append only,
+    a snapshot can be compared with the live portfolio column by column.
+    """
+
+    def __init__(self, columns, currencies, currencies_indexes, holdings, version):
+        # must not be modified: shared with the live portfolio
+        self.columns = columns
+        self.currencies = currencies
+        self.currencies_indexes = currencies_indexes
+        self.holdings = holdings
+        self.currencies_count = len(currencies)
+        self.version = version
+        self.portfolio_dict = None
+
+    @property
+    def portfolio(self):
+        """
+        :return: a {currency: {column: quantity}} dict of the snapshot
+        """
+        if self.portfolio_dict is None:
+            self.portfolio_dict = self._get_currencies_portfolios(range(self.currencies_count),
+                                                                  self.currencies, self.holdings)
+        return self.portfolio_dict
+
+    def get_currency_portfolio(self, currency, portfolio_type=PORTFOLIO_AVAILABLE):
+        try:
+            currency_index = self.currencies_indexes[currency]
+            if currency_index < self.currencies_count:
+                return float(self.holdings[self.columns.index(portfolio_type), currency_index])
+        except (KeyError, ValueError):
+            pass
+        return 0
+
+    def get_changed_currencies(self, currencies, currencies_indexes, holdings):
+        """
+        :param currencies: the currencies of the portfolio to compare with
+        :param currencies_indexes: the currencies slots of the portfolio to compare with
+        :param holdings: the holdings of the portfolio to compare with
+        :return: the {currency: (snapshot currency portfolio, portfolio currency portfolio)} of the currencies which
+        holdings differ, None is used for missing currencies
+        """
+        currencies_count = len(currencies)
+        if currencies[:self.currencies_count] == self.currencies[:self.currencies_count]:
+            # same slots: compare whole columns
+            snapshot_indexes = np.arange(self.currencies_count)
+        else:
+            # the portfolio has been replaced since the snapshot
+            snapshot_indexes = np.array([currencies_indexes.get(currency, -1)
+                                         for currency in self.currencies[:self.currencies_count]], dtype=np.int64)
+        removed_currencies = snapshot_indexes == -1
+        kept_snapshot_indexes = np.flatnonzero(~removed_currencies)
+        kept_indexes = snapshot_indexes[kept_snapshot_indexes]
+        changed = np.any(holdings[:, kept_indexes] != self.holdings[:, kept_snapshot_indexes], axis=0)
+
+        changed_currencies = {}
+        snapshot_portfolios = self._get_currencies_portfolios(kept_snapshot_indexes[changed],
+                                                              self.currencies, self.holdings)
+        portfolios = self._get_currencies_portfolios(kept_indexes[changed], currencies, holdings)
+        for currency, snapshot_currency_portfolio in snapshot_portfolios.items():
+            changed_currencies[currency] = (snapshot_currency_portfolio, portfolios[currency])
+        for currency, snapshot_currency_portfolio in self._get_currencies_portfolios(
+                np.flatnonzero(removed_currencies), self.currencies, self.holdings).items():
+            changed_currencies[currency] = (snapshot_currency_portfolio, None)
+        added_indexes = np.setdiff1d(np.arange(currencies_count), kept_indexes, assume_unique=True)
+        for currency, currency_portfolio in self._get_currencies_portfolios(added_indexes, currencies,
+                                                                            holdings).items():
+            changed_currencies[currency] = (None, currency_portfolio)
+        return changed_currencies
+
+    def _get_currencies_portfolios(self, currencies_indexes, currencies, holdings):
+        currencies_indexes = np.asarray(currencies_indexes, dtype=np.int64)
+        return {currencies[currency_index]: dict(zip(self.columns, currency_holdings))
+                for currency_index, currency_holdings in zip(currencies_indexes.tolist(),
+                                                             holdings[:, currencies_indexes].T.tolist())}
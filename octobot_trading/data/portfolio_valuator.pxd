@@ -0,0 +1,55 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cimport numpy as np
+np.import_array()
+
+from octobot_trading.data.currency_conversion_graph cimport CurrencyConversionGraph
+
+cdef class PortfolioValuator:
+    cdef public str reference_market
+    cdef public CurrencyConversionGraph currency_conversion_graph
+
+    cdef public list symbols
+    cdef public dict symbols_indexes
+    cdef public np.ndarray prices
+
+    cdef public list currencies
+    cdef public dict currencies_indexes
+    cdef public dict symbols_currencies
+    cdef public np.ndarray routes_indexes
+    cdef public np.ndarray routes_inverted
+
+    cdef public list portfolio_currencies
+    cdef public np.ndarray portfolio_currencies_indexes
+
+    cpdef bint set_price(self, str symbol, double price)
+    cpdef int add_currency(self, str currency)
+    cpdef np.ndarray add_currencies(self, object currencies)
+    cpdef bint has_route(self, str currency)
+    cpdef list get_symbol_currencies(self, str symbol)
+    cpdef list get_missing_price_symbols(self, str currency)
+    cpdef double get_currency_value(self, str currency)
+    cpdef np.ndarray get_currencies_values(self)
+    cpdef np.ndarray get_holdings(self, dict portfolio)
+    cpdef np.ndarray get_portfolio_holdings(self, object portfolio, str portfolio_type=*)
+    cpdef double evaluate_portfolio_value(self, dict portfolio)
+
+    cdef np.ndarray _get_portfolio_currencies_indexes(self, list currencies)
+
+    cdef list _add_currencies(self, list currencies)
+    cdef void _extend_routes(self, int hops_count)
@@ -0,0 +1,212 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.constants import PORTFOLIO_TOTAL
+
+from octobot_trading.constants import CONFIG_PORTFOLIO_TOTAL
+
+
+class PortfolioValuator:
+    """
+    Values currencies in the reference market from the last price of exchange symbols.
+    Each currency gets an array slot and a conversion route from the currency conversion graph: the symbols
+    converting it into the reference market, possibly through intermediate currencies.
+    Currencies values are computed as a vector and a portfolio value is the dot product of its holdings and this vector.
+    """
+    # prices slots of the empty route hop and of the hop of currencies without any route
+    IDENTITY_PRICE_INDEX = 0
+    NO_PRICE_INDEX = 1
+
+    def __init__(self, reference_market, currency_conversion_graph):
+        self.reference_market = reference_market
+        self.currency_conversion_graph = currency_conversion_graph
+
+        self.symbols = []
+        self.symbols_indexes = {}
+        for symbol in currency_conversion_graph.symbols:
+            if symbol not in self.symbols_indexes:
+                # prices slots start after the identity and no price slots
+                self.symbols_indexes[symbol] = len(self.symbols) + 2
+                self.symbols.append(symbol)
+        self.prices = np.full(len(self.symbols) + 2, np.nan, dtype=np.float64)
+        self.prices[self.IDENTITY_PRICE_INDEX] = 1
+
+        self.currencies = []
+        self.currencies_indexes = {}
+        # {symbol price index: currencies which route goes through this symbol}
+        self.symbols_currencies = {}
+        # route hops as (longest route hops count, currencies count) price indexes and inversion flags,
+        # shorter routes are completed with identity hops
+        self.routes_indexes = np.empty((1, 0), dtype=np.int64)
+        self.routes_inverted = np.empty((1, 0), dtype=bool)
+
+        # slots of the currencies of the last valued Portfolio: its currencies are append only
+        self.portfolio_currencies = None
+        self.portfolio_currencies_indexes = np.empty(0, dtype=np.int64)
+
+    def set_price(self, symbol, price):
+        """
+        :return: False when symbol is not a known symbol
+        """
+        try:
+            self.prices[self.symbols_indexes[symbol]] = price
+            return True
+        except KeyError:
+            return False
+
+    def add_currency(self, currency):
+        """
+        Registers currency and computes its conversion route if it is not already registered
+        :return: the currency slot
+        """
+        try:
+            return self.currencies_indexes[currency]
+        except KeyError:
+            return self._add_currencies([currency])[0]
+
+    def add_currencies(self, currencies):
+        """
+        :return: the slots of currencies
+        """
+        new_currencies = [currency
+                          for currency in dict.fromkeys(currencies)
+                          if currency not in self.currencies_indexes]
+        if new_currencies:
+            self._add_currencies(new_currencies)
+        return np.array([self.currencies_indexes[currency] for currency in currencies], dtype=np.int64)
+
+    def has_route(self, currency):
+        currency_index = self.add_currency(currency)
+        return self.routes_indexes[0, currency_index] != self.NO_PRICE_INDEX
+
+    def get_symbol_currencies(self, symbol):
+        """
+        :return: the currencies which value depends on symbol price
+        """
+        try:
+            return self.symbols_currencies.get(self.symbols_indexes[symbol], [])
+        except KeyError:
+            return []
+
+    def get_missing_price_symbols(self, currency):
+        """
+        :return: the symbols of the currency route which price is unknown
+        """
+        currency_index = self.add_currency(currency)
+        return [self.symbols[price_index - 2]
+                for price_index in self.routes_indexes[:, currency_index]
+                if price_index > self.NO_PRICE_INDEX and np.isnan(self.prices[price_index])]
+
+    def get_currency_value(self, currency):
+        """
+        :return: the value of one currency unit in reference market, nan when a route price is missing
+        or when there is no route
+        """
+        currency_index = self.add_currency(currency)
+        value = 1.0
+        for hop in range(self.routes_indexes.shape[0]):
+            price = float(self.prices[self.routes_indexes[hop, currency_index]])
+            if self.routes_inverted[hop, currency_index]:
+                if price == 0:
+                    return 0
+                value /= price
+            else:
+                value *= price
+        return value
+
+    def get_currencies_values(self):
+        """
+        :return: the value of one unit of each registered currency in reference market by currency slot,
+        nan when a route price is missing or when there is no route
+        """
+        hops_prices = self.prices[self.routes_indexes]
+        with np.errstate(divide="ignore"):
+            hops_prices = np.where(self.routes_inverted, 1 / hops_prices, hops_prices)
+        values = hops_prices.prod(axis=0)
+        # an inverted price of 0 has no meaningful value
+        values[np.isinf(values)] = 0
+        return values
+
+    def get_holdings(self, portfolio):
+        """
+        :param portfolio: a {currency: {CONFIG_PORTFOLIO_TOTAL: holdings}} portfolio dict
+        :return: the total holdings of each registered currency by currency slot
+        """
+        currencies_indexes = self.add_currencies(portfolio.keys())
+        holdings = np.zeros(len(self.currencies), dtype=np.float64)
+        holdings[currencies_indexes] = [amounts[CONFIG_PORTFOLIO_TOTAL] for amounts in portfolio.values()]
+        return holdings
+
+    def get_portfolio_holdings(self, portfolio, portfolio_type=PORTFOLIO_TOTAL):
+        """
+        :param portfolio: a Portfolio
+        :return: the portfolio_type holdings of each registered currency by currency slot
+        """
+        currencies_indexes = self._get_portfolio_currencies_indexes(portfolio.currencies)
+        holdings = np.zeros(len(self.currencies), dtype=np.float64)
+        holdings[currencies_indexes] = portfolio.get_holdings(portfolio_type)
+        return holdings
+
+    def evaluate_portfolio_value(self, portfolio):
+        """
+        :return: the portfolio value in reference market, currencies that can't be valued are ignored
+        """
+        holdings = self.get_holdings(portfolio)
+        return float(np.dot(holdings, np.nan_to_num(self.get_currencies_values(), nan=0)))
+
+    def _get_portfolio_currencies_indexes(self, currencies):
+        if currencies is not self.portfolio_currencies:
+            self.portfolio_currencies = currencies
+            self.portfolio_currencies_indexes = np.empty(0, dtype=np.int64)
+        if len(self.portfolio_currencies_indexes) < len(currencies):
+            self.portfolio_currencies_indexes = np.concatenate(
+                (self.portfolio_currencies_indexes, self.add_currencies(currencies[len(self.portfolio_currencies_indexes):])))
+        return self.portfolio_currencies_indexes[:len(currencies)]
+
+    def _add_currencies(self, currencies):
+        first_index = len(self.currencies)
+        routes = []
+        for offset, currency in enumerate(currencies):
+            self.currencies_indexes[currency] = first_index + offset
+            self.currencies.append(currency)
+            routes.append(self.currency_conversion_graph.get_conversion_path(currency, self.reference_market))
+        hops_count = max([self.routes_indexes.shape[0]] + [len(route) for route in routes if route is not None])
+        if hops_count > self.routes_indexes.shape[0]:
+            self._extend_routes(hops_count)
+        routes_indexes = np.full((hops_count, len(currencies)), self.IDENTITY_PRICE_INDEX, dtype=np.int64)
+        routes_inverted = np.zeros((hops_count, len(currencies)), dtype=bool)
+        for offset, route in enumerate(routes):
+            if route is None:
+                routes_indexes[0, offset] = self.NO_PRICE_INDEX
+                continue
+            for hop, (symbol, inverted) in enumerate(route):
+                price_index = self.symbols_indexes[symbol]
+                routes_indexes[hop, offset] = price_index
+                routes_inverted[hop, offset] = inverted
+                self.symbols_currencies.setdefault(price_index, []).append(currencies[offset])
+        self.routes_indexes = np.concatenate((self.routes_indexes, routes_indexes), axis=1)
+        self.routes_inverted = np.concatenate((self.routes_inverted, routes_inverted), axis=1)
+        return list(range(first_index, first_index + len(currencies)))
+
+    def _extend_routes(self, hops_count):
+        added_hops_count = hops_count - self.routes_indexes.shape[0]
+        currencies_count = self.routes_indexes.shape[1]
+        self.routes_indexes = np.concatenate(
+            (self.routes_indexes,
+             np.full((added_hops_count, currencies_count), self.IDENTITY_PRICE_INDEX, dtype=np.int64)))
+        self.routes_inverted = np.concatenate(
+            (self.routes_inverted, np.zeros((added_hops_count, currencies_count), dtype=bool)))
@@ -26,6 +26,7 @@ from octobot_trading.util.initializable cimport Initializable
 cdef class Position(Initializable):
     cdef Trader trader
     cdef ExchangeManager exchange_manager
+    cdef object _lock # Lock
 
     cdef public str symbol
     cdef public str currency
@@ -42,6 +43,7 @@ cdef class Position(Initializable):
     cdef public double liquidation_price
     cdef public double quantity
     cdef public double value
+    cdef public double margin
     cdef public double unrealised_pnl
     cdef public double realised_pnl
 
@@ -14,14 +14,21 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import time
+from asyncio import Lock
 
 from octobot_trading.enums import ExchangeConstantsPositionColumns, PositionStatus, PositionSide
 
 
 class Position:
+    __slots__ = ("trader", "exchange_manager", "_lock", "position_id", "timestamp", "symbol", "currency", "market",
+                 "creation_time", "entry_price", "mark_price", "quantity", "value", "margin", "liquidation_price",
+                 "unrealised_pnl", "realised_pnl", "leverage", "status", "side")
+
     def __init__(self, trader):
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
+        # created on first use
+        self._lock = None
 
         self.position_id = None
         self.timestamp = 0
@@ -40,6 +47,12 @@ class Position:
         self.status = PositionStatus.OPEN
         self.side = PositionSide.UNKNOWN
 
+    @property
+    def lock(self):
+        if self._lock is None:
+            self._lock = Lock()
+        return self._lock
+
     def _should_change(self, original_value, new_value):
         if new_value and original_value != new_value:
             return True
@@ -181,12 +194,16 @@ class Position:
 
 
 class ShortPosition(Position):
+    __slots__ = ()
+
     def _check_for_liquidation(self):
         if self.mark_price >= self.liquidation_price:
             self.status = PositionStatus.LIQUIDATING
 
 
 class LongPosition(Position):
+    __slots__ = ()
+
     def _check_for_liquidation(self):
         if self.mark_price <= self.liquidation_price:
             self.status = PositionStatus.LIQUIDATING
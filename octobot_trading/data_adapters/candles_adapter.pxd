@@ -32,6 +32,3 @@ cpdef np.ndarray get_symbol_volume_candles(ExchangeSymbolData symbol_data, str t
                                            int limit, bint include_in_construction)
 cpdef np.ndarray get_symbol_time_candles(ExchangeSymbolData symbol_data, str time_frame,
                                          int limit, bint include_in_construction)
-
-cdef np.ndarray _add_in_construction_data(np.ndarray candles, ExchangeSymbolData symbol_data,
-                                          object time_frame, int data_type)
\ No newline at end of file
@@ -13,78 +13,29 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import numpy as np
-
-from octobot_commons.data_util import shift_value_array
-from octobot_commons.enums import TimeFrames, PriceIndexes
+from octobot_commons.enums import TimeFrames
 
 
 def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_close_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_CLOSE.value)
-    return symbol_data.symbol_candles[tf].get_symbol_close_candles(limit)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_close_candles(limit, include_in_construction)
 
 
 def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_open_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_OPEN.value)
-    return symbol_data.symbol_candles[tf].get_symbol_open_candles(limit)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_open_candles(limit, include_in_construction)
 
 
 def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_high_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_HIGH.value)
-    return symbol_data.symbol_candles[tf].get_symbol_high_candles(limit)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_high_candles(limit, include_in_construction)
 
 
 def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_low_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_LOW.value)
-    return symbol_data.symbol_candles[tf].get_symbol_low_candles(limit)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_low_candles(limit, include_in_construction)
 
 
 def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_VOL.value)
-    return symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_volume_candles(limit,
+                                                                                        include_in_construction)
 
 
 def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction):
-    tf = TimeFrames(time_frame)
-    if include_in_construction:
-        return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_time_candles(limit),
-            symbol_data,
-            tf,
-            PriceIndexes.IND_PRICE_TIME.value)
-    return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit)
-
-
-def _add_in_construction_data(candles, symbol_data, time_frame, data_type):
-    return np.array(shift_value_array(candles, fill_value=symbol_data.symbol_klines[time_frame].kline[data_type]),
-                    dtype=np.float64)
+    return symbol_data.symbol_candles[TimeFrames(time_frame)].get_symbol_time_candles(limit, include_in_construction)
@@ -0,0 +1,68 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.constants import MINUTE_TO_SECONDS
+from octobot_commons.enums import TimeFrames, TimeFramesMinutes, PriceIndexes
+
+# time frames that are not aligned on timestamps multiples of their duration can't be aggregated
+MAX_AGGREGATED_TIME_FRAME_MINUTES = TimeFramesMinutes[TimeFrames.ONE_DAY]
+
+
+def can_aggregate_time_frame(source_time_frame, time_frame):
+    """
+    :return: True when time_frame candles can be built from source_time_frame candles
+    """
+    return TimeFramesMinutes[time_frame] > TimeFramesMinutes[source_time_frame] \
+        and TimeFramesMinutes[time_frame] % TimeFramesMinutes[source_time_frame] == 0 \
+        and TimeFramesMinutes[time_frame] <= MAX_AGGREGATED_TIME_FRAME_MINUTES
+
+
+def aggregate_candles(candles, source_time_frame, time_frame):
+    """
+    Vectorized resampling of source_time_frame candles into time_frame candles
+    :param candles: time sorted (len(PriceIndexes), n) source_time_frame candles
+    :param source_time_frame: the candles time frame
+    :param time_frame: the time frame to aggregate candles into
+    :return: (len(PriceIndexes), k) time_frame candles of each time_frame period which source_time_frame candles
+    are all in candles, periods with missing source_time_frame candles (incomplete first or last period or gaps)
+    are skipped
+    """
+    times = candles[PriceIndexes.IND_PRICE_TIME.value]
+    if not len(times):
+        return np.empty((len(PriceIndexes), 0), dtype=np.float64)
+    period_duration = TimeFramesMinutes[time_frame] * MINUTE_TO_SECONDS
+    source_period_duration = TimeFramesMinutes[source_time_frame] * MINUTE_TO_SECONDS
+    periods_starts = times - times % period_duration
+    starts_indexes = np.concatenate(([0], np.flatnonzero(np.diff(periods_starts)) + 1))
+    ends_indexes = np.append(starts_indexes[1:], len(times)) - 1
+
+    aggregated_candles = np.empty((len(PriceIndexes), len(starts_indexes)), dtype=np.float64)
+    aggregated_candles[PriceIndexes.IND_PRICE_TIME.value] = periods_starts[starts_indexes]
+    aggregated_candles[PriceIndexes.IND_PRICE_OPEN.value] = \
+        candles[PriceIndexes.IND_PRICE_OPEN.value, starts_indexes]
+    aggregated_candles[PriceIndexes.IND_PRICE_HIGH.value] = \
+        np.maximum.reduceat(candles[PriceIndexes.IND_PRICE_HIGH.value], starts_indexes)
+    aggregated_candles[PriceIndexes.IND_PRICE_LOW.value] = \
+        np.minimum.reduceat(candles[PriceIndexes.IND_PRICE_LOW.value], starts_indexes)
+    aggregated_candles[PriceIndexes.IND_PRICE_CLOSE.value] = \
+        candles[PriceIndexes.IND_PRICE_CLOSE.value, ends_indexes]
+    aggregated_candles[PriceIndexes.IND_PRICE_VOL.value] = \
+        np.add.reduceat(candles[PriceIndexes.IND_PRICE_VOL.value], starts_indexes)
+
+    # a period is completed when it has all its source candles: from the one opening it to the one closing it
+    completed_periods = ends_indexes - starts_indexes + 1 == period_duration // source_period_duration
+    return aggregated_candles[:, completed_periods]
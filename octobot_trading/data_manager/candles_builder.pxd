@@ -0,0 +1,35 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cimport numpy as np
+np.import_array()
+
+cdef class CandlesBuilder:
+    cdef public object time_frame
+    cdef public double period_duration
+    cdef public np.ndarray kline
+    cdef public double incomplete_candle_time
+
+    cpdef bint has_kline(self)
+    cpdef void set_kline(self, object kline)
+    cpdef bint is_complete_candle(self, double candle_time)
+    cpdef np.ndarray add_trades(self, object timestamps, object prices, object amounts)
+
+    cdef void _merge_into_kline(self, np.ndarray candle)
+
+    @staticmethod
+    cdef np.ndarray _get_trades_candles(np.ndarray periods_starts, np.ndarray prices, np.ndarray amounts)
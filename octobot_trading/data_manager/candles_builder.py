@@ -0,0 +1,116 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.constants import MINUTE_TO_SECONDS
+from octobot_commons.enums import TimeFramesMinutes, PriceIndexes
+
+
+class CandlesBuilder:
+    """
+    Incrementally builds time_frame candles from trade ticks.
+    The in construction candle is kept in a fixed (len(PriceIndexes), ) float64 row.
+    """
+
+    def __init__(self, time_frame):
+        self.time_frame = time_frame
+        self.period_duration = TimeFramesMinutes[time_frame] * MINUTE_TO_SECONDS
+        self.kline = np.full(len(PriceIndexes), fill_value=np.nan, dtype=np.float64)
+
+        # time of the candle which first trades have not been received: it can't be built from trades
+        self.incomplete_candle_time = np.nan
+
+    def has_kline(self):
+        return not np.isnan(self.kline[PriceIndexes.IND_PRICE_TIME.value])
+
+    def set_kline(self, kline):
+        """
+        Sets the in construction candle, trades of this candle received before this call are unknown
+        :param kline: a [time, open, high, low, close, volume] candle
+        """
+        self.kline[:] = np.asarray(kline[:len(PriceIndexes)], dtype=np.float64)
+        self.incomplete_candle_time = self.kline[PriceIndexes.IND_PRICE_TIME.value]
+
+    def is_complete_candle(self, candle_time):
+        """
+        :return: True when every trade of the candle starting at candle_time has been received
+        """
+        return candle_time != self.incomplete_candle_time
+
+    def add_trades(self, timestamps, prices, amounts):
+        """
+        Updates the in construction candle with trades
+        :param timestamps: trades timestamps in seconds
+        :param prices: trades prices
+        :param amounts: trades amounts, nan amounts are ignored in volumes
+        :return: the time sorted (len(PriceIndexes), n) candles closed by these trades
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        amounts = np.nan_to_num(np.asarray(amounts, dtype=np.float64))
+        if self.has_kline():
+            # trades of closed candles are ignored
+            kept_trades = timestamps >= self.kline[PriceIndexes.IND_PRICE_TIME.value]
+            timestamps, prices, amounts = timestamps[kept_trades], prices[kept_trades], amounts[kept_trades]
+        if not len(timestamps):
+            return np.empty((len(PriceIndexes), 0), dtype=np.float64)
+
+        ordered_indexes = np.argsort(timestamps, kind="stable")
+        timestamps = timestamps[ordered_indexes]
+        candles = CandlesBuilder._get_trades_candles(timestamps - timestamps % self.period_duration,
+                                                     prices[ordered_indexes],
+                                                     amounts[ordered_indexes])
+
+        first_new_candle_index = 0
+        if self.has_kline() and candles[PriceIndexes.IND_PRICE_TIME.value, 0] == \
+                self.kline[PriceIndexes.IND_PRICE_TIME.value]:
+            self._merge_into_kline(candles[:, 0])
+            first_new_candle_index = 1
+        if first_new_candle_index == candles.shape[1]:
+            return np.empty((len(PriceIndexes), 0), dtype=np.float64)
+
+        if self.has_kline():
+            closed_candles = np.column_stack((self.kline, candles[:, first_new_candle_index:-1]))
+        else:
+            # trades are received from the middle of the first candle
+            self.incomplete_candle_time = candles[PriceIndexes.IND_PRICE_TIME.value, 0]
+            closed_candles = candles[:, :-1]
+        self.kline[:] = candles[:, -1]
+        return closed_candles
+
+    def _merge_into_kline(self, candle):
+        self.kline[PriceIndexes.IND_PRICE_HIGH.value] = np.fmax(self.kline[PriceIndexes.IND_PRICE_HIGH.value],
+                                                               candle[PriceIndexes.IND_PRICE_HIGH.value])
+        self.kline[PriceIndexes.IND_PRICE_LOW.value] = np.fmin(self.kline[PriceIndexes.IND_PRICE_LOW.value],
+                                                              candle[PriceIndexes.IND_PRICE_LOW.value])
+        self.kline[PriceIndexes.IND_PRICE_CLOSE.value] = candle[PriceIndexes.IND_PRICE_CLOSE.value]
+        self.kline[PriceIndexes.IND_PRICE_VOL.value] += candle[PriceIndexes.IND_PRICE_VOL.value]
+
+    @staticmethod
+    def _get_trades_candles(periods_starts, prices, amounts):
+        """
+        :return: the (len(PriceIndexes), n) candles of time sorted trades
+        """
+        starts_indexes = np.concatenate(([0], np.flatnonzero(np.diff(periods_starts)) + 1))
+        ends_indexes = np.append(starts_indexes[1:], len(periods_starts)) - 1
+        candles = np.empty((len(PriceIndexes), len(starts_indexes)), dtype=np.float64)
+        candles[PriceIndexes.IND_PRICE_TIME.value] = periods_starts[starts_indexes]
+        candles[PriceIndexes.IND_PRICE_OPEN.value] = prices[starts_indexes]
+        candles[PriceIndexes.IND_PRICE_HIGH.value] = np.maximum.reduceat(prices, starts_indexes)
+        candles[PriceIndexes.IND_PRICE_LOW.value] = np.minimum.reduceat(prices, starts_indexes)
+        candles[PriceIndexes.IND_PRICE_CLOSE.value] = prices[ends_indexes]
+        candles[PriceIndexes.IND_PRICE_VOL.value] = np.add.reduceat(amounts, starts_indexes)
+        return candles
@@ -15,7 +15,6 @@
 #  License along with this library.
 import numpy as np
 
-from octobot_commons.data_util import shift_value_array
 from octobot_commons.enums import PriceIndexes
 from octobot_commons.logging.logging_util import get_logger
 
@@ -23,27 +22,31 @@ from octobot_trading.util.initializable import Initializable
 
 
 class CandlesManager(Initializable):
+    """
+    Stores candles in a single (len(PriceIndexes), 2 * max_candles_count) circular buffer: each row is a candle
+    field (indexed by PriceIndexes) and every candle is written at its ring position and at its mirrored position
+    (+ max_candles_count).
+    Appending a candle is O(1) and the last n candles are always readable as a contiguous read-only view.
+    candles_index is the ring head: the position at which the next candle will be written.
+    candles_times indexes stored candles open times to detect duplicates in O(1).
+    The in construction candle is kept at the mirrored position of the ring head (which is never part of the closed
+    candles views) so that closed candles followed by the in construction candle are also a contiguous view.
+    """
     MAX_CANDLES_COUNT = 1000
+    CANDLE_VALUES_COUNT = len(PriceIndexes)
 
-    def __init__(self):
+    def __init__(self, max_candles_count=None):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
 
         self.candles_initialized = False
+        self.in_construction_candle = np.full(CandlesManager.CANDLE_VALUES_COUNT, fill_value=np.nan, dtype=np.float64)
+        self.max_candles_count = max_candles_count or CandlesManager.MAX_CANDLES_COUNT
 
-        self.close_candles_index = 0
-        self.open_candles_index = 0
-        self.high_candles_index = 0
-        self.low_candles_index = 0
-        self.time_candles_index = 0
-        self.volume_candles_index = 0
+        self.candles_index = 0
+        self.candles = None
 
-        self.close_candles = None
-        self.open_candles = None
-        self.high_candles = None
-        self.low_candles = None
-        self.time_candles = None
-        self.volume_candles = None
+        self.candles_times = set()
 
         self.reached_max = False
         self._reset_candles()
@@ -55,54 +58,97 @@ class CandlesManager(Initializable):
         self.candles_initialized = False
         self.reached_max = False
 
-        self.close_candles_index = 0
-        self.open_candles_index = 0
-        self.high_candles_index = 0
-        self.low_candles_index = 0
-        self.time_candles_index = 0
-        self.volume_candles_index = 0
+        self.candles_index = 0
+        self.candles_times = set()
+        self.candles = np.full((CandlesManager.CANDLE_VALUES_COUNT, 2 * self.max_candles_count),
+                               fill_value=np.nan, dtype=np.float64)
+        self._write_in_construction_candle()
 
-        self.close_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(CandlesManager.MAX_CANDLES_COUNT, fill_value=np.nan, dtype=np.float64)
+    @staticmethod
+    def get_candles_memory_size(max_candles_count):
+        """
+        :return: the size in bytes of the candles buffer of a CandlesManager storing max_candles_count candles
+        """
+        return 2 * max_candles_count * CandlesManager.CANDLE_VALUES_COUNT * np.dtype(np.float64).itemsize
 
     # getters
-    def get_symbol_close_candles(self, limit=-1):
-        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index)
+    def get_memory_size(self):
+        return self.candles.nbytes
+
+    def get_candles_count(self):
+        return self.max_candles_count if self.reached_max else self.candles_index
+
+    def get_last_candle_time(self):
+        """
+        :return: the open time of the last stored candle, nan when no candle is stored
+        """
+        if self.get_candles_count():
+            return self.candles[PriceIndexes.IND_PRICE_TIME.value, self.candles_index + self.max_candles_count - 1]
+        return np.nan
 
-    def get_symbol_open_candles(self, limit=-1):
-        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index)
+    def get_candles(self, limit=-1, include_in_construction=False):
+        """
+        :param include_in_construction: when True, the last value of the view is the in construction candle
+        :return: a read-only (len(PriceIndexes), n) view on the last "limit" candles (all candles when limit is -1).
+        The view is not refreshed when new candles are added, it should be copied when kept
+        """
+        return self._extract_limited_data(self.candles, limit, include_in_construction)
 
-    def get_symbol_high_candles(self, limit=-1):
-        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index)
+    def get_symbol_close_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_CLOSE.value], limit,
+                                          include_in_construction)
 
-    def get_symbol_low_candles(self, limit=-1):
-        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index)
+    def get_symbol_open_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_OPEN.value], limit,
+                                          include_in_construction)
 
-    def get_symbol_time_candles(self, limit=-1):
-        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index)
+    def get_symbol_high_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_HIGH.value], limit,
+                                          include_in_construction)
 
-    def get_symbol_volume_candles(self, limit=-1):
-        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
+    def get_symbol_low_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_LOW.value], limit,
+                                          include_in_construction)
+
+    def get_symbol_time_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_TIME.value], limit,
+                                          include_in_construction)
+
+    def get_symbol_volume_candles(self, limit=-1, include_in_construction=False):
+        return self._extract_limited_data(self.candles[PriceIndexes.IND_PRICE_VOL.value], limit,
+                                          include_in_construction)
 
     def get_symbol_prices(self, limit=-1):
+        candles = self.get_candles(limit)
         return {
-            PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
+            PriceIndexes.IND_PRICE_CLOSE.value: candles[PriceIndexes.IND_PRICE_CLOSE.value],
+            PriceIndexes.IND_PRICE_OPEN.value: candles[PriceIndexes.IND_PRICE_OPEN.value],
+            PriceIndexes.IND_PRICE_HIGH.value: candles[PriceIndexes.IND_PRICE_HIGH.value],
+            PriceIndexes.IND_PRICE_LOW.value: candles[PriceIndexes.IND_PRICE_LOW.value],
+            PriceIndexes.IND_PRICE_VOL.value: candles[PriceIndexes.IND_PRICE_VOL.value],
+            PriceIndexes.IND_PRICE_TIME.value: candles[PriceIndexes.IND_PRICE_TIME.value]
         }
 
     def replace_all_candles(self, all_candles_data):
+        """
+        :param all_candles_data: a list of candles or a time sorted (len(PriceIndexes), n) candles array
+        (such as a stored candles memory map) that is copied into the candles buffer at once
+        """
         self._reset_candles()
-        self._set_all_candles(all_candles_data)
+        if isinstance(all_candles_data, np.ndarray):
+            self._set_ordered_candles(all_candles_data)
+        else:
+            self._set_all_candles(all_candles_data)
         self.candles_initialized = True
 
+    def set_in_construction_candle(self, in_construction_candle):
+        """
+        Updates the candle that is returned as last candle when including the in construction candle
+        :param in_construction_candle: the current kline
+        """
+        self.in_construction_candle[:] = in_construction_candle[:CandlesManager.CANDLE_VALUES_COUNT]
+        self._write_in_construction_candle()
+
     def add_old_and_new_candles(self, candles_data):
         """
         Same as add_new_candle but also checks if old candles are missing
@@ -111,7 +157,7 @@ class CandlesManager(Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if self._should_add_new_candle(old_candle[PriceIndexes.IND_PRICE_TIME.value]):
                 self.add_new_candle(old_candle)
 
         try:
@@ -121,64 +167,98 @@ class CandlesManager(Initializable):
 
     def add_new_candle(self, new_candle_data):
         """
+        Appends new_candle_data or inserts it at its place when it is older than the last stored candle
         :param new_candle_data: new candles data
         :return:
         """
-        if self._should_add_new_candle(new_candle_data[PriceIndexes.IND_PRICE_TIME.value]):
+        new_candle_time = new_candle_data[PriceIndexes.IND_PRICE_TIME.value]
+        if self._should_add_new_candle(new_candle_time):
             try:
-                self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_TIME.value]
-                self.volume_candles[self.volume_candles_index] = new_candle_data[PriceIndexes.IND_PRICE_VOL.value]
-                self._inc_candle_index()
-            except IndexError as e:
+                if self.get_candles_count() and new_candle_time < self.get_last_candle_time():
+                    self._insert_old_candle(new_candle_data, new_candle_time)
+                else:
+                    self._append_candle(new_candle_data, new_candle_time)
+            except (IndexError, ValueError) as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
 
     # private
     def _set_all_candles(self, new_candles_data):
         if isinstance(new_candles_data[-1], list):
-            for candle_data in new_candles_data:
-                self.add_new_candle(candle_data)
+            try:
+                all_candles = np.array(new_candles_data, dtype=np.float64)[:, :CandlesManager.CANDLE_VALUES_COUNT]
+            except ValueError:
+                # candles of different sizes or with missing values: add them one by one
+                for candle_data in new_candles_data:
+                    self.add_new_candle(candle_data)
+                return
+            # sorted unique times, keeping the first received candle for each time as add_new_candle does
+            _, unique_indexes = np.unique(all_candles[:, PriceIndexes.IND_PRICE_TIME.value], return_index=True)
+            self._set_ordered_candles(all_candles[unique_indexes].T)
         else:
             self.add_new_candle(new_candles_data)
 
-    def _change_current_candle(self):
-        self.close_candles = shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = shift_value_array(self.time_candles, -1, np.nan, np.float64)
+    def _append_candle(self, new_candle_data, new_candle_time):
+        candle = new_candle_data[:CandlesManager.CANDLE_VALUES_COUNT]
+        if self.reached_max:
+            # the oldest candle is at the ring head and is about to be overwritten
+            self.candles_times.discard(self.candles[PriceIndexes.IND_PRICE_TIME.value, self.candles_index])
+        self.candles[:, self.candles_index] = candle
+        self.candles[:, self.candles_index + self.max_candles_count] = candle
+        self.candles_times.add(new_candle_time)
+        self._inc_candle_index()
 
-    def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+    def _insert_old_candle(self, new_candle_data, new_candle_time):
+        """
+        Inserts a candle that is older than the last stored one at its sorted position.
+        Rewrites the ring (O(n)): only used for late candles.
+        """
+        insert_index: int = int(np.searchsorted(self.get_symbol_time_candles(), new_candle_time))
+        if self.reached_max and insert_index == 0:
+            # older than every candle of a full ring: would be removed right away
+            return
+        self._set_ordered_candles(np.insert(self.get_candles(), insert_index,
+                                            new_candle_data[:CandlesManager.CANDLE_VALUES_COUNT], axis=1))
 
-    def _check_max_candles(self):
-        if self.reached_max:
-            self._change_current_candle()
+    def _set_ordered_candles(self, ordered_candles):
+        """
+        Stores ordered_candles from the ring start, only the last max_candles_count candles are kept
+        :param ordered_candles: time sorted (len(PriceIndexes), n) candles without duplicates
+        """
+        ordered_candles = ordered_candles[:, -self.max_candles_count:]
+        candles_count: int = ordered_candles.shape[1]
+        self.candles[:, :candles_count] = ordered_candles
+        self.candles[:, self.max_candles_count:self.max_candles_count + candles_count] = ordered_candles
+        self.candles_times = set(ordered_candles[PriceIndexes.IND_PRICE_TIME.value].tolist())
+        self.reached_max = candles_count == self.max_candles_count
+        self.candles_index = candles_count % self.max_candles_count
+        self._write_in_construction_candle()
+
+    def _should_add_new_candle(self, new_open_time):
+        return new_open_time not in self.candles_times
 
     def _inc_candle_index(self):
-        if self.close_candles_index < CandlesManager.MAX_CANDLES_COUNT - 1:
-            self.close_candles_index += 1
-            self.open_candles_index += 1
-            self.high_candles_index += 1
-            self.low_candles_index += 1
-            self.time_candles_index += 1
-            self.volume_candles_index += 1
-        else:
+        self.candles_index += 1
+        if self.candles_index == self.max_candles_count:
+            self.candles_index = 0
             self.reached_max = True
+        self._write_in_construction_candle()
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
-        max_handled_limit: int = self.MAX_CANDLES_COUNT if self.reached_max else max_limit
-        if limit == -1:
-            if max_limit == -1:
-                return np.array(data)
-            return np.array(data[:max_handled_limit])
+    def _write_in_construction_candle(self):
+        # the mirrored position of the ring head is right after the last candle in the mirrored values
+        self.candles[:, self.candles_index + self.max_candles_count] = self.in_construction_candle
 
-        if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):])
-        else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit])
+    def _extract_limited_data(self, data, limit=-1, include_in_construction=False):
+        """
+        :param include_in_construction: when True, the oldest candle is replaced by the in construction candle
+        :return: a read-only view on the last "limit" candles (all candles when limit is -1) of data (last axis)
+        """
+        candles_count: int = self.get_candles_count()
+        if limit == -1 or limit > candles_count:
+            limit = candles_count
+        # mirrored values: the ring head is followed by max_candles_count positions that are ordered by time
+        end_index: int = self.candles_index + self.max_candles_count
+        if include_in_construction:
+            end_index += 1
+        view = data[..., end_index - limit:end_index]
+        view.flags.writeable = False
+        return view
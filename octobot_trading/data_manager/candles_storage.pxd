@@ -0,0 +1,28 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cimport numpy as np
+np.import_array()
+
+cdef class CandlesStorage:
+    cdef object logger
+
+    cdef public str storage_path
+
+    cpdef str get_candles_file_path(self, str exchange_name, str symbol, object time_frame)
+    cpdef void save_candles(self, str exchange_name, str symbol, object time_frame, np.ndarray candles)
+    cpdef object load_candles(self, str exchange_name, str symbol, object time_frame)
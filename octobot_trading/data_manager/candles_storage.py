@@ -0,0 +1,74 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+import tempfile
+
+import numpy as np
+
+from octobot_commons.enums import PriceIndexes
+from octobot_commons.logging.logging_util import get_logger
+
+
+class CandlesStorage:
+    """
+    Persists candles as one (len(PriceIndexes), n) float64 .npy file per exchange, symbol and time frame.
+    Stored candles are loaded as read-only memory maps: only the pages that are read get loaded from disk.
+    """
+    CANDLES_FILE_EXTENSION = ".npy"
+
+    def __init__(self, storage_path):
+        self.logger = get_logger(self.__class__.__name__)
+        self.storage_path = storage_path
+
+    def get_candles_file_path(self, exchange_name, symbol, time_frame):
+        return os.path.join(self.storage_path,
+                            exchange_name,
+                            symbol.replace("/", "_"),
+                            f"{time_frame.value}{CandlesStorage.CANDLES_FILE_EXTENSION}")
+
+    def save_candles(self, exchange_name, symbol, time_frame, candles):
+        """
+        Atomically replaces the stored candles of symbol on time_frame
+        :param candles: a time sorted (len(PriceIndexes), n) candles array
+        """
+        if candles.size == 0:
+            return
+        file_path = self.get_candles_file_path(exchange_name, symbol, time_frame)
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=os.path.dirname(file_path), delete=False) as candles_file:
+                np.save(candles_file, np.ascontiguousarray(candles, dtype=np.float64))
+            os.replace(candles_file.name, file_path)
+        except OSError as e:
+            self.logger.error(f"Failed to store {symbol} {time_frame.value} candles in {file_path}: {e}")
+
+    def load_candles(self, exchange_name, symbol, time_frame):
+        """
+        :return: the stored candles of symbol on time_frame as a read-only (len(PriceIndexes), n) memory map,
+        None when no valid candles are stored
+        """
+        file_path = self.get_candles_file_path(exchange_name, symbol, time_frame)
+        if not os.path.isfile(file_path):
+            return None
+        try:
+            candles = np.load(file_path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignored invalid stored candles file {file_path}: {e}")
+            return None
+        if candles.ndim != 2 or candles.shape[0] != len(PriceIndexes) or candles.shape[1] == 0:
+            self.logger.warning(f"Ignored stored candles file {file_path} with unexpected shape: {candles.shape}")
+            return None
+        return candles
@@ -17,12 +17,15 @@
 
 from octobot_trading.util.initializable cimport Initializable
 
+cimport numpy as np
+np.import_array()
 
 cdef class KlineManager(Initializable):
     cdef object logger
 
-    cdef public list kline
+    cdef public np.ndarray kline
 
     cdef void _reset_kline(self)
 
-    cpdef void kline_update(self, list kline)
+    cpdef np.ndarray get_kline(self)
+    cpdef void kline_update(self, object kline)
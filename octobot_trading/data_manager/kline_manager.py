@@ -13,7 +13,8 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-from math import nan
+import numpy as np
+
 from octobot_commons.enums import PriceIndexes
 from octobot_commons.logging.logging_util import get_logger
 
@@ -21,40 +22,45 @@ from octobot_trading.util.initializable import Initializable
 
 
 class KlineManager(Initializable):
+    """
+    Stores the in construction candle in a fixed (len(PriceIndexes), ) float64 row
+    """
+    KLINE_VALUES_COUNT = len(PriceIndexes)
+
     def __init__(self):  # Required for python development
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
-        self.kline = []
+        self.kline = np.full(KlineManager.KLINE_VALUES_COUNT, fill_value=np.nan, dtype=np.float64)
 
     async def initialize_impl(self):
         self._reset_kline()
 
     def _reset_kline(self):
-        self.kline = [nan] * len(PriceIndexes)
+        self.kline[:] = np.nan
+
+    def get_kline(self):
+        """
+        :return: a read-only view on the in construction candle, updated in place on each kline update
+        """
+        view = self.kline[:]
+        view.flags.writeable = False
+        return view
 
     def kline_update(self, kline):
         try:
+            new_kline = np.asarray(kline[:KlineManager.KLINE_VALUES_COUNT], dtype=np.float64)
             # test for new candle
-            if self.kline[PriceIndexes.IND_PRICE_TIME.value] != kline[PriceIndexes.IND_PRICE_TIME.value]:
-                self._reset_kline()
-
-            if self.kline[PriceIndexes.IND_PRICE_TIME.value] is nan:
-                self.kline[PriceIndexes.IND_PRICE_TIME.value] = kline[PriceIndexes.IND_PRICE_TIME.value]
-
-            if self.kline[PriceIndexes.IND_PRICE_OPEN.value] is nan:
-                self.kline[PriceIndexes.IND_PRICE_OPEN.value] = kline[PriceIndexes.IND_PRICE_OPEN.value]
-
-            if self.kline[PriceIndexes.IND_PRICE_VOL.value] is nan:
-                self.kline[PriceIndexes.IND_PRICE_VOL.value] = kline[PriceIndexes.IND_PRICE_VOL.value]
-
-            self.kline[PriceIndexes.IND_PRICE_CLOSE.value] = kline[PriceIndexes.IND_PRICE_CLOSE.value]
-
-            if self.kline[PriceIndexes.IND_PRICE_HIGH.value] is nan or \
-                    self.kline[PriceIndexes.IND_PRICE_HIGH.value] < kline[PriceIndexes.IND_PRICE_HIGH.value]:
-                self.kline[PriceIndexes.IND_PRICE_HIGH.value] = kline[PriceIndexes.IND_PRICE_HIGH.value]
+            if self.kline[PriceIndexes.IND_PRICE_TIME.value] != new_kline[PriceIndexes.IND_PRICE_TIME.value]:
+                self.kline[:] = new_kline
+                return
 
-            if self.kline[PriceIndexes.IND_PRICE_LOW.value] is nan or \
-                    self.kline[PriceIndexes.IND_PRICE_LOW.value] > kline[PriceIndexes.IND_PRICE_LOW.value]:
-                self.kline[PriceIndexes.IND_PRICE_LOW.value] = kline[PriceIndexes.IND_PRICE_LOW.value]
-        except TypeError as e:
+            self.kline[PriceIndexes.IND_PRICE_CLOSE.value] = new_kline[PriceIndexes.IND_PRICE_CLOSE.value]
+            # nan are ignored by fmax and fmin
+            self.kline[PriceIndexes.IND_PRICE_HIGH.value] = np.fmax(self.kline[PriceIndexes.IND_PRICE_HIGH.value],
+                                                                   new_kline[PriceIndexes.IND_PRICE_HIGH.value])
+            self.kline[PriceIndexes.IND_PRICE_LOW.value] = np.fmin(self.kline[PriceIndexes.IND_PRICE_LOW.value],
+                                                                  new_kline[PriceIndexes.IND_PRICE_LOW.value])
+            # time, open and volume are only set when missing
+            np.copyto(self.kline, new_kline, where=np.isnan(self.kline))
+        except (TypeError, ValueError) as e:
             self.logger.error(f"Fail to update kline with {kline} : {e}")
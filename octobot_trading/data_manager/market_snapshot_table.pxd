@@ -0,0 +1,33 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cimport numpy as np
+np.import_array()
+
+cdef class MarketSnapshotTable:
+    cdef public list symbols
+    cdef public dict symbol_rows
+    cdef public np.ndarray values
+
+    cpdef int get_symbol_row(self, str symbol)
+    cpdef void reset_row(self, int row, tuple columns=*)
+    cpdef void update_row(self, int row, dict values)
+    cpdef double get_row_value(self, int row, str column)
+    cpdef np.ndarray get_column(self, str column)
+    cpdef dict get_columns(self, tuple columns=*)
+
+    cdef void _reset_values(self, int symbols_capacity)
@@ -0,0 +1,113 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsMarketSnapshotColumns
+
+
+class MarketSnapshotTable:
+    """
+    Stores the market state of every symbol of an exchange in a single (symbols, len(COLUMNS)) float64 table:
+    each symbol has a row with its ticker, mark price and funding values and updating it is a few field writes.
+    A column of every symbol (ex: every last price) is a single read-only view for cross-market computations.
+    """
+    TICKER_COLUMNS = (
+        ExchangeConstantsTickersColumns.TIMESTAMP.value,
+        ExchangeConstantsTickersColumns.HIGH.value,
+        ExchangeConstantsTickersColumns.LOW.value,
+        ExchangeConstantsTickersColumns.BID.value,
+        ExchangeConstantsTickersColumns.BID_VOLUME.value,
+        ExchangeConstantsTickersColumns.ASK.value,
+        ExchangeConstantsTickersColumns.ASK_VOLUME.value,
+        ExchangeConstantsTickersColumns.VWAP.value,
+        ExchangeConstantsTickersColumns.OPEN.value,
+        ExchangeConstantsTickersColumns.CLOSE.value,
+        ExchangeConstantsTickersColumns.LAST.value,
+        ExchangeConstantsTickersColumns.PREVIOUS_CLOSE.value,
+        ExchangeConstantsTickersColumns.CHANGE.value,
+        ExchangeConstantsTickersColumns.PERCENTAGE.value,
+        ExchangeConstantsTickersColumns.AVERAGE.value,
+        ExchangeConstantsTickersColumns.BASE_VOLUME.value,
+        ExchangeConstantsTickersColumns.QUOTE_VOLUME.value,
+    )
+    MARKET_COLUMNS = (
+        ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value,
+        ExchangeConstantsMarketSnapshotColumns.MARK_PRICE_TIMESTAMP.value,
+        ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value,
+        ExchangeConstantsMarketSnapshotColumns.NEXT_FUNDING_TIME.value,
+        ExchangeConstantsMarketSnapshotColumns.LAST_FUNDING_TIME.value,
+    )
+    COLUMNS = TICKER_COLUMNS + MARKET_COLUMNS
+    COLUMN_INDEXES = {column: index for index, column in enumerate(COLUMNS)}
+    INITIAL_SYMBOLS_CAPACITY = 32
+
+    def __init__(self):
+        self.symbols = []
+        self.symbol_rows = {}
+        self.values = None
+        self._reset_values(MarketSnapshotTable.INITIAL_SYMBOLS_CAPACITY)
+
+    def get_symbol_row(self, symbol):
+        """
+        :return: the row of symbol, added to the table when missing
+        """
+        try:
+            return self.symbol_rows[symbol]
+        except KeyError:
+            row = len(self.symbols)
+            if row == self.values.shape[0]:
+                previous_values = self.values
+                self._reset_values(2 * row)
+                self.values[:row] = previous_values
+            self.symbols.append(symbol)
+            self.symbol_rows[symbol] = row
+            return row
+
+    def reset_row(self, row, columns=COLUMNS):
+        for column in columns:
+            self.values[row, MarketSnapshotTable.COLUMN_INDEXES[column]] = \
+                0 if column == ExchangeConstantsTickersColumns.TIMESTAMP.value else np.nan
+
+    def update_row(self, row, values):
+        """
+        Writes the values of the table columns in row, None values are stored as nan
+        :param values: a dict of column: value (other keys are ignored)
+        """
+        for column, value in values.items():
+            if column in MarketSnapshotTable.COLUMN_INDEXES:
+                self.values[row, MarketSnapshotTable.COLUMN_INDEXES[column]] = np.nan if value is None else value
+
+    def get_row_value(self, row, column):
+        return self.values[row, MarketSnapshotTable.COLUMN_INDEXES[column]]
+
+    def get_column(self, column):
+        """
+        :return: a read-only view on column values of every symbol (ordered like symbols)
+        """
+        view = self.values[:len(self.symbols), MarketSnapshotTable.COLUMN_INDEXES[column]]
+        view.flags.writeable = False
+        return view
+
+    def get_columns(self, columns=COLUMNS):
+        """
+        :return: a dict of column: read-only view on column values of every symbol (ordered like symbols)
+        """
+        return {column: self.get_column(column) for column in columns}
+
+    def _reset_values(self, symbols_capacity):
+        self.values = np.full((symbols_capacity, len(MarketSnapshotTable.COLUMNS)), fill_value=np.nan,
+                              dtype=np.float64)
+        self.values[:, MarketSnapshotTable.COLUMN_INDEXES[ExchangeConstantsTickersColumns.TIMESTAMP.value]] = 0
@@ -28,10 +28,48 @@ cdef class OrderBookManager(Initializable):
     cdef public double bid_quantity
     cdef public double bid_price
 
-    cdef public list bids
-    cdef public list asks
+    cdef public list ask_prices
+    cdef public dict ask_sizes
+    cdef public list bid_prices
+    cdef public dict bid_sizes
+
+    cdef public dict orders
+    cdef public dict levels_orders_count
+
+    cdef public long version
+    cdef dict _analytics_cache
 
     cpdef void reset_order_book(self)
     cpdef void order_book_update(self, list asks, list bids)
+    cpdef void order_book_delta_update(self, list asks, list bids)
     cpdef void order_book_ticker_update(self, double ask_quantity, double ask_price,
                                         double bid_quantity, double bid_price)
+    cpdef void order_book_orders_update(self, list orders, str id_key=*)
+    cpdef void order_book_orders_delta_insert(self, list orders, str id_key=*)
+    cpdef void order_book_orders_delta_update(self, list orders, str id_key=*)
+    cpdef void order_book_orders_delta_delete(self, list orders, str id_key=*)
+
+    cpdef tuple get_best_ask(self)
+    cpdef tuple get_best_bid(self)
+    cpdef double get_depth_at_price(self, object side, double price)
+    cpdef double get_cumulative_depth(self, object side, double price)
+    cpdef list get_asks(self, int limit=*)
+    cpdef list get_bids(self, int limit=*)
+    cpdef tuple get_cumulative_depth_arrays(self, object side)
+    cpdef double get_vwap(self, object side, double quantity)
+    cpdef double get_slippage(self, object side, double quantity)
+    cpdef double get_imbalance(self, int levels_count)
+
+    cdef void _on_levels_update(self)
+    cdef object _get_cached_analytics(self, tuple key, object compute_function, tuple args)
+    cdef tuple _get_side_arrays(self, object side)
+    cdef tuple _compute_side_arrays(self, object side)
+    cdef double _compute_vwap(self, object side, double quantity)
+    cdef double _compute_imbalance(self, int levels_count)
+    cdef double _get_best_levels_size(self, object side, int levels_count)
+
+    cdef tuple _get_side_levels(self, object side)
+    @staticmethod
+    cdef object _parse_side(object side)
+    cdef void _add_order(self, object order_id, object side, double price, double amount)
+    cdef void _remove_order(self, object order_id)
@@ -13,36 +13,342 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from bisect import bisect_left, insort
+
+import numpy as np
+
 from octobot_commons.logging.logging_util import get_logger
 
+from octobot_trading.enums import ExchangeConstantsOrderColumns, TradeOrderSide
 from octobot_trading.util.initializable import Initializable
 
 
 class OrderBookManager(Initializable):
+    """
+    Stores the order book as price levels: each side has a sorted list of prices (bisect lookups)
+    and a price -> size dict.
+    Best ask and best bid are the sorted lists ends and depth at a given price is a dict lookup.
+    Adding or removing a level is a bisect search followed by an O(n) list memmove.
+    Sides are TradeOrderSide.SELL (asks) and TradeOrderSide.BUY (bids), L3 orders raw sides are parsed into them.
+    Levels can be replaced (order_book_update), updated with L2 deltas (order_book_delta_update) or built from
+    L3 orders (order_book_orders_*) that are aggregated into their price level.
+    version is incremented on each levels update: analytics (VWAP, slippage, imbalance, cumulative depth) are
+    computed on numpy arrays and cached until the next update.
+    """
     def __init__(self):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
         self.order_book_initialized = False
-        self.bids = []
-        self.asks = []
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
 
+        # ascending prices for both sides: best ask is the first ask price, best bid is the last bid price
+        self.ask_prices, self.ask_sizes = [], {}
+        self.bid_prices, self.bid_sizes = [], {}
+
+        # L3 orders: order id -> (TradeOrderSide, price, amount) and price level orders count
+        self.orders = {}
+        self.levels_orders_count = {}
+
+        self.version = 0
+        self._analytics_cache = {}
+
     async def initialize_impl(self):
         self.reset_order_book()
 
+    @property
+    def asks(self):
+        """
+        :return: the [price, size] asks levels from the best ask
+        """
+        return self.get_asks()
+
+    @property
+    def bids(self):
+        """
+        :return: the [price, size] bids levels from the best bid
+        """
+        return self.get_bids()
+
     def reset_order_book(self):
         self.order_book_initialized = False
-        self.bids = []
-        self.asks = []
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
+        self.ask_prices, self.ask_sizes = [], {}
+        self.bid_prices, self.bid_sizes = [], {}
+        self.orders = {}
+        self.levels_orders_count = {}
+        self._on_levels_update()
 
+    # L2 updates
     def order_book_update(self, asks, bids):
+        """
+        Replaces the levels of each given side
+        :param asks: [price, size] asks levels
+        :param bids: [price, size] bids levels
+        """
         self.order_book_initialized = True
         if asks:
-            self.asks = asks
+            self.ask_prices, self.ask_sizes = self._get_levels(asks)
         if bids:
-            self.bids = bids
+            self.bid_prices, self.bid_sizes = self._get_levels(bids)
+        self._on_levels_update()
+
+    def order_book_delta_update(self, asks, bids):
+        """
+        Updates the given levels, a level with a 0 size is removed
+        :param asks: [price, size] asks levels
+        :param bids: [price, size] bids levels
+        """
+        for price, size, *_ in asks:
+            self._set_level(self.ask_prices, self.ask_sizes, price, size)
+        for price, size, *_ in bids:
+            self._set_level(self.bid_prices, self.bid_sizes, price, size)
+        self._on_levels_update()
 
     def order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.ask_quantity, self.ask_price = ask_quantity, ask_price
         self.bid_quantity, self.bid_price = bid_quantity, bid_price
+
+    # L3 updates
+    def order_book_orders_update(self, orders, id_key=ExchangeConstantsOrderColumns.ID.value):
+        """
+        Replaces the whole order book by the levels of the given orders
+        :param orders: order dicts with an id (id_key), a side, a price and an amount
+        """
+        self.reset_order_book()
+        self.order_book_initialized = True
+        self.order_book_orders_delta_insert(orders, id_key=id_key)
+
+    def order_book_orders_delta_insert(self, orders, id_key=ExchangeConstantsOrderColumns.ID.value):
+        for order in orders:
+            self._add_order(order[id_key],
+                            OrderBookManager._parse_side(order[ExchangeConstantsOrderColumns.SIDE.value]),
+                            order[ExchangeConstantsOrderColumns.PRICE.value],
+                            order[ExchangeConstantsOrderColumns.AMOUNT.value])
+        self._on_levels_update()
+
+    def order_book_orders_delta_update(self, orders, id_key=ExchangeConstantsOrderColumns.ID.value):
+        """
+        Updates the given orders: missing side, price or amount values are kept from the stored order
+        """
+        for order in orders:
+            try:
+                side, price, amount = self.orders[order[id_key]]
+            except KeyError:
+                self.logger.debug(f"Ignored update of unknown order book order: {order}")
+                continue
+            self._remove_order(order[id_key])
+            self._add_order(order[id_key],
+                            OrderBookManager._parse_side(order.get(ExchangeConstantsOrderColumns.SIDE.value, side)),
+                            order.get(ExchangeConstantsOrderColumns.PRICE.value, price),
+                            order.get(ExchangeConstantsOrderColumns.AMOUNT.value, amount))
+        self._on_levels_update()
+
+    def order_book_orders_delta_delete(self, orders, id_key=ExchangeConstantsOrderColumns.ID.value):
+        for order in orders:
+            self._remove_order(order[id_key])
+        self._on_levels_update()
+
+    # getters
+    def get_best_ask(self):
+        """
+        :return: the (price, size) of the best ask level, None when there is no ask
+        """
+        if self.ask_prices:
+            return self.ask_prices[0], self.ask_sizes[self.ask_prices[0]]
+        return None
+
+    def get_best_bid(self):
+        """
+        :return: the (price, size) of the best bid level, None when there is no bid
+        """
+        if self.bid_prices:
+            return self.bid_prices[-1], self.bid_sizes[self.bid_prices[-1]]
+        return None
+
+    def get_depth_at_price(self, side, price):
+        """
+        :param side: TradeOrderSide.SELL for asks, TradeOrderSide.BUY for bids
+        :return: the size of the price level, 0 when there is no such level
+        """
+        _, sizes = self._get_side_levels(side)
+        return sizes.get(price, 0)
+
+    def get_cumulative_depth(self, side, price):
+        """
+        :param side: TradeOrderSide.SELL for asks, TradeOrderSide.BUY for bids
+        :return: the total size of the levels from the best price up to price (included)
+        """
+        prices, _, cumulative_sizes, _ = self._get_side_arrays(side)
+        if side is TradeOrderSide.SELL:
+            levels_count = np.searchsorted(prices, price, side="right")
+        else:
+            # bids prices are decreasing
+            levels_count = np.searchsorted(-prices, -price, side="right")
+        return float(cumulative_sizes[levels_count - 1]) if levels_count else 0
+
+    def get_asks(self, limit=-1):
+        """
+        :return: the [price, size] asks levels from the best ask
+        """
+        prices = self.ask_prices if limit == -1 else self.ask_prices[:limit]
+        return [[price, self.ask_sizes[price]] for price in prices]
+
+    def get_bids(self, limit=-1):
+        """
+        :return: the [price, size] bids levels from the best bid
+        """
+        prices = self.bid_prices if limit == -1 else self.bid_prices[max(len(self.bid_prices) - limit, 0):]
+        return [[price, self.bid_sizes[price]] for price in reversed(prices)]
+
+    # analytics
+    def get_cumulative_depth_arrays(self, side):
+        """
+        :param side: TradeOrderSide.SELL for asks, TradeOrderSide.BUY for bids
+        :return: the read-only (prices, cumulative sizes) arrays of the side levels from the best price
+        """
+        prices, _, cumulative_sizes, _ = self._get_side_arrays(side)
+        return prices, cumulative_sizes
+
+    def get_vwap(self, side, quantity):
+        """
+        :param side: the consumed side: TradeOrderSide.SELL (asks) for a buy, TradeOrderSide.BUY (bids) for a sell
+        :param quantity: the quantity to fill
+        :return: the average price of a market order filling quantity, nan when the side depth is too small
+        """
+        return self._get_cached_analytics(("vwap", side, quantity), self._compute_vwap, (side, quantity))
+
+    def get_slippage(self, side, quantity):
+        """
+        :param side: the consumed side: TradeOrderSide.SELL (asks) for a buy, TradeOrderSide.BUY (bids) for a sell
+        :param quantity: the quantity to fill
+        :return: the relative price difference between the best price and the average price of a market order
+        filling quantity (0.01 for 1% slippage), nan when the side depth is too small
+        """
+        prices, _ = self._get_side_levels(side)
+        if not prices:
+            return np.nan
+        best_price = prices[0] if side is TradeOrderSide.SELL else prices[-1]
+        return abs(self.get_vwap(side, quantity) - best_price) / best_price
+
+    def get_imbalance(self, levels_count):
+        """
+        :param levels_count: the number of levels of each side to consider
+        :return: (bids size - asks size) / (bids size + asks size) over the best levels_count levels,
+        from -1 (only asks) to 1 (only bids), nan when the order book is empty
+        """
+        return self._get_cached_analytics(("imbalance", levels_count), self._compute_imbalance, (levels_count, ))
+
+    # private
+    def _on_levels_update(self):
+        self.version += 1
+        self._analytics_cache = {}
+
+    def _get_cached_analytics(self, key, compute_function, args):
+        try:
+            return self._analytics_cache[key]
+        except KeyError:
+            self._analytics_cache[key] = value = compute_function(*args)
+            return value
+
+    def _get_side_arrays(self, side):
+        """
+        :return: the read-only (prices, sizes, cumulative sizes, cumulative notional) arrays of the side levels
+        from the best price
+        """
+        return self._get_cached_analytics(("side_arrays", side), self._compute_side_arrays, (side, ))
+
+    def _compute_side_arrays(self, side):
+        side_prices, side_sizes = self._get_side_levels(side)
+        if side is TradeOrderSide.BUY:
+            # from the best bid
+            side_prices = side_prices[::-1]
+        prices = np.array(side_prices, dtype=np.float64)
+        sizes = np.array([side_sizes[price] for price in side_prices], dtype=np.float64)
+        arrays = (prices, sizes, np.cumsum(sizes), np.cumsum(prices * sizes))
+        for array in arrays:
+            array.flags.writeable = False
+        return arrays
+
+    def _compute_vwap(self, side, quantity):
+        prices, _, cumulative_sizes, cumulative_notional = self._get_side_arrays(side)
+        # first level at which quantity is filled
+        fill_index = np.searchsorted(cumulative_sizes, quantity)
+        if quantity <= 0 or fill_index == len(prices):
+            return np.nan
+        filled_size, filled_notional = (cumulative_sizes[fill_index - 1], cumulative_notional[fill_index - 1]) \
+            if fill_index else (0, 0)
+        return float((filled_notional + (quantity - filled_size) * prices[fill_index]) / quantity)
+
+    def _compute_imbalance(self, levels_count):
+        asks_size = self._get_best_levels_size(TradeOrderSide.SELL, levels_count)
+        bids_size = self._get_best_levels_size(TradeOrderSide.BUY, levels_count)
+        if asks_size + bids_size == 0:
+            return np.nan
+        return float((bids_size - asks_size) / (bids_size + asks_size))
+
+    def _get_best_levels_size(self, side, levels_count):
+        _, _, cumulative_sizes, _ = self._get_side_arrays(side)
+        levels_count = min(levels_count, len(cumulative_sizes))
+        return cumulative_sizes[levels_count - 1] if levels_count > 0 else 0
+
+    @staticmethod
+    def _get_levels(levels):
+        sizes = {price: size for price, size, *_ in levels if size}
+        return sorted(sizes), sizes
+
+    @staticmethod
+    def _set_level(prices, sizes, price, size):
+        if size:
+            if price not in sizes:
+                insort(prices, price)
+            sizes[price] = size
+        elif sizes.pop(price, None) is not None:
+            del prices[bisect_left(prices, price)]
+
+    def _get_side_levels(self, side):
+        """
+        :param side: TradeOrderSide.SELL for asks, TradeOrderSide.BUY for bids
+        :return: the (sorted prices, price -> size) levels of side
+        """
+        if side is TradeOrderSide.SELL:
+            return self.ask_prices, self.ask_sizes
+        if side is TradeOrderSide.BUY:
+            return self.bid_prices, self.bid_sizes
+        raise ValueError(f"Invalid order book side: {side!r}, expected a TradeOrderSide")
+
+    @staticmethod
+    def _parse_side(side):
+        """
+        :param side: a TradeOrderSide or a raw exchange order side
+        :return: the TradeOrderSide of side
+        """
+        if isinstance(side, TradeOrderSide):
+            return side
+        try:
+            return TradeOrderSide(side.lower())
+        except (AttributeError, ValueError):
+            raise ValueError(f"Invalid order book order side: {side!r}")
+
+    def _add_order(self, order_id, side, price, amount):
+        if order_id in self.orders:
+            self._remove_order(order_id)
+        prices, sizes = self._get_side_levels(side)
+        level_key = (side, price)
+        self.levels_orders_count[level_key] = self.levels_orders_count.get(level_key, 0) + 1
+        self._set_level(prices, sizes, price, sizes.get(price, 0) + amount)
+        self.orders[order_id] = (side, price, amount)
+
+    def _remove_order(self, order_id):
+        try:
+            side, price, amount = self.orders.pop(order_id)
+        except KeyError:
+            return
+        prices, sizes = self._get_side_levels(side)
+        level_key = (side, price)
+        self.levels_orders_count[level_key] -= 1
+        if self.levels_orders_count[level_key] == 0:
+            # remove the level without float sum residue
+            self.levels_orders_count.pop(level_key)
+            self._set_level(prices, sizes, price, 0)
+        else:
+            self._set_level(prices, sizes, price, sizes.get(price, 0) - amount)
@@ -30,6 +30,11 @@ cdef class OrdersManager(Initializable):
     cdef ExchangeManager exchange_manager
 
     cdef public object orders
+    cdef public dict orders_by_symbol
+    cdef public dict orders_by_status
+    cdef public dict orders_by_trigger
+    cdef public dict orders_index_keys
+    cdef public unsigned long long orders_insertion_count
 
     cdef void _reset_orders(self)
     cdef void _check_orders_size(self)
@@ -37,9 +42,19 @@ cdef class OrdersManager(Initializable):
     cdef bint _update_order_from_raw(self, Order order, dict raw_order)
     cdef void _remove_oldest_orders(self, int nb_to_remove)
     cdef list _select_orders(self, object state=*, str symbol=*, int since=*, int limit=*)
+    cdef void _index_new_order(self, str order_id)
+    cdef void _index_order(self, str order_id, unsigned long long insertion_index)
+    cdef void _unindex_order(self, str order_id)
+    cdef void _reindex_order(self, str order_id)
+    cdef tuple _get_trigger_key(self, str order_id, Order order)
+
+    @staticmethod
+    cdef void _remove_index_key(dict indexed_keys, object index, tuple key)
 
     cpdef void update_order_attribute(self, str order_id, str key, object value)
     cpdef Order get_order(self, str order_id)
+    cpdef list get_triggered_open_orders(self, str symbol, double min_price, double max_price)
+    cpdef void update_order_index(self, Order order)
     cpdef tuple upsert_order(self, str order_id, dict raw_order)
     cpdef bint upsert_order_close(self, str order_id, dict raw_order)
     cpdef bint upsert_order_instance(self, Order order)
@@ -13,17 +13,26 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import heapq
+from bisect import bisect_left, insort
 from collections import OrderedDict
 
 from octobot_commons.logging.logging_util import get_logger
 from octobot_trading.data.order import Order
-from octobot_trading.enums import OrderStatus
+from octobot_trading.enums import OrderStatus, OrderTriggerDirection, TraderOrderType
 from octobot_trading.util.initializable import Initializable
 
 
 class OrdersManager(Initializable):
     MAX_ORDERS_COUNT = 2000
 
+    # simulated fill trigger of each order type, other order types are checked on every price update
+    ORDER_TYPES_TRIGGER_DIRECTIONS = {
+        TraderOrderType.BUY_LIMIT: OrderTriggerDirection.PRICE_FALLING,
+        TraderOrderType.STOP_LOSS: OrderTriggerDirection.PRICE_FALLING,
+        TraderOrderType.SELL_LIMIT: OrderTriggerDirection.PRICE_RISING,
+    }
+
     def __init__(self, config, trader, exchange_manager):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
@@ -31,6 +40,15 @@ class OrdersManager(Initializable):
         self.orders_initialized = False  # TODO
         self.orders = OrderedDict()
 
+        # insertion sorted (insertion_index, order_id) keys by symbol and by status then symbol
+        self.orders_by_symbol = {}
+        self.orders_by_status = {}
+        # price sorted (origin_price, order_id) keys of open orders by symbol then trigger direction
+        self.orders_by_trigger = {}
+        # order_id: (symbol, status, key, trigger_key) of indexed orders
+        self.orders_index_keys = {}
+        self.orders_insertion_count = 0
+
     async def initialize_impl(self):
         self._reset_orders()
 
@@ -49,24 +67,54 @@ class OrdersManager(Initializable):
     def get_order(self, order_id):
         return self.orders[order_id]
 
+    def get_triggered_open_orders(self, symbol, min_price, max_price):
+        """
+        Selects the open orders which simulated fill might be triggered by prices between min_price and max_price
+        :param symbol: the orders symbol
+        :param min_price: the lowest price
+        :param max_price: the highest price
+        :return: the insertion sorted open orders to check
+        """
+        directions_keys = self.orders_by_trigger.get(symbol, {})
+        falling_keys = directions_keys.get(OrderTriggerDirection.PRICE_FALLING, [])
+        rising_keys = directions_keys.get(OrderTriggerDirection.PRICE_RISING, [])
+        keys = falling_keys[bisect_left(falling_keys, (min_price,)):] + \
+            rising_keys[:bisect_left(rising_keys, (max_price,))] + \
+            directions_keys.get(OrderTriggerDirection.ANY_PRICE, [])
+        return [self.orders[order_id]
+                for _, order_id in sorted([self.orders_index_keys[order_id][2] for _, order_id in keys])]
+
+    def update_order_index(self, order):
+        """
+        Moves an order which status changed outside of the orders manager (fills and cancels) to its new indexes
+        :param order: the updated order
+        """
+        if self.orders.get(order.order_id) is order:
+            self._reindex_order(order.order_id)
+
     def upsert_order(self, order_id, raw_order) -> (bool, bool):
         if order_id not in self.orders:
             self.orders[order_id] = self._create_order_from_raw(raw_order)
+            self._index_new_order(order_id)
             self._check_orders_size()
             return True, False
-        return self._update_order_from_raw(self.orders[order_id], raw_order), True
+        changed: bool = self._update_order_from_raw(self.orders[order_id], raw_order)
+        self._reindex_order(order_id)
+        return changed, True
 
     def upsert_order_close(self, order_id, raw_order) -> bool:
         if order_id in self.orders:
             self._update_order_from_raw(self.orders[order_id], raw_order)
             # TODO order -> trade
             self.orders.pop(order_id)
+            self._unindex_order(order_id)
             return True
         return False
 
     def upsert_order_instance(self, order) -> bool:
         if order.order_id not in self.orders:
             self.orders[order.order_id] = order
+            self._index_new_order(order.order_id)
             self._check_orders_size()
             return True
         # TODO
@@ -75,6 +123,7 @@ class OrdersManager(Initializable):
     def remove_order_instance(self, order):
         if order.order_id in self.orders:
             self.orders.pop(order.order_id, None)
+            self._unindex_order(order.order_id)
             order.clear()
         else:
             self.logger.warning(f"Attempt to remove an order that is not in orders_manager: {order.order_type.name} "
@@ -85,6 +134,11 @@ class OrdersManager(Initializable):
     def _reset_orders(self):
         self.orders_initialized = False
         self.orders = OrderedDict()
+        self.orders_by_symbol = {}
+        self.orders_by_status = {}
+        self.orders_by_trigger = {}
+        self.orders_index_keys = {}
+        self.orders_insertion_count = 0
 
     def _check_orders_size(self):
         if len(self.orders) > self.MAX_ORDERS_COUNT:
@@ -99,20 +153,69 @@ class OrdersManager(Initializable):
         return order.update_from_raw(raw_order)
 
     def _select_orders(self, state=None, symbol=None, since=-1, limit=-1):
-        orders = [
-            order
-            for order in self.orders.values()
-            if (
-                    (state is None or order.status == state) and
-                    (symbol is None or (symbol and order.symbol == symbol)) and
-                    (since == -1 or (since and order.timestamp < since))
-            )
-        ]
+        if state is None and symbol is None:
+            orders = list(self.orders.values())
+        else:
+            symbols_keys = self.orders_by_symbol if state is None else self.orders_by_status.get(state, {})
+            keys = heapq.merge(*symbols_keys.values()) if symbol is None else symbols_keys.get(symbol, [])
+            orders = [self.orders[order_id] for _, order_id in keys]
+        if since != -1:
+            # orders created before since
+            orders = [order for order in orders if since and order.timestamp < since]
         return orders if limit == -1 else orders[0:limit]
 
+    def _index_new_order(self, order_id):
+        self.orders_insertion_count += 1
+        self._index_order(order_id, self.orders_insertion_count)
+
+    def _index_order(self, order_id, insertion_index):
+        order = self.orders[order_id]
+        key = (insertion_index, order_id)
+        trigger_key = self._get_trigger_key(order_id, order)
+        self.orders_index_keys[order_id] = (order.symbol, order.status, key, trigger_key)
+        insort(self.orders_by_symbol.setdefault(order.symbol, []), key)
+        insort(self.orders_by_status.setdefault(order.status, {}).setdefault(order.symbol, []), key)
+        if trigger_key is not None:
+            insort(self.orders_by_trigger.setdefault(order.symbol, {}).setdefault(trigger_key[0], []),
+                   trigger_key[1])
+
+    def _unindex_order(self, order_id):
+        symbol, status, key, trigger_key = self.orders_index_keys.pop(order_id)
+        OrdersManager._remove_index_key(self.orders_by_symbol, symbol, key)
+        OrdersManager._remove_index_key(self.orders_by_status[status], symbol, key)
+        if trigger_key is not None:
+            OrdersManager._remove_index_key(self.orders_by_trigger[symbol], trigger_key[0], trigger_key[1])
+            if not self.orders_by_trigger[symbol]:
+                self.orders_by_trigger.pop(symbol)
+
+    def _reindex_order(self, order_id):
+        order = self.orders[order_id]
+        symbol, status, key, trigger_key = self.orders_index_keys[order_id]
+        if (symbol, status, trigger_key) != (order.symbol, order.status, self._get_trigger_key(order_id, order)):
+            self._unindex_order(order_id)
+            # keep the insertion order
+            self._index_order(order_id, key[0])
+
+    def _get_trigger_key(self, order_id, order):
+        """
+        :return: the (trigger direction, (origin_price, order_id)) trigger index key of open orders
+        """
+        if order.status != OrderStatus.OPEN:
+            return None
+        return (self.ORDER_TYPES_TRIGGER_DIRECTIONS.get(order.order_type, OrderTriggerDirection.ANY_PRICE),
+                (order.origin_price, order_id))
+
+    @staticmethod
+    def _remove_index_key(indexed_keys, index, key):
+        keys = indexed_keys[index]
+        del keys[bisect_left(keys, key)]
+        if not keys:
+            indexed_keys.pop(index)
+
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
-            self.orders.popitem(last=False)
+            order_id, _ = self.orders.popitem(last=False)
+            self._unindex_order(order_id)
 
     def clear(self):
         for order in self.orders.values():
@@ -16,16 +16,34 @@
 #  License along with this library.
 from octobot_trading.util.initializable cimport Initializable
 
+cimport numpy as np
+np.import_array()
+
 cdef class RecentTradesManager(Initializable):
     cdef object logger
 
-    cdef public object recent_trades
+    cdef public np.ndarray recent_trades
+    cdef public np.ndarray recent_trades_ids
+    cdef public set recent_trades_keys
+    cdef public int recent_trades_index
+    cdef public bint reached_max
     cdef public object liquidations
 
-    cdef void _reset_recent_trades(self)
+    cdef list _recent_trades_keys_ring
+
+    cpdef int get_recent_trades_count(self)
+    cpdef np.ndarray get_recent_trades_timestamps(self, int limit=*)
+    cpdef np.ndarray get_recent_trades_prices(self, int limit=*)
+    cpdef np.ndarray get_recent_trades_amounts(self, int limit=*)
+    cpdef np.ndarray get_recent_trades_sides(self, int limit=*)
+    cpdef np.ndarray get_recent_trades_ids(self, int limit=*)
 
     cpdef list set_all_recent_trades(self, list recent_trades)
     cpdef list add_new_trades(self, list recent_trades)
     cpdef list add_recent_trade(self, dict recent_trade)
 
     cpdef list add_new_liquidations(self, list liquidations)
+
+    cdef void _append_recent_trade(self, dict recent_trade, object trade_key)
+    cdef np.ndarray _extract_limited_data(self, np.ndarray data, int limit=*)
+    cdef void _reset_recent_trades(self)
@@ -15,44 +15,97 @@
 #  License along with this library.
 from collections import deque
 
+import numpy as np
+
 from octobot_commons.logging.logging_util import get_logger
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns, TradeOrderSide
 from octobot_trading.util.initializable import Initializable
 
 
 class RecentTradesManager(Initializable):
+    """
+    Stores recent trades in a (len(RECENT_TRADES_COLUMNS), 2 * MAX_RECENT_TRADES_COUNT) float64 mirrored circular
+    buffer (see CandlesManager): each row is a trade column and the last n trades of a column are always readable
+    as a contiguous read-only view.
+    Trades ids are stored in a mirrored object array and recent_trades_keys indexes stored trades (by id or by
+    timestamp, price, amount and side when trades have no id) to detect duplicates in O(1).
+    """
     MAX_RECENT_TRADES_COUNT = 100
     MAX_LIQUIDATIONS_COUNT = 20
 
+    # recent trades buffer rows
+    TIMESTAMP_INDEX = 0
+    PRICE_INDEX = 1
+    AMOUNT_INDEX = 2
+    SIDE_INDEX = 3
+    RECENT_TRADES_COLUMNS = (ExchangeConstantsOrderColumns.TIMESTAMP.value,
+                             ExchangeConstantsOrderColumns.PRICE.value,
+                             ExchangeConstantsOrderColumns.AMOUNT.value,
+                             ExchangeConstantsOrderColumns.SIDE.value)
+
+    # side row values
+    BUY_SIDE_VALUE = 1
+    SELL_SIDE_VALUE = -1
+
     def __init__(self):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
-        self.recent_trades = deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
+        self.recent_trades = None
+        self.recent_trades_ids = None
+        self.recent_trades_keys = set()
+        self.recent_trades_index = 0
+        self.reached_max = False
+        self._recent_trades_keys_ring = []
         self.liquidations = deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
         self._reset_recent_trades()
 
     async def initialize_impl(self):
         self._reset_recent_trades()
+        self.liquidations = deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+
+    # getters
+    def get_recent_trades_count(self):
+        return self.MAX_RECENT_TRADES_COUNT if self.reached_max else self.recent_trades_index
+
+    def get_recent_trades_timestamps(self, limit=-1):
+        return self._extract_limited_data(self.recent_trades[RecentTradesManager.TIMESTAMP_INDEX], limit)
+
+    def get_recent_trades_prices(self, limit=-1):
+        return self._extract_limited_data(self.recent_trades[RecentTradesManager.PRICE_INDEX], limit)
 
+    def get_recent_trades_amounts(self, limit=-1):
+        return self._extract_limited_data(self.recent_trades[RecentTradesManager.AMOUNT_INDEX], limit)
+
+    def get_recent_trades_sides(self, limit=-1):
+        """
+        :return: BUY_SIDE_VALUE for buy trades, SELL_SIDE_VALUE for sell trades and nan when unknown
+        """
+        return self._extract_limited_data(self.recent_trades[RecentTradesManager.SIDE_INDEX], limit)
+
+    def get_recent_trades_ids(self, limit=-1):
+        return self._extract_limited_data(self.recent_trades_ids, limit)
+
+    # setters
     def set_all_recent_trades(self, recent_trades):
         if recent_trades:
-            self.recent_trades = list(set(recent_trades))
-            return self.recent_trades
+            self._reset_recent_trades()
+            return self.add_new_trades(recent_trades)
 
     def add_new_trades(self, recent_trades):
         if recent_trades:
-            new_recent_trades: list = [
-                trade
-                for trade in recent_trades
-                if trade not in self.recent_trades]
-            self.recent_trades.extend(new_recent_trades)
+            new_recent_trades: list = []
+            for trade in recent_trades:
+                new_recent_trades += self.add_recent_trade(trade)
             return new_recent_trades
 
     def add_recent_trade(self, recent_trade):
         try:
-            if recent_trade not in self.recent_trades:
-                self.recent_trades.append(recent_trade)
+            trade_key = self._get_trade_key(recent_trade)
+            if trade_key not in self.recent_trades_keys:
+                self._append_recent_trade(recent_trade, trade_key)
                 return [recent_trade]
-        except ValueError as e:
+        except (KeyError, TypeError, ValueError) as e:
             self.logger.error(f"Impossible to add new recent trade ({recent_trade} : {e})")
         return []
 
@@ -65,6 +118,61 @@ class RecentTradesManager(Initializable):
             self.liquidations.extend(new_liquidations)
             return new_liquidations
 
+    # private
+    def _append_recent_trade(self, recent_trade, trade_key):
+        amount = recent_trade.get(ExchangeConstantsOrderColumns.AMOUNT.value, None)
+        values = (
+            float(recent_trade[ExchangeConstantsOrderColumns.TIMESTAMP.value]),
+            float(recent_trade[ExchangeConstantsOrderColumns.PRICE.value]),
+            np.nan if amount is None else float(amount),
+            self._get_side_value(recent_trade.get(ExchangeConstantsOrderColumns.SIDE.value, None))
+        )
+        if self.reached_max:
+            # the oldest trade is at the ring head and is about to be overwritten
+            self.recent_trades_keys.discard(self._recent_trades_keys_ring[self.recent_trades_index])
+        for index in (self.recent_trades_index, self.recent_trades_index + self.MAX_RECENT_TRADES_COUNT):
+            self.recent_trades[:, index] = values
+            self.recent_trades_ids[index] = recent_trade.get(ExchangeConstantsOrderColumns.ID.value, None)
+        self._recent_trades_keys_ring[self.recent_trades_index] = trade_key
+        self.recent_trades_keys.add(trade_key)
+        self.recent_trades_index += 1
+        if self.recent_trades_index == self.MAX_RECENT_TRADES_COUNT:
+            self.recent_trades_index = 0
+            self.reached_max = True
+
+    @staticmethod
+    def _get_trade_key(recent_trade):
+        trade_id = recent_trade.get(ExchangeConstantsOrderColumns.ID.value, None)
+        if trade_id is not None:
+            return trade_id
+        return tuple(recent_trade.get(column, None) for column in RecentTradesManager.RECENT_TRADES_COLUMNS)
+
+    @staticmethod
+    def _get_side_value(side):
+        if side == TradeOrderSide.BUY.value:
+            return RecentTradesManager.BUY_SIDE_VALUE
+        if side == TradeOrderSide.SELL.value:
+            return RecentTradesManager.SELL_SIDE_VALUE
+        return np.nan
+
+    def _extract_limited_data(self, data, limit=-1):
+        """
+        :return: a read-only view on the last "limit" trades (all trades when limit is -1) of data
+        """
+        recent_trades_count: int = self.get_recent_trades_count()
+        if limit == -1 or limit > recent_trades_count:
+            limit = recent_trades_count
+        end_index: int = self.recent_trades_index + self.MAX_RECENT_TRADES_COUNT
+        view = data[end_index - limit:end_index]
+        view.flags.writeable = False
+        return view
+
     def _reset_recent_trades(self):
-        self.recent_trades = deque(maxlen=self.MAX_RECENT_TRADES_COUNT)
-        self.liquidations = deque(maxlen=self.MAX_LIQUIDATIONS_COUNT)
+        self.recent_trades = np.full((len(RecentTradesManager.RECENT_TRADES_COLUMNS),
+                                      2 * self.MAX_RECENT_TRADES_COUNT),
+                                     fill_value=np.nan, dtype=np.float64)
+        self.recent_trades_ids = np.full(2 * self.MAX_RECENT_TRADES_COUNT, fill_value=None, dtype=object)
+        self._recent_trades_keys_ring = [None] * self.MAX_RECENT_TRADES_COUNT
+        self.recent_trades_keys = set()
+        self.recent_trades_index = 0
+        self.reached_max = False
@@ -14,17 +14,25 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from octobot_trading.data_manager.market_snapshot_table cimport MarketSnapshotTable
 from octobot_trading.util.initializable cimport Initializable
 
+cimport numpy as np
+np.import_array()
 
 cdef class TickerManager(Initializable):
     cdef object logger
 
-    cdef public dict ticker
-    cdef public dict mini_ticker
+    cdef public str symbol
+    cdef public MarketSnapshotTable market_snapshot_table
+    cdef public int ticker_row
+    cdef public np.ndarray mini_ticker_values
 
     cdef void reset_ticker(self)
     cdef void reset_mini_ticker(self)
 
     cpdef void ticker_update(self, dict ticker)
     cpdef void mini_ticker_update(self, dict mini_ticker)
+    cpdef double get_ticker_value(self, str column)
+    cpdef dict get_ticker(self)
+    cpdef dict get_mini_ticker(self)
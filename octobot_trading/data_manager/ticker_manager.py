@@ -13,19 +13,38 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-from math import nan
+import numpy as np
+
 from octobot_commons.logging.logging_util import get_logger
 
+from octobot_trading.data_manager.market_snapshot_table import MarketSnapshotTable
 from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsMiniTickerColumns
 from octobot_trading.util.initializable import Initializable
 
 
 class TickerManager(Initializable):
-    def __init__(self):
+    """
+    Stores the symbol ticker in its row of the exchange MarketSnapshotTable and the mini ticker in a float64 row
+    """
+    MINI_TICKER_COLUMNS = (
+        ExchangeConstantsMiniTickerColumns.OPEN_PRICE.value,
+        ExchangeConstantsMiniTickerColumns.HIGH_PRICE.value,
+        ExchangeConstantsMiniTickerColumns.LOW_PRICE.value,
+        ExchangeConstantsMiniTickerColumns.CLOSE_PRICE.value,
+        ExchangeConstantsMiniTickerColumns.VOLUME.value,
+        ExchangeConstantsMiniTickerColumns.TIMESTAMP.value,
+    )
+    MINI_TICKER_COLUMN_INDEXES = {column: index for index, column in enumerate(MINI_TICKER_COLUMNS)}
+
+    def __init__(self, symbol=None, market_snapshot_table=None):
         super().__init__()
         self.logger = get_logger(self.__class__.__name__)
-        self.ticker = {}
-        self.mini_ticker = {}
+        self.symbol = symbol
+        self.market_snapshot_table = MarketSnapshotTable() if market_snapshot_table is None \
+            else market_snapshot_table
+        self.ticker_row = self.market_snapshot_table.get_symbol_row(symbol)
+        self.mini_ticker_values = np.full(len(TickerManager.MINI_TICKER_COLUMNS), fill_value=np.nan,
+                                          dtype=np.float64)
         self.reset_ticker()
         self.reset_mini_ticker()
 
@@ -33,36 +52,62 @@ class TickerManager(Initializable):
         self.reset_ticker()
         self.reset_mini_ticker()
 
+    @property
+    def ticker(self):
+        """
+        :return: a ticker dict built from the stored values, updates are made with ticker_update
+        """
+        return self.get_ticker()
+
+    @property
+    def mini_ticker(self):
+        """
+        :return: a mini ticker dict built from the stored values, updates are made with mini_ticker_update
+        """
+        return self.get_mini_ticker()
+
     def reset_mini_ticker(self):
-        self.mini_ticker = {
-            ExchangeConstantsMiniTickerColumns.HIGH_PRICE.value: nan,
-            ExchangeConstantsMiniTickerColumns.LOW_PRICE.value: nan,
-            ExchangeConstantsMiniTickerColumns.OPEN_PRICE.value: nan,
-            ExchangeConstantsMiniTickerColumns.CLOSE_PRICE.value: nan,
-            ExchangeConstantsMiniTickerColumns.VOLUME.value: nan,
-            ExchangeConstantsMiniTickerColumns.TIMESTAMP.value: 0
-        }
+        self.mini_ticker_values[:] = np.nan
+        self.mini_ticker_values[
+            TickerManager.MINI_TICKER_COLUMN_INDEXES[ExchangeConstantsMiniTickerColumns.TIMESTAMP.value]] = 0
 
     def reset_ticker(self):
-        self.ticker = {
-            ExchangeConstantsTickersColumns.ASK.value: nan,
-            ExchangeConstantsTickersColumns.ASK_VOLUME.value: nan,
-            ExchangeConstantsTickersColumns.BID.value: nan,
-            ExchangeConstantsTickersColumns.BID_VOLUME.value: nan,
-            ExchangeConstantsTickersColumns.OPEN.value: nan,
-            ExchangeConstantsTickersColumns.LOW.value: nan,
-            ExchangeConstantsTickersColumns.HIGH.value: nan,
-            ExchangeConstantsTickersColumns.CLOSE.value: nan,
-            ExchangeConstantsTickersColumns.LAST.value: nan,
-            ExchangeConstantsTickersColumns.AVERAGE.value: nan,
-            ExchangeConstantsTickersColumns.SYMBOL.value: nan,
-            ExchangeConstantsTickersColumns.QUOTE_VOLUME.value: nan,
-            ExchangeConstantsTickersColumns.TIMESTAMP.value: 0,
-            ExchangeConstantsTickersColumns.VWAP.value: nan
-        }
+        self.market_snapshot_table.reset_row(self.ticker_row, MarketSnapshotTable.TICKER_COLUMNS)
 
     def ticker_update(self, ticker):
-        self.ticker.update(ticker)
+        try:
+            self.market_snapshot_table.update_row(self.ticker_row, ticker)
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Fail to update ticker with {ticker} : {e}")
 
     def mini_ticker_update(self, mini_ticker):
-        self.mini_ticker.update(mini_ticker)
+        try:
+            for column, value in mini_ticker.items():
+                if column in TickerManager.MINI_TICKER_COLUMN_INDEXES:
+                    self.mini_ticker_values[TickerManager.MINI_TICKER_COLUMN_INDEXES[column]] = \
+                        np.nan if value is None else value
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"Fail to update mini ticker with {mini_ticker} : {e}")
+
+    def get_ticker_value(self, column):
+        """
+        :param column: a MarketSnapshotTable.TICKER_COLUMNS column
+        """
+        return self.market_snapshot_table.get_row_value(self.ticker_row, column)
+
+    def get_ticker(self):
+        """
+        :return: a ticker dict built from the stored values
+        """
+        ticker = dict(zip(MarketSnapshotTable.TICKER_COLUMNS,
+                          self.market_snapshot_table.values[self.ticker_row].tolist()))
+        ticker[ExchangeConstantsTickersColumns.SYMBOL.value] = self.symbol
+        return ticker
+
+    def get_mini_ticker(self):
+        """
+        :return: a mini ticker dict built from the stored values
+        """
+        mini_ticker = dict(zip(TickerManager.MINI_TICKER_COLUMNS, self.mini_ticker_values.tolist()))
+        mini_ticker[ExchangeConstantsMiniTickerColumns.SYMBOL.value] = self.symbol
+        return mini_ticker
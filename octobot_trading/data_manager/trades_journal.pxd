@@ -0,0 +1,33 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+cdef class TradesJournal:
+    cdef object logger
+    cdef object connection
+
+    cdef public str journal_path
+    cdef public list pending_trades
+    cdef public double last_flush_time
+
+    cpdef void add_trade(self, dict trade_dict)
+    cpdef int flush(self)
+    cpdef bint has_trade(self, str trade_id)
+    cpdef list get_trades(self, str symbol=*, object since=*, object limit=*)
+    cpdef int get_trades_count(self)
+    cpdef dict get_paid_fees(self)
+    cpdef void close(self)
+    cdef void _create_tables(self)
@@ -0,0 +1,143 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import json
+import os
+import sqlite3
+import time
+
+from octobot_commons.logging.logging_util import get_logger
+
+from octobot_trading.enums import ExchangeConstantsOrderColumns, FeePropertyColumns
+
+
+class TradesJournal:
+    """
+    Append-only SQLite journal of trade dicts (as returned by Trade.to_dict).
+    An empty journal_path uses a private temporary on-disk database that is deleted when the journal is closed.
+    Added trades are buffered and written in a single transaction every FLUSH_SIZE trades, FLUSH_INTERVAL seconds
+    after the previous write or before any read, already journaled trades are ignored.
+    """
+    TRADES_TABLE = "trades"
+    FLUSH_SIZE = 100
+    FLUSH_INTERVAL = 10
+
+    def __init__(self, journal_path=""):
+        self.logger = get_logger(self.__class__.__name__)
+        self.journal_path = journal_path
+        if self.journal_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.journal_path)
+        self.pending_trades = []
+        self.last_flush_time = time.time()
+        self._create_tables()
+
+    def add_trade(self, trade_dict):
+        """
+        Appends trade_dict to the journal, it is written on the next flush
+        :param trade_dict: the trade dict to store
+        """
+        fee = trade_dict.get(ExchangeConstantsOrderColumns.FEE.value) or {}
+        self.pending_trades.append((str(trade_dict[ExchangeConstantsOrderColumns.ID.value]),
+                                    trade_dict.get(ExchangeConstantsOrderColumns.SYMBOL.value),
+                                    trade_dict.get(ExchangeConstantsOrderColumns.TIMESTAMP.value),
+                                    fee.get(FeePropertyColumns.CURRENCY.value),
+                                    fee.get(FeePropertyColumns.COST.value),
+                                    json.dumps(trade_dict, default=str)))
+        if len(self.pending_trades) >= self.FLUSH_SIZE or time.time() - self.last_flush_time >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the pending trades to the journal
+        :return: the count of written trades, without the already journaled ones
+        """
+        self.last_flush_time = time.time()
+        if not self.pending_trades:
+            return 0
+        pending_trades, self.pending_trades = self.pending_trades, []
+        try:
+            total_changes = self.connection.total_changes
+            with self.connection:
+                self.connection.executemany(
+                    f"INSERT OR IGNORE INTO {self.TRADES_TABLE} "
+                    f"(trade_id, symbol, timestamp, fee_currency, fee_cost, trade) VALUES (?, ?, ?, ?, ?, ?)",
+                    pending_trades)
+            return self.connection.total_changes - total_changes
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to store {len(pending_trades)} trades in "
+                              f"{self.journal_path or 'temporary'} journal: {e}")
+            return 0
+
+    def has_trade(self, trade_id):
+        self.flush()
+        return self.connection.execute(f"SELECT 1 FROM {self.TRADES_TABLE} WHERE trade_id = ?",
+                                       (trade_id,)).fetchone() is not None
+
+    def get_trades(self, symbol=None, since=None, limit=None):
+        """
+        :param symbol: only select trades of this symbol when given
+        :param since: only select trades which timestamp is greater than since when given
+        :param limit: only select the limit most recent trades when given
+        :return: the time sorted trade dicts
+        """
+        self.flush()
+        conditions, parameters = [], []
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            parameters.append(symbol)
+        if since is not None:
+            conditions.append("timestamp > ?")
+            parameters.append(since)
+        query = f"SELECT trade FROM {self.TRADES_TABLE}"
+        if conditions:
+            query += f" WHERE {' AND '.join(conditions)}"
+        query += " ORDER BY timestamp DESC, row_id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+        return [json.loads(trade) for trade, in reversed(self.connection.execute(query, parameters).fetchall())]
+
+    def get_trades_count(self):
+        self.flush()
+        return self.connection.execute(f"SELECT COUNT(*) FROM {self.TRADES_TABLE}").fetchone()[0]
+
+    def get_paid_fees(self):
+        """
+        :return: the total paid fees of journaled trades by currency
+        """
+        self.flush()
+        return dict(self.connection.execute(f"SELECT fee_currency, SUM(fee_cost) FROM {self.TRADES_TABLE} "
+                                            f"WHERE fee_currency IS NOT NULL AND fee_cost IS NOT NULL "
+                                            f"GROUP BY fee_currency").fetchall())
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def _create_tables(self):
+        with self.connection:
+            self.connection.execute(f"CREATE TABLE IF NOT EXISTS {self.TRADES_TABLE} ("
+                                    f"row_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                                    f"trade_id TEXT NOT NULL UNIQUE, "
+                                    f"symbol TEXT, "
+                                    f"timestamp REAL, "
+                                    f"fee_currency TEXT, "
+                                    f"fee_cost REAL, "
+                                    f"trade TEXT NOT NULL)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {self.TRADES_TABLE}_symbol_timestamp "
+                                    f"ON {self.TRADES_TABLE} (symbol, timestamp)")
+            self.connection.execute(f"CREATE INDEX IF NOT EXISTS {self.TRADES_TABLE}_timestamp "
+                                    f"ON {self.TRADES_TABLE} (timestamp)")
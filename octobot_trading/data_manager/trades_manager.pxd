@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from octobot_trading.data.trade cimport Trade
+from octobot_trading.data_manager.trades_journal cimport TradesJournal
 from octobot_trading.util.initializable cimport Initializable
 
 
@@ -24,11 +25,17 @@ cdef class TradesManager(Initializable):
     cdef object trader
 
     cdef public object trades
+    cdef public TradesJournal trades_journal
+    cdef public dict total_paid_fees
 
     cdef dict config
 
     cdef public bint trades_initialized
 
+    cdef void _add_trade(self, str trade_id, Trade trade)
+    cdef void _load_journaled_trades(self)
+    cdef void _add_paid_fees(self, Trade trade)
+    cdef str _get_trades_journal_path(self)
     cdef void _check_trades_size(self)
     cdef void _reset_trades(self)
     cdef void _remove_oldest_trades(self, int nb_to_remove)
@@ -37,4 +44,5 @@ cdef class TradesManager(Initializable):
     cpdef bint upsert_trade(self, str trade_id, dict raw_trade)
     cpdef void upsert_trade_instance(self, Trade trade)
     cpdef dict get_total_paid_fees(self)
+    cpdef list get_trades_history(self, str symbol=*, object since=*, object limit=*)
     cpdef void clear(self)
@@ -13,16 +13,26 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import os
 from collections import OrderedDict
 
 from octobot_commons.logging.logging_util import get_logger
 
+from octobot_trading.constants import CONFIG_TRADES_HISTORY, CONFIG_TRADES_HISTORY_STORAGE_PATH, \
+    TRADES_HISTORY_FILE_EXTENSION
+from octobot_trading.data_manager.trades_journal import TradesJournal
 from octobot_trading.enums import FeePropertyColumns
 from octobot_trading.trades.trade_factory import create_trade_instance_from_raw
 from octobot_trading.util.initializable import Initializable
 
 
 class TradesManager(Initializable):
+    """
+    Keeps the MAX_TRADES_COUNT most recent trades in memory and appends every trade to a TradesJournal
+    holding the full trades history. On initialization, the most recent journaled trades are loaded back in memory.
+    Paid fees are the fees of every trade of the trades history: they are loaded from the journal on initialization
+    and totalled as trades are added.
+    """
     MAX_TRADES_COUNT = 500
 
     def __init__(self, config, trader, exchange_manager):
@@ -31,43 +41,77 @@ class TradesManager(Initializable):
         self.config, self.trader, self.exchange_manager = config, trader, exchange_manager
         self.trades_initialized = False
         self.trades = OrderedDict()
+        self.trades_journal = None
+        self.total_paid_fees = {}
 
     async def initialize_impl(self):
         self._reset_trades()
+        if self.trades_journal is None:
+            self.trades_journal = TradesJournal(self._get_trades_journal_path())
+        self._load_journaled_trades()
         self.trades_initialized = True
 
     def upsert_trade(self, trade_id, raw_trade):
         if trade_id not in self.trades:
             created_trade = create_trade_instance_from_raw(self.trader, raw_trade)
             if created_trade:
-                self.trades[trade_id] = created_trade
-                self._check_trades_size()
+                self._add_trade(trade_id, created_trade)
                 return True
         return False
 
     def upsert_trade_instance(self, trade):
         if trade.trade_id not in self.trades:
-            self.trades[trade.trade_id] = trade
-            self._check_trades_size()
+            self._add_trade(trade.trade_id, trade)
 
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[FeePropertyColumns.CURRENCY.value]
-                if fee_currency in total_fees:
-                    total_fees[fee_currency] += fee_cost
-                else:
-                    total_fees[fee_currency] = fee_cost
-            else:
-                self.logger.warning(f"Trade without any registered fee: {trade}")
-        return total_fees
+        return dict(self.total_paid_fees)
 
     def get_trade(self, trade_id):
         return self.trades[trade_id]
 
+    def get_trades_history(self, symbol=None, since=None, limit=None):
+        """
+        :return: the time sorted trade dicts of the full trades history, including trades that are no longer
+        kept in memory
+        """
+        if self.trades_journal is None:
+            return []
+        return self.trades_journal.get_trades(symbol, since, limit)
+
     # private
+    def _add_trade(self, trade_id, trade):
+        self.trades[trade_id] = trade
+        if self.trades_journal is not None:
+            self.trades_journal.add_trade(trade.to_dict())
+        self._add_paid_fees(trade)
+        self._check_trades_size()
+
+    def _load_journaled_trades(self):
+        # journaled trades are already in the journal: only load them and their fees
+        for trade_dict in self.trades_journal.get_trades(None, None, self.MAX_TRADES_COUNT):
+            trade = create_trade_instance_from_raw(self.trader, trade_dict)
+            if trade:
+                self.trades[trade.trade_id] = trade
+        self.total_paid_fees = self.trades_journal.get_paid_fees()
+
+    def _add_paid_fees(self, trade):
+        if trade.fee is not None:
+            fee_cost = trade.fee[FeePropertyColumns.COST.value]
+            fee_currency = trade.fee[FeePropertyColumns.CURRENCY.value]
+            self.total_paid_fees[fee_currency] = self.total_paid_fees.get(fee_currency, 0) + fee_cost
+        else:
+            self.logger.warning(f"Trade without any registered fee: {trade}")
+
+    def _get_trades_journal_path(self):
+        storage_path = self.config.get(CONFIG_TRADES_HISTORY, {}).get(CONFIG_TRADES_HISTORY_STORAGE_PATH, None)
+        if storage_path is None or self.exchange_manager.is_backtesting:
+            # temporary journal: the full history is still kept out of memory until this manager is cleared,
+            # backtesting runs never share their trades history
+            return ""
+        simulated_suffix = "_simulated" if self.trader.simulate else ""
+        return os.path.join(storage_path,
+                            f"{self.exchange_manager.exchange_name}{simulated_suffix}{TRADES_HISTORY_FILE_EXTENSION}")
+
     def _check_trades_size(self):
         if len(self.trades) > self.MAX_TRADES_COUNT:
             self._remove_oldest_trades(int(self.MAX_TRADES_COUNT / 2))
@@ -75,8 +119,10 @@ class TradesManager(Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = OrderedDict()
+        self.total_paid_fees = {}
 
     def _remove_oldest_trades(self, nb_to_remove):
+        # removed trades remain available in the trades journal
         for _ in range(nb_to_remove):
             self.trades.popitem(last=False)
 
@@ -85,3 +131,6 @@ class TradesManager(Initializable):
             trade.trader = None
             trade.exchange_manager = None
         self._reset_trades()
+        if self.trades_journal is not None:
+            self.trades_journal.close()
+            self.trades_journal = None
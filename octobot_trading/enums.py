@@ -51,6 +51,12 @@ class EvaluatorStates(Enum):
     NEUTRAL = "NEUTRAL"
 
 
+class OrderTriggerDirection(Enum):
+    PRICE_FALLING = "price_falling"  # simulated fill when a price is lower than the order price
+    PRICE_RISING = "price_rising"  # simulated fill when a price is higher than the order price
+    ANY_PRICE = "any_price"  # simulated fill is checked on every price update
+
+
 class OrderStatus(Enum):
     OPEN = "open"
     PARTIALLY_FILLED = "partially_filled"
@@ -92,6 +98,14 @@ class ExchangeConstantsMarkPriceColumns(Enum):
     MARK_PRICE = "mark_price"
 
 
+class ExchangeConstantsMarketSnapshotColumns(Enum):
+    MARK_PRICE = "mark_price"
+    MARK_PRICE_TIMESTAMP = "mark_price_timestamp"
+    FUNDING_RATE = "funding_rate"
+    NEXT_FUNDING_TIME = "next_funding_time"
+    LAST_FUNDING_TIME = "last_funding_time"
+
+
 class ExchangeConstantsTickersColumns(Enum):
     SYMBOL = "symbol"
     TIMESTAMP = "timestamp"
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from octobot_trading.data_manager.funding_manager cimport FundingManager
+from octobot_trading.data_manager.market_snapshot_table cimport MarketSnapshotTable
 from octobot_trading.data_manager.order_book_manager cimport OrderBookManager
 from octobot_trading.data_manager.prices_manager cimport PricesManager
 from octobot_trading.data_manager.recent_trades_manager cimport RecentTradesManager
@@ -35,8 +36,14 @@ cdef class ExchangeSymbolData:
     cdef public TickerManager ticker_manager
     cdef public FundingManager funding_manager
 
+    cdef public MarketSnapshotTable market_snapshot_table
+    cdef public int market_snapshot_row
+
+    cpdef list get_aggregated_candles(self, object source_time_frame, object time_frame)
+    cpdef long get_memory_size(self)
     cpdef list handle_recent_trade_update(self, object recent_trades, bint replace_all=*, bint partial=*) # recent trades can be list or dict
     cpdef void handle_order_book_update(self, list asks, list bids)
+    cpdef void handle_order_book_delta(self, list asks, list bids)
     cpdef void handle_order_book_ticker_update(self, double ask_quantity, double ask_price,
                                                double bid_quantity, double bid_price)
     cpdef void handle_mark_price_update(self, double mark_price)
@@ -13,9 +13,15 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import time
 
+import numpy as np
+
+from octobot_commons.constants import MINUTE_TO_SECONDS
+from octobot_commons.enums import TimeFramesMinutes, PriceIndexes
 from octobot_commons.logging.logging_util import get_logger
 
+from octobot_trading.data_adapters.candles_aggregation import aggregate_candles
 from octobot_trading.data_manager.candles_manager import CandlesManager
 from octobot_trading.data_manager.funding_manager import FundingManager
 from octobot_trading.data_manager.kline_manager import KlineManager
@@ -23,6 +29,7 @@ from octobot_trading.data_manager.order_book_manager import OrderBookManager
 from octobot_trading.data_manager.prices_manager import PricesManager
 from octobot_trading.data_manager.recent_trades_manager import RecentTradesManager
 from octobot_trading.data_manager.ticker_manager import TickerManager
+from octobot_trading.enums import ExchangeConstantsMarketSnapshotColumns, ExchangeConstantsTickersColumns
 
 
 class ExchangeSymbolData:
@@ -36,7 +43,10 @@ class ExchangeSymbolData:
         self.order_book_manager = OrderBookManager()
         self.prices_manager = PricesManager()
         self.recent_trades_manager = RecentTradesManager()
-        self.ticker_manager = TickerManager()
+        # this symbol's row in the exchange market snapshot table
+        self.market_snapshot_table = self.exchange_manager.exchange_symbols_data.market_snapshot_table
+        self.market_snapshot_row = self.market_snapshot_table.get_symbol_row(self.symbol)
+        self.ticker_manager = TickerManager(symbol=self.symbol, market_snapshot_table=self.market_snapshot_table)
         self.funding_manager = FundingManager() if self.exchange_manager.is_margin else None
 
         self.symbol_candles = {}
@@ -49,7 +59,9 @@ class ExchangeSymbolData:
         try:
             symbol_candles = self.symbol_candles[time_frame]
         except KeyError:
-            symbol_candles = CandlesManager()
+            symbol_candles = CandlesManager(
+                max_candles_count=self.exchange_manager.exchange_symbols_data.get_candles_history_size(self.symbol,
+                                                                                                     time_frame))
             await symbol_candles.initialize()
 
             if replace_all:
@@ -57,6 +69,8 @@ class ExchangeSymbolData:
             else:
                 pass  # TODO ask exchange to init
 
+            if time_frame in self.symbol_klines:
+                symbol_candles.set_in_construction_candle(self.symbol_klines[time_frame].kline)
             self.symbol_candles[time_frame] = symbol_candles
             return
 
@@ -67,6 +81,36 @@ class ExchangeSymbolData:
         else:
             symbol_candles.add_new_candle(new_symbol_candles_data)
 
+    def get_aggregated_candles(self, source_time_frame, time_frame):
+        """
+        Builds time_frame candles from the source_time_frame candles that are following the last time_frame candle,
+        periods which source_time_frame candles are not all available are skipped
+        :param source_time_frame: the time frame to build candles from (should be the smallest traded one)
+        :param time_frame: the time frame to build candles for
+        :return: the list of the new completed time_frame candles
+        """
+        try:
+            last_candle_time = self.symbol_candles[time_frame].get_last_candle_time()
+        except KeyError:
+            last_candle_time = np.nan
+        source_candles = self.symbol_candles[source_time_frame].get_candles()
+        if np.isnan(last_candle_time):
+            first_candle_index = 0
+        else:
+            first_candle_index = int(np.searchsorted(source_candles[PriceIndexes.IND_PRICE_TIME.value],
+                                                     last_candle_time
+                                                     + TimeFramesMinutes[time_frame] * MINUTE_TO_SECONDS))
+        return aggregate_candles(source_candles[:, first_candle_index:], source_time_frame, time_frame).T.tolist()
+
+    def get_memory_size(self):
+        """
+        :return: the bytes used by stored candles
+        """
+        memory_size = 0
+        for symbol_candles in self.symbol_candles.values():
+            memory_size += symbol_candles.get_memory_size()
+        return memory_size
+
     def handle_recent_trade_update(self, recent_trades, replace_all=False, partial=False):
         if partial:
             # TODO check if initialized
@@ -83,12 +127,25 @@ class ExchangeSymbolData:
 
     def handle_mark_price_update(self, mark_price):
         self.prices_manager.set_mark_price(mark_price)
+        self.market_snapshot_table.update_row(self.market_snapshot_row, {
+            ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value: mark_price,
+            ExchangeConstantsMarketSnapshotColumns.MARK_PRICE_TIMESTAMP.value: time.time()
+        })
 
     def handle_order_book_update(self, asks, bids):
         self.order_book_manager.order_book_update(asks, bids)
 
+    def handle_order_book_delta(self, asks, bids):
+        self.order_book_manager.order_book_delta_update(asks, bids)
+
     def handle_order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.order_book_manager.order_book_ticker_update(ask_quantity, ask_price, bid_quantity, bid_price)
+        self.market_snapshot_table.update_row(self.market_snapshot_row, {
+            ExchangeConstantsTickersColumns.ASK.value: ask_price,
+            ExchangeConstantsTickersColumns.ASK_VOLUME.value: ask_quantity,
+            ExchangeConstantsTickersColumns.BID.value: bid_price,
+            ExchangeConstantsTickersColumns.BID_VOLUME.value: bid_quantity
+        })
 
     def handle_ticker_update(self, ticker):
         self.ticker_manager.ticker_update(ticker)
@@ -110,7 +167,17 @@ class ExchangeSymbolData:
                 return
 
         symbol_klines.kline_update(kline)
+        try:
+            # keep the candles in construction candle view up to date
+            self.symbol_candles[time_frame].set_in_construction_candle(symbol_klines.kline)
+        except KeyError:
+            pass
 
     async def handle_funding_update(self, funding_rate, next_funding_time, timestamp):
         if self.funding_manager:
             self.funding_manager.funding_update(funding_rate, next_funding_time, timestamp)
+            self.market_snapshot_table.update_row(self.market_snapshot_row, {
+                ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value: self.funding_manager.funding_rate,
+                ExchangeConstantsMarketSnapshotColumns.NEXT_FUNDING_TIME.value: self.funding_manager.next_updated,
+                ExchangeConstantsMarketSnapshotColumns.LAST_FUNDING_TIME.value: self.funding_manager.last_updated
+            })
@@ -14,6 +14,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+from octobot_trading.data_manager.market_snapshot_table cimport MarketSnapshotTable
 from octobot_trading.exchanges.abstract_exchange cimport AbstractExchange
 from octobot_trading.exchanges.data.exchange_symbol_data cimport ExchangeSymbolData
 from octobot_trading.exchanges.exchange_manager cimport ExchangeManager
@@ -23,8 +24,19 @@ cdef class ExchangeSymbolsData:
 
     cdef public dict exchange_symbol_data
     cdef public dict config
+    cdef public dict candles_history_sizes
+    cdef public MarketSnapshotTable market_snapshot_table
 
     cdef public AbstractExchange exchange
     cdef public ExchangeManager exchange_manager
 
     cpdef public ExchangeSymbolData get_exchange_symbol_data(self, str symbol, bint allow_creation=*)
+    cpdef tuple get_last_prices(self)
+    cpdef tuple get_market_snapshot(self, object columns=*)
+    cpdef dict get_memory_usage(self)
+    cpdef int get_candles_history_size(self, str symbol, object time_frame)
+    cpdef object get_configured_candles_history_size(self, object time_frame)
+
+    cdef void _allocate_candles_history(self)
+    cdef int _get_candles_history_size(self, object time_frame)
+    cdef object _get_candles_history_memory_budget(self)
@@ -14,8 +14,14 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot_commons.enums import TimeFrames
 from octobot_commons.logging.logging_util import get_logger
 
+from octobot_trading.constants import CONFIG_CANDLES_HISTORY, CONFIG_CANDLES_HISTORY_TIME_FRAMES, \
+    CONFIG_CANDLES_HISTORY_MEMORY_BUDGET, MIN_CANDLES_HISTORY_SIZE
+from octobot_trading.data_manager.candles_manager import CandlesManager
+from octobot_trading.data_manager.market_snapshot_table import MarketSnapshotTable
+from octobot_trading.enums import ExchangeConstantsTickersColumns
 from octobot_trading.exchanges.data.exchange_symbol_data import ExchangeSymbolData
 
 
@@ -27,6 +33,12 @@ class ExchangeSymbolsData:
         self.config = exchange_manager.config
         self.exchange_symbol_data = {}
 
+        # ticker, mark price and funding of every symbol
+        self.market_snapshot_table = MarketSnapshotTable()
+
+        # {symbol: {time_frame: candles count}}
+        self.candles_history_sizes = {}
+
     def get_exchange_symbol_data(self, symbol, allow_creation=True):
         try:
             return self.exchange_symbol_data[symbol]
@@ -36,3 +48,103 @@ class ExchangeSymbolsData:
                 self.exchange_symbol_data[symbol] = ExchangeSymbolData(self.exchange_manager, symbol)
                 return self.exchange_symbol_data[symbol]
             raise e
+
+    def get_last_prices(self):
+        """
+        :return: the symbols list and the read-only array of their last price (ordered like the symbols list)
+        """
+        return self.market_snapshot_table.symbols, \
+            self.market_snapshot_table.get_column(ExchangeConstantsTickersColumns.LAST.value)
+
+    def get_market_snapshot(self, columns=MarketSnapshotTable.COLUMNS):
+        """
+        :param columns: MarketSnapshotTable.COLUMNS columns to get
+        :return: the symbols list and a dict of column: read-only array of the symbols values (ordered like the
+        symbols list)
+        """
+        return self.market_snapshot_table.symbols, self.market_snapshot_table.get_columns(tuple(columns))
+
+    def get_memory_usage(self):
+        """
+        :return: the bytes used by stored candles of each symbol
+        """
+        return {
+            symbol: symbol_data.get_memory_size()
+            for symbol, symbol_data in self.exchange_symbol_data.items()
+        }
+
+    def get_candles_history_size(self, symbol, time_frame):
+        """
+        :return: the candles count to keep for symbol on time_frame
+        """
+        time_frame = TimeFrames(time_frame)
+        if symbol not in self.candles_history_sizes \
+                and symbol in self.exchange_manager.exchange_config.traded_symbol_pairs:
+            self._allocate_candles_history()
+        try:
+            return self.candles_history_sizes[symbol][time_frame]
+        except KeyError:
+            # not traded symbol or time frame: use the minimal history when a memory budget is set
+            configured_size = self._get_candles_history_size(time_frame)
+            if self._get_candles_history_memory_budget() is None:
+                return configured_size
+            return min(configured_size, MIN_CANDLES_HISTORY_SIZE)
+
+    def get_configured_candles_history_size(self, time_frame):
+        """
+        :return: the configured candles count for time_frame, None when not configured
+        """
+        return self.config.get(CONFIG_CANDLES_HISTORY, {}) \
+            .get(CONFIG_CANDLES_HISTORY_TIME_FRAMES, {}) \
+            .get(TimeFrames(time_frame).value, None)
+
+    def _allocate_candles_history(self):
+        """
+        Gives every traded symbol its configured candles history size on each traded time frame.
+        When the configured memory budget is too small for every history, each symbol first gets up to
+        MIN_CANDLES_HISTORY_SIZE candles per time frame then the remaining budget is allocated
+        in traded pairs order (first pairs have the highest priority).
+        """
+        time_frames = self.exchange_manager.exchange_config.traded_time_frames
+        symbols = self.exchange_manager.exchange_config.traded_symbol_pairs
+        wanted_sizes = {time_frame: self._get_candles_history_size(time_frame) for time_frame in time_frames}
+        memory_budget = self._get_candles_history_memory_budget()
+        if memory_budget is None:
+            self.candles_history_sizes = {symbol: dict(wanted_sizes) for symbol in symbols}
+            return
+
+        min_sizes = {time_frame: min(size, MIN_CANDLES_HISTORY_SIZE) for time_frame, size in wanted_sizes.items()}
+        extra_cost = self._get_candles_history_memory_size(wanted_sizes) - \
+            self._get_candles_history_memory_size(min_sizes)
+        remaining_budget = memory_budget - len(symbols) * self._get_candles_history_memory_size(min_sizes)
+        if remaining_budget < 0:
+            self.logger.warning(f"Candles history memory budget ({memory_budget} bytes) is too small to store "
+                                f"{MIN_CANDLES_HISTORY_SIZE} candles per time frame for {len(symbols)} symbols.")
+        self.candles_history_sizes = {}
+        for symbol in symbols:
+            if extra_cost <= remaining_budget:
+                self.candles_history_sizes[symbol] = dict(wanted_sizes)
+                remaining_budget -= extra_cost
+            else:
+                extra_ratio = max(remaining_budget, 0) / extra_cost
+                self.candles_history_sizes[symbol] = {
+                    time_frame: min_sizes[time_frame] + int((wanted_sizes[time_frame] - min_sizes[time_frame])
+                                                            * extra_ratio)
+                    for time_frame in time_frames
+                }
+                remaining_budget = 0
+
+    def _get_candles_history_size(self, time_frame):
+        configured_size = self.get_configured_candles_history_size(time_frame)
+        return CandlesManager.MAX_CANDLES_COUNT if configured_size is None else configured_size
+
+    def _get_candles_history_memory_budget(self):
+        """
+        :return: the configured candles memory budget in bytes (configured in megabytes), None when not configured
+        """
+        memory_budget = self.config.get(CONFIG_CANDLES_HISTORY, {}).get(CONFIG_CANDLES_HISTORY_MEMORY_BUDGET, None)
+        return None if memory_budget is None else memory_budget * 1024 * 1024
+
+    @staticmethod
+    def _get_candles_history_memory_size(sizes):
+        return sum(CandlesManager.get_candles_memory_size(size) for size in sizes.values())
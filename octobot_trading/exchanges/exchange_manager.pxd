@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot_trading.data.currency_conversion_graph cimport CurrencyConversionGraph
 from octobot_trading.exchanges.abstract_exchange cimport AbstractExchange
 from octobot_trading.exchanges.data.exchange_config_data cimport ExchangeConfig
 from octobot_trading.exchanges.data.exchange_personal_data cimport ExchangePersonalData
@@ -63,6 +64,10 @@ cdef class ExchangeManager(Initializable):
     cdef public list client_time_frames
     cdef public list client_symbols
 
+    cdef dict symbols_quote_and_base
+
+    cdef public CurrencyConversionGraph currency_conversion_graph
+
     # private
     cdef void _load_config_symbols_and_time_frames(self)
     cdef void _load_constants(self)
@@ -83,9 +88,11 @@ cdef class ExchangeManager(Initializable):
     cpdef void reset_exchange_personal_data(self)
     cpdef bint check_config(self, str exchange_name)
     cpdef bint symbol_exists(self, str symbol)
+    cpdef CurrencyConversionGraph get_currency_conversion_graph(self)
     cpdef bint time_frame_exists(self, object time_frame)
     cpdef int get_rate_limit(self)
     cpdef object uniformize_candles_if_necessary(self, object candle_or_candles)
+    cpdef bint is_built_from_recent_trades(self, str channel)
     cpdef str get_exchange_name(self)
     cpdef tuple get_exchange_credentials(self, object logger, str exchange_name)
     cpdef bint should_decrypt_token(self, object logger)
@@ -26,7 +26,8 @@ from octobot_commons.timestamp_util import is_valid_timestamp
 from octobot_trading.channels.exchange_channel import get_exchange_channels, del_chan, set_chan, get_chan, \
     del_exchange_channel_container, ExchangeChannel, TimeFrameExchangeChannel
 from octobot_trading.constants import CONFIG_TRADER, CONFIG_EXCHANGES, CONFIG_EXCHANGE_SECRET, CONFIG_EXCHANGE_KEY, \
-    WEBSOCKET_FEEDS_TO_TRADING_CHANNELS, CONFIG_EXCHANGE_PASSWORD
+    WEBSOCKET_FEEDS_TO_TRADING_CHANNELS, CONFIG_EXCHANGE_PASSWORD, OHLCV_CHANNEL, KLINE_CHANNEL, RECENT_TRADES_CHANNEL
+from octobot_trading.data.currency_conversion_graph import CurrencyConversionGraph
 from octobot_trading.exchanges.data.exchange_config_data import ExchangeConfig
 from octobot_trading.exchanges.data.exchange_personal_data import ExchangePersonalData
 from octobot_trading.exchanges.data.exchange_symbols_data import ExchangeSymbolsData
@@ -37,7 +38,8 @@ from octobot_trading.exchanges.exchange_util import get_margin_exchange_class, g
 from octobot_trading.exchanges.rest_exchange import RestExchange
 from octobot_trading.exchanges.websockets.abstract_websocket import AbstractWebsocket
 from octobot_trading.exchanges.websockets.websockets_util import check_web_socket_config, search_websocket_class
-from octobot_trading.producers import UNAUTHENTICATED_UPDATER_PRODUCERS, AUTHENTICATED_UPDATER_PRODUCERS
+from octobot_trading.producers import UNAUTHENTICATED_UPDATER_PRODUCERS, AUTHENTICATED_UPDATER_PRODUCERS, \
+    OHLCVTradesUpdater
 from octobot_trading.producers.simulator import AUTHENTICATED_UPDATER_SIMULATOR_PRODUCERS
 from octobot_trading.util import is_trader_simulator_enabled
 from octobot_trading.util.initializable import Initializable
@@ -82,6 +84,11 @@ class ExchangeManager(Initializable):
         self.client_symbols = []
         self.client_time_frames = []
 
+        # (quote, base) of each symbol shared by every order, trade and position of the symbol
+        self.symbols_quote_and_base = {}
+
+        self.currency_conversion_graph = None
+
         self.exchange_config = ExchangeConfig(self)
         self.exchange_personal_data = ExchangePersonalData(self)
         self.exchange_symbols_data = ExchangeSymbolsData(self)
@@ -270,8 +277,11 @@ class ExchangeManager(Initializable):
         # Real data producers
         if not self.is_backtesting:
             for updater in UNAUTHENTICATED_UPDATER_PRODUCERS:
-                if not self._is_managed_by_websocket(updater.CHANNEL_NAME):
+                if not self._is_managed_by_websocket(updater.CHANNEL_NAME) and \
+                        not self.is_built_from_recent_trades(updater.CHANNEL_NAME):
                     await updater(get_chan(updater.CHANNEL_NAME, self.id)).run()
+            if self.is_built_from_recent_trades(OHLCV_CHANNEL):
+                await OHLCVTradesUpdater(get_chan(OHLCV_CHANNEL, self.id)).run()
 
         if self.exchange.is_authenticated and not (self.is_simulated or self.is_backtesting or self.is_collecting):
             for updater in AUTHENTICATED_UPDATER_PRODUCERS:
@@ -292,6 +302,15 @@ class ExchangeManager(Initializable):
                any([self.exchange_web_socket.is_feed_available(feed)
                     for feed in WEBSOCKET_FEEDS_TO_TRADING_CHANNELS[channel]])
 
+    def is_built_from_recent_trades(self, channel):
+        """
+        :return: True when channel data is built from the websocket recent trades feed instead of being polled
+        """
+        return channel in (OHLCV_CHANNEL, KLINE_CHANNEL) \
+            and not self._is_managed_by_websocket(OHLCV_CHANNEL) \
+            and not self._is_managed_by_websocket(channel) \
+            and self._is_managed_by_websocket(RECENT_TRADES_CHANNEL)
+
     async def _search_and_create_websocket(self):
         socket_manager = search_websocket_class(AbstractWebsocket, self.exchange_name)
         if socket_manager is not None:
@@ -342,7 +361,13 @@ class ExchangeManager(Initializable):
         return self.exchange.get_pair_from_exchange(symbol)
 
     def get_exchange_quote_and_base(self, symbol):
-        return self.exchange.get_split_pair_from_exchange(symbol)
+        try:
+            return self.symbols_quote_and_base[symbol]
+        except KeyError:
+            quote, base = self.exchange.get_split_pair_from_exchange(symbol)
+            if quote is not None:
+                self.symbols_quote_and_base[symbol] = (quote, base)
+            return quote, base
 
     def _load_config_symbols_and_time_frames(self):
         client = self.exchange.client
@@ -364,6 +389,12 @@ class ExchangeManager(Initializable):
             return False
         return symbol in self.client_symbols
 
+    def get_currency_conversion_graph(self):
+        # client_symbols is replaced each time markets are loaded: rebuild the graph only then
+        if self.currency_conversion_graph is None or self.currency_conversion_graph.symbols is not self.client_symbols:
+            self.currency_conversion_graph = CurrencyConversionGraph(self.client_symbols or [])
+        return self.currency_conversion_graph
+
     # TIME FRAMES
     def time_frame_exists(self, time_frame):
         if not self.client_time_frames:
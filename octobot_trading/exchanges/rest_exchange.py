@@ -432,7 +432,6 @@ class RestExchange(AbstractExchange):
         try:
             recent_trade.pop(ecoc.INFO.value)
             recent_trade.pop(ecoc.DATETIME.value)
-            recent_trade.pop(ecoc.ID.value)
             recent_trade.pop(ecoc.ORDER.value)
             recent_trade.pop(ecoc.FEE.value)
             recent_trade.pop(ecoc.TYPE.value)
@@ -14,15 +14,18 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 from octobot_trading.enums import TradeOrderSide, OrderStatus, ExchangeConstantsMarketPropertyColumns
+from octobot_trading.data.last_prices import LastPrices
 from octobot_trading.data.order import Order
 
 
 class SellMarketOrder(Order):
+    __slots__ = ()
+
     def __init__(self, trader):
         super().__init__(trader)
         self.side = TradeOrderSide.SELL
 
-    async def update_order_status(self, last_prices: list):
+    async def update_order_status(self, last_prices: LastPrices):
         if not self.trader.simulate:
             await self.default_exchange_update_order_status()
         else:
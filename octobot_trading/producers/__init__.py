@@ -27,6 +27,7 @@ from octobot_trading.producers.ticker_updater import TickerUpdater
 from octobot_trading.producers.recent_trade_updater import RecentTradeUpdater
 from octobot_trading.producers.order_book_updater import OrderBookUpdater
 from octobot_trading.producers.ohlcv_updater import OHLCVUpdater
+from octobot_trading.producers.ohlcv_trades_updater import OHLCVTradesUpdater
 
 
 class MissingOrderException(Exception):
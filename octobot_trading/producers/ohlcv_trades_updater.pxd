@@ -0,0 +1,29 @@
+# cython: language_level=3
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+
+from octobot_trading.producers.ohlcv_updater cimport OHLCVUpdater
+from octobot_trading.data_manager.candles_builder cimport CandlesBuilder
+
+
+cdef class OHLCVTradesUpdater(OHLCVUpdater):
+    cdef object recent_trades_consumer
+    cdef bint push_klines
+
+    cdef public dict candles_builders
+
+    cdef CandlesBuilder _get_candles_builder(self, object time_frame, str pair)
+    cdef double _get_last_candle_time(self, object time_frame, str pair)
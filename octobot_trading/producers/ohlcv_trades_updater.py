@@ -0,0 +1,142 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.channels.exchange_channel import get_chan
+from octobot_trading.constants import RECENT_TRADES_CHANNEL, KLINE_CHANNEL
+from octobot_trading.data_manager.candles_builder import CandlesBuilder
+from octobot_trading.enums import ExchangeConstantsOrderColumns
+from octobot_trading.producers.ohlcv_updater import OHLCVUpdater
+
+
+class OHLCVTradesUpdater(OHLCVUpdater):
+    """
+    Builds OHLCV and kline data from the recent trades feed instead of polling candles.
+    Candles are only fetched from REST to initialize history and to repair candles that can't be built from
+    received trades (missed candles and the first partially received candle).
+    """
+    AGGREGATE_TIME_FRAMES = False
+
+    def __init__(self, channel):
+        super().__init__(channel)
+        self.recent_trades_consumer = None
+        self.push_klines = self.channel.exchange_manager.is_built_from_recent_trades(KLINE_CHANNEL)
+
+        # {pair: {time_frame: CandlesBuilder}}
+        self.candles_builders = {}
+
+    async def start(self):
+        """
+        Initializes candles history and subscribes to recent trades
+        """
+        if not self.is_initialized:
+            await self._initialize()
+        self.recent_trades_consumer = await get_chan(RECENT_TRADES_CHANNEL, self.channel.exchange_manager.id) \
+            .new_consumer(self.handle_recent_trades)
+
+    async def stop(self):
+        await super().stop()
+        if self.recent_trades_consumer is not None:
+            await get_chan(RECENT_TRADES_CHANNEL, self.channel.exchange_manager.id) \
+                .remove_consumer(self.recent_trades_consumer)
+            self.recent_trades_consumer = None
+
+    async def _initialize_candles(self, time_frame, pair):
+        in_construction_candle = await super()._initialize_candles(time_frame, pair)
+        candles_builder = self._get_candles_builder(time_frame, pair)
+        if in_construction_candle:
+            candles_builder.set_kline(in_construction_candle)
+        return in_construction_candle
+
+    def _get_candles_builder(self, time_frame, pair):
+        try:
+            return self.candles_builders[pair][time_frame]
+        except KeyError:
+            candles_builder = CandlesBuilder(time_frame)
+            self.candles_builders.setdefault(pair, {})[time_frame] = candles_builder
+            return candles_builder
+
+    async def handle_recent_trades(self, exchange: str, exchange_id: str,
+                                   cryptocurrency: str, symbol: str, recent_trades: list):
+        """
+        Recent trades channel consumer callback
+        """
+        if symbol not in self.candles_builders or not recent_trades:
+            return
+        try:
+            timestamps = np.array([self.channel.exchange_manager.get_uniformized_timestamp(
+                recent_trade[ExchangeConstantsOrderColumns.TIMESTAMP.value])
+                for recent_trade in recent_trades], dtype=np.float64)
+            prices = np.array([recent_trade[ExchangeConstantsOrderColumns.PRICE.value]
+                               for recent_trade in recent_trades], dtype=np.float64)
+            amounts = np.array([recent_trade.get(ExchangeConstantsOrderColumns.AMOUNT.value, None)
+                                for recent_trade in recent_trades], dtype=np.float64)
+            for time_frame, candles_builder in self.candles_builders[symbol].items():
+                closed_candles = candles_builder.add_trades(timestamps, prices, amounts)
+                if closed_candles.shape[1]:
+                    await self._push_closed_candles(time_frame, symbol, candles_builder, closed_candles)
+                if self.push_klines and candles_builder.has_kline():
+                    await get_chan(KLINE_CHANNEL, self.channel.exchange_manager.id).get_internal_producer() \
+                        .push(time_frame, symbol, candles_builder.kline.tolist())
+        except Exception as e:
+            self.logger.exception(e, True, f"Failed to build candles for {symbol} from recent trades : {e}")
+
+    async def _push_closed_candles(self, time_frame, pair, candles_builder, closed_candles):
+        """
+        Pushes the closed candles following the last stored candle, missing and incomplete ones are fetched
+        """
+        last_candle_time = self._get_last_candle_time(time_frame, pair)
+        closed_candles_times = closed_candles[PriceIndexes.IND_PRICE_TIME.value]
+        if candles_builder.is_complete_candle(closed_candles_times[0]) and \
+                (np.isnan(last_candle_time)
+                 or closed_candles_times[0] == last_candle_time + candles_builder.period_duration):
+            # push the candles that are following each other, trades can't tell about candles without trades
+            contiguous_candles = closed_candles_times == \
+                closed_candles_times[0] + candles_builder.period_duration * np.arange(len(closed_candles_times))
+            contiguous_candles_count = len(closed_candles_times) if contiguous_candles.all() \
+                else int(np.argmin(contiguous_candles))
+            await self.push(time_frame, pair, closed_candles[:, :contiguous_candles_count].T.tolist(), partial=True)
+            if contiguous_candles_count == len(closed_candles_times):
+                return
+            last_candle_time = closed_candles_times[contiguous_candles_count - 1]
+        await self._repair_candles(time_frame, pair, candles_builder, last_candle_time, closed_candles_times[-1])
+
+    async def _repair_candles(self, time_frame, pair, candles_builder, last_candle_time, last_closed_candle_time):
+        """
+        Fetches every candle following last_candle_time until last_closed_candle_time
+        """
+        # until the in construction candle
+        missing_candles_count = self.OHLCV_LIMIT + 1 if np.isnan(last_candle_time) \
+            else int((candles_builder.kline[PriceIndexes.IND_PRICE_TIME.value] - last_candle_time)
+                     // candles_builder.period_duration)
+        candles: list = await self.channel.exchange_manager.exchange \
+            .get_symbol_prices(pair, time_frame, limit=missing_candles_count)
+        if candles:
+            self.channel.exchange_manager.uniformize_candles_if_necessary(candles)
+            candles = [candle
+                       for candle in candles
+                       if candle[PriceIndexes.IND_PRICE_TIME.value] <= last_closed_candle_time]
+            if candles:
+                await self.push(time_frame, pair, candles, partial=True)
+
+    def _get_last_candle_time(self, time_frame, pair):
+        try:
+            candles_times = self.channel.exchange_manager.get_symbol_data(pair).symbol_candles[time_frame] \
+                .get_symbol_time_candles(1)
+            return candles_times[-1] if len(candles_times) else np.nan
+        except KeyError:
+            return np.nan
@@ -16,6 +16,7 @@
 #  License along with this library.
 
 from octobot_trading.channels.ohlcv cimport OHLCVProducer
+from octobot_trading.data_manager.candles_storage cimport CandlesStorage
 
 
 cdef class OHLCVUpdater(OHLCVProducer):
@@ -24,5 +25,16 @@ cdef class OHLCVUpdater(OHLCVProducer):
     cdef bint is_initialized
     cdef object ohlcv_initialized_event
 
+    cdef public object source_time_frame
+    cdef public list aggregated_time_frames
+
+    cdef public CandlesStorage candles_storage
+
+    cdef void _init_aggregated_time_frames(self)
     cdef void _create_time_frame_candle_task(self, object time_frame)
     cdef void _create_pair_candle_task(self, str pair)
+    cdef int _get_history_candles_limit(self, object time_frame, str pair)
+    cdef object _create_candles_storage(self)
+    cdef object _load_stored_candles(self, object time_frame, str pair)
+    cdef void _save_pair_candles(self, object time_frame, str pair)
+    cdef void _save_candles(self)
@@ -21,24 +21,36 @@ from ccxt.base.errors import NotSupported
 
 from octobot_commons.constants import MINUTE_TO_SECONDS
 from octobot_commons.enums import TimeFramesMinutes, PriceIndexes
-from octobot_trading.constants import OHLCV_CHANNEL
+from octobot_commons.time_frame_manager import find_min_time_frame
+from octobot_trading.constants import OHLCV_CHANNEL, CONFIG_CANDLES_HISTORY, CONFIG_CANDLES_HISTORY_STORAGE_PATH
 from octobot_trading.channels.ohlcv import OHLCVProducer
+from octobot_trading.data_adapters.candles_aggregation import can_aggregate_time_frame
+from octobot_trading.data_manager.candles_storage import CandlesStorage
 
 
 class OHLCVUpdater(OHLCVProducer):
     CHANNEL_NAME = OHLCV_CHANNEL
     OHLCV_LIMIT = 5  # should be < to candle manager's MAX_CANDLES_COUNT
-    OHLCV_OLD_LIMIT = 200  # should be < to candle manager's MAX_CANDLES_COUNT
+    OHLCV_OLD_LIMIT = 200  # default history fetch size when no history size is configured for the time frame
     OHLCV_ON_ERROR_TIME = 5
     OHLCV_MIN_REFRESH_TIME = 3
 
     OHLCV_INITIALIZATION_TIMEOUT = 60
 
+    # build the time frames that can be aggregated from the smallest traded time frame instead of fetching them
+    AGGREGATE_TIME_FRAMES = True
+
     def __init__(self, channel):
         super().__init__(channel)
         self.tasks = []
         self.is_initialized = False
 
+        self.source_time_frame = None
+        self.aggregated_time_frames = []
+
+        # stored candles are used to only fetch the candles missing since the last run
+        self.candles_storage = self._create_candles_storage()
+
         self.ohlcv_initialized_event = asyncio.Event()
 
     async def start(self):
@@ -47,14 +59,20 @@ class OHLCVUpdater(OHLCVProducer):
         """
         if not self.is_initialized:
             await self._initialize()
+        self._init_aggregated_time_frames()
         self.tasks = [
             asyncio.create_task(self._candle_callback(time_frame, pair))
             for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames
+            if time_frame not in self.aggregated_time_frames
             for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs]
 
     async def wait_for_initialization(self, timeout=OHLCV_INITIALIZATION_TIMEOUT):
         raise NotImplementedError("wait_for_initialization is not implemented yet")
 
+    async def stop(self):
+        await super().stop()
+        self._save_candles()
+
     async def _initialize(self):
         try:
             for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames:
@@ -67,6 +85,28 @@ class OHLCVUpdater(OHLCVProducer):
             self.ohlcv_initialized_event.set()
             self.is_initialized = True
 
+    def _init_aggregated_time_frames(self):
+        """
+        Selects the traded time frames to build from the smallest traded time frame candles
+        """
+        traded_time_frames = self.channel.exchange_manager.exchange_config.traded_time_frames
+        if self.AGGREGATE_TIME_FRAMES and traded_time_frames:
+            self.source_time_frame = find_min_time_frame(traded_time_frames)
+            self.aggregated_time_frames = [time_frame
+                                           for time_frame in traded_time_frames
+                                           if can_aggregate_time_frame(self.source_time_frame, time_frame)]
+
+    async def _push_aggregated_candles(self, pair):
+        try:
+            symbol_data = self.channel.exchange_manager.get_symbol_data(pair)
+            for time_frame in self.aggregated_time_frames:
+                aggregated_candles = symbol_data.get_aggregated_candles(self.source_time_frame, time_frame)
+                if aggregated_candles:
+                    await self.push(time_frame, pair, aggregated_candles, partial=True)
+        except KeyError:
+            # source time frame candles are not stored
+            pass
+
     def _create_time_frame_candle_task(self, time_frame):
         self.tasks += [asyncio.create_task(self._candle_callback(time_frame, pair, should_initialize=True))
                        for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs]
@@ -78,13 +118,79 @@ class OHLCVUpdater(OHLCVProducer):
     async def _initialize_candles(self, time_frame, pair):
         """
         Manage timeframe OHLCV data refreshing for all pairs
+        :return: the fetched in construction candle if any
         """
+        symbol_data = self.channel.exchange_manager.get_symbol_data(pair)
+        history_limit: int = self._get_history_candles_limit(time_frame, pair)
+        stored_candles = self._load_stored_candles(time_frame, pair)
+        if stored_candles is not None:
+            missing_candles_count: int = self._get_missing_candles_count(time_frame, stored_candles)
+            if missing_candles_count < history_limit:
+                await symbol_data.handle_candles_update(time_frame, stored_candles, replace_all=True, partial=False)
+                # fetch only the candles missing since the last stored candle
+                candles: list = await self.channel.exchange_manager.exchange \
+                    .get_symbol_prices(pair, time_frame, limit=missing_candles_count)
+                if candles:
+                    self.channel.exchange_manager.uniformize_candles_if_necessary(candles)
+                    if len(candles) > 1:
+                        await symbol_data.handle_candles_update(time_frame, candles[:-1], partial=True)
+                return candles[-1] if candles else None
+
         # fetch history
         candles: list = await self.channel.exchange_manager.exchange \
-            .get_symbol_prices(pair, time_frame, limit=self.OHLCV_OLD_LIMIT)
+            .get_symbol_prices(pair, time_frame, limit=history_limit)
         self.channel.exchange_manager.uniformize_candles_if_necessary(candles)
-        await self.channel.exchange_manager.get_symbol_data(pair) \
-            .handle_candles_update(time_frame, candles[:-1], replace_all=True, partial=False)
+        await symbol_data.handle_candles_update(time_frame, candles[:-1], replace_all=True, partial=False)
+        # candles are stored on stop
+        return candles[-1] if candles else None
+
+    def _create_candles_storage(self):
+        storage_path = self.channel.exchange_manager.config.get(CONFIG_CANDLES_HISTORY, {}) \
+            .get(CONFIG_CANDLES_HISTORY_STORAGE_PATH, None)
+        return None if storage_path is None else CandlesStorage(storage_path)
+
+    def _load_stored_candles(self, time_frame, pair):
+        if self.candles_storage is None:
+            return None
+        return self.candles_storage.load_candles(self.channel.exchange_manager.exchange_name, pair, time_frame)
+
+    @staticmethod
+    def _get_missing_candles_count(time_frame, stored_candles):
+        """
+        :return: the candles count to fetch to get every candle following the last stored candle
+        including the current in construction candle
+        """
+        time_frame_seconds: int = TimeFramesMinutes[time_frame] * MINUTE_TO_SECONDS
+        last_stored_candle_time: float = stored_candles[PriceIndexes.IND_PRICE_TIME.value, -1]
+        # stored candles are closed candles: the in construction candle is the last of the following ones
+        return max(int((time.time() - last_stored_candle_time) // time_frame_seconds), 1)
+
+    def _save_pair_candles(self, time_frame, pair):
+        if self.candles_storage is None:
+            return
+        try:
+            candles = self.channel.exchange_manager.get_symbol_data(pair).symbol_candles[time_frame].get_candles()
+            self.candles_storage.save_candles(self.channel.exchange_manager.exchange_name, pair, time_frame, candles)
+        except KeyError:
+            # no candles to store
+            pass
+
+    def _save_candles(self):
+        if self.candles_storage is None:
+            return
+        for time_frame in self.channel.exchange_manager.exchange_config.traded_time_frames:
+            for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                self._save_pair_candles(time_frame, pair)
+
+    def _get_history_candles_limit(self, time_frame, pair):
+        """
+        :return: the candles count to fetch when initializing pair's candles on time_frame
+        """
+        symbols_data = self.channel.exchange_manager.exchange_symbols_data
+        history_size = symbols_data.get_candles_history_size(pair, time_frame)
+        if symbols_data.get_configured_candles_history_size(time_frame) is None:
+            return min(self.OHLCV_OLD_LIMIT, history_size)
+        return history_size
 
     async def _candle_callback(self, time_frame, pair, should_initialize=False):
         time_frame_sleep: int = TimeFramesMinutes[time_frame] * MINUTE_TO_SECONDS
@@ -114,6 +220,8 @@ class OHLCVUpdater(OHLCVProducer):
                         # A fresh candle happened
                         last_candle_timestamp = current_candle_timestamp
                         await self.push(time_frame, pair, candles[:-1], partial=True)   # push only completed candles
+                        if time_frame == self.source_time_frame:
+                            await self._push_aggregated_candles(pair)
 
                         if should_sleep_time < self.OHLCV_MIN_REFRESH_TIME:
                             should_sleep_time = self.OHLCV_MIN_REFRESH_TIME
@@ -89,7 +89,7 @@ class OHLCVUpdaterSimulator(OHLCVUpdater):
                 exchange_name=self.exchange_name,
                 symbol=pair,
                 time_frame=time_frame,
-                limit=self.OHLCV_OLD_LIMIT,
+                limit=self._get_history_candles_limit(time_frame, pair),
                 superior_timestamp=self.initial_timestamp - 1)
             self.logger.info(f"Loaded pre-backtesting starting timestamp historical "
                              f"candles for: {pair} in {time_frame}")
@@ -14,13 +14,12 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-import copy
-
 from ccxt.base.errors import InsufficientFunds
 
 from octobot_commons.logging.logging_util import get_logger
 from octobot_trading.constants import RECENT_TRADES_CHANNEL, ORDERS_CHANNEL
 from octobot_trading.channels.exchange_channel import get_chan
+from octobot_trading.data.last_prices import LastPrices
 from octobot_trading.data.order import Order
 from octobot_trading.enums import OrderStatus
 from octobot_trading.producers import MissingOrderException
@@ -60,12 +59,14 @@ class OpenOrdersUpdaterSimulator(OpenOrdersUpdater):
                                     symbol: str,
                                     last_prices: list) -> list:
         """
-        Ask orders to check their status
+        Ask orders which fill might be triggered by last_prices to check their status
         Ask cancellation and filling process if it is required
         """
         failed_order_updates = []
-        for order in copy.copy(
-                self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(symbol=symbol)):
+        # last prices extremums are computed once for every order
+        last_prices = LastPrices.from_recent_trades(last_prices)
+        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_triggered_open_orders(
+                symbol, last_prices.get_min_price(), last_prices.get_max_price()):
             order_filled = False
             try:
                 # ask orders to update their status
@@ -90,7 +91,7 @@ class OpenOrdersUpdaterSimulator(OpenOrdersUpdater):
     async def _update_order_status(self,
                                    order: Order,
                                    failed_order_updates: list,
-                                   last_prices: list):
+                                   last_prices: LastPrices):
         """
         Call order status update
         """
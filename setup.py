@@ -48,6 +48,7 @@ packages_list = ["octobot_trading.util.initializable",
                  "octobot_trading.producers.balance_updater",
                  "octobot_trading.producers.funding_updater",
                  "octobot_trading.producers.ohlcv_updater",
+                 "octobot_trading.producers.ohlcv_trades_updater",
                  "octobot_trading.producers.order_book_updater",
                  "octobot_trading.producers.kline_updater",
                  "octobot_trading.producers.abstract_mode_producer",
@@ -67,23 +68,32 @@ packages_list = ["octobot_trading.util.initializable",
                  "octobot_trading.producers.simulator.ticker_updater_simulator",
                  "octobot_trading.data.book",
                  "octobot_trading.data.margin_portfolio",
+                 "octobot_trading.data.last_prices",
                  "octobot_trading.data.order",
                  "octobot_trading.data.position",
                  "octobot_trading.data.trade",
                  "octobot_trading.data.portfolio",
                  "octobot_trading.data.portfolio_profitability",
+                 "octobot_trading.data.portfolio_snapshot",
+                 "octobot_trading.data.currency_conversion_graph",
+                 "octobot_trading.data.portfolio_valuator",
                  "octobot_trading.data.sub_portfolio",
                  "octobot_trading.data_adapters.candles_adapter",
+                 "octobot_trading.data_adapters.candles_aggregation",
                  "octobot_trading.data_manager.candles_manager",
+                 "octobot_trading.data_manager.candles_storage",
+                 "octobot_trading.data_manager.candles_builder",
                  "octobot_trading.data_manager.funding_manager",
                  "octobot_trading.data_manager.orders_manager",
                  "octobot_trading.data_manager.positions_manager",
                  "octobot_trading.data_manager.kline_manager",
                  "octobot_trading.data_manager.trades_manager",
+                 "octobot_trading.data_manager.trades_journal",
                  "octobot_trading.data_manager.portfolio_manager",
                  "octobot_trading.data_manager.prices_manager",
                  "octobot_trading.data_manager.order_book_manager",
                  "octobot_trading.data_manager.ticker_manager",
+                 "octobot_trading.data_manager.market_snapshot_table",
                  "octobot_trading.data_manager.recent_trades_manager",
                  "octobot_trading.orders.types.buy_limit_order",
                  "octobot_trading.orders.types.buy_market_order",
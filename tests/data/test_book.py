@@ -0,0 +1,33 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_trading.data.book import Book
+from octobot_trading.enums import ExchangeConstantsOrderColumns, TradeOrderSide
+
+
+def test_get_asks_and_bids():
+    book = Book()
+    book.handle_book_update([
+        {"id": 1, ExchangeConstantsOrderColumns.SIDE.value: "sell", ExchangeConstantsOrderColumns.PRICE.value: 11,
+         ExchangeConstantsOrderColumns.AMOUNT.value: 1},
+        {"id": 2, ExchangeConstantsOrderColumns.SIDE.value: "buy", ExchangeConstantsOrderColumns.PRICE.value: 10,
+         ExchangeConstantsOrderColumns.AMOUNT.value: 2}
+    ])
+    assert book.get_asks() == book.get_bids(TradeOrderSide.SELL) == [[11, 1]]
+    assert book.get_bids() == book.get_asks(TradeOrderSide.BUY) == [[10, 2]]
+    with pytest.raises(ValueError):
+        book.get_asks(TradeOrderSide.SELL.value)
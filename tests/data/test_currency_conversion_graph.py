@@ -0,0 +1,36 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.data.currency_conversion_graph import CurrencyConversionGraph
+
+
+def test_get_conversion_path():
+    currency_conversion_graph = CurrencyConversionGraph(["XYZ/BTC", "BTC/USDT", "ETH/USDT", "ETH/BTC", "ABC/DEF"])
+    assert currency_conversion_graph.get_conversion_path("USDT", "USDT") == []
+    assert currency_conversion_graph.get_conversion_path("BTC", "USDT") == [("BTC/USDT", False)]
+    assert currency_conversion_graph.get_conversion_path("USDT", "BTC") == [("BTC/USDT", True)]
+    assert currency_conversion_graph.get_conversion_path("XYZ", "USDT") == [("XYZ/BTC", False), ("BTC/USDT", False)]
+    assert currency_conversion_graph.get_conversion_path("ABC", "USDT") is None
+    assert currency_conversion_graph.get_conversion_path("USDT", "ABC") is None
+    assert currency_conversion_graph.get_conversion_path("DEF", "ABC") == [("ABC/DEF", True)]
+    # paths are cached by reference market
+    assert set(currency_conversion_graph.conversion_paths) == {"USDT", "BTC", "ABC"}
+
+
+def test_get_conversion_path_through_most_linked_currencies():
+    # LTC can be converted into USDT through EUR or BTC: BTC has more markets
+    currency_conversion_graph = CurrencyConversionGraph(["LTC/EUR", "LTC/BTC", "EUR/USDT", "BTC/USDT", "ETH/BTC",
+                                                         "BTC/EUR"])
+    assert currency_conversion_graph.get_conversion_path("LTC", "USDT") == [("LTC/BTC", False), ("BTC/USDT", False)]
@@ -0,0 +1,92 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import gc
+import tracemalloc
+from asyncio import Lock
+
+import pytest
+
+from octobot_trading.data.order import Order
+from octobot_trading.data.position import Position, ShortPosition, LongPosition
+from octobot_trading.data.trade import Trade
+from octobot_trading.orders.types import BuyLimitOrder, BuyMarketOrder, SellLimitOrder, SellMarketOrder, \
+    StopLossLimitOrder, StopLossOrder, TrailingStopOrder, UnknownOrder
+
+
+class _Trader:
+    exchange_manager = None
+    simulate = True
+
+    @staticmethod
+    def parse_order_id(order_id):
+        return order_id
+
+
+@pytest.mark.parametrize("data_class", [Order, BuyLimitOrder, BuyMarketOrder, SellLimitOrder, SellMarketOrder,
+                                        StopLossLimitOrder, StopLossOrder, TrailingStopOrder, UnknownOrder,
+                                        Trade, Position, ShortPosition, LongPosition])
+def test_slotted_layout(data_class):
+    instance = data_class(_Trader())
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.undeclared_attribute = 1
+
+
+@pytest.mark.parametrize("data_class", [Order, BuyLimitOrder, Position, LongPosition])
+def test_lazy_lock(data_class):
+    instance = data_class(_Trader())
+    assert instance._lock is None
+    lock = instance.lock
+    assert isinstance(lock, Lock)
+    assert instance._lock is lock
+    assert instance.lock is lock
+
+
+@pytest.mark.parametrize("data_class", [Order, Trade, Position])
+def test_slotted_memory_usage(data_class):
+    # dict layout instances are built like before slots: with a __dict__ and their lock (if any) created upfront
+    slotted_size = _get_instance_memory_size(data_class)
+    dict_layout_size = _get_instance_memory_size(_get_dict_layout_class(data_class), create_lock=True)
+    assert slotted_size < dict_layout_size, f"{data_class.__name__}: {slotted_size} >= {dict_layout_size} bytes"
+
+
+def _get_dict_layout_class(data_class):
+    """
+    :return: a copy of data_class storing its attributes in a per instance __dict__
+    """
+    namespace = {key: value
+                 for key, value in vars(data_class).items()
+                 if key not in data_class.__slots__ and key not in ("__slots__", "__dict__", "__weakref__")}
+    return type(f"DictLayout{data_class.__name__}", (), namespace)
+
+
+def _get_instance_memory_size(data_class, create_lock=False, instances_count=20000):
+    """
+    :return: the average bytes allocated by creating an instance of data_class
+    """
+    trader = _Trader()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        initial_size, _ = tracemalloc.get_traced_memory()
+        instances = [data_class(trader) for _ in range(instances_count)]
+        if create_lock:
+            for instance in instances:
+                getattr(instance, "lock", None)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (size - initial_size) / instances_count
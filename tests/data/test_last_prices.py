@@ -0,0 +1,39 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.data.last_prices import LastPrices
+
+
+def test_get_min_and_max_price():
+    last_prices = LastPrices([3, 1, 2, 4], [10, 12, np.nan, 8])
+    assert last_prices.timestamps.tolist() == [1, 3, 4]
+    assert last_prices.get_min_price() == 8
+    assert last_prices.get_max_price() == 12
+    assert last_prices.get_max_price(2) == 10
+    assert last_prices.get_min_price(4) == 8
+    assert last_prices.get_min_price(5) == np.inf
+    assert last_prices.get_max_price(5) == -np.inf
+
+
+def test_from_recent_trades():
+    last_prices = LastPrices.from_recent_trades([
+        {"timestamp": 2, "price": 11, "amount": 1},
+        {"timestamp": 1, "price": 9, "amount": 1}
+    ])
+    assert last_prices.get_min_price() == 9
+    assert last_prices.get_min_price(2) == 11
+    assert LastPrices.from_recent_trades([]).get_max_price() == -np.inf
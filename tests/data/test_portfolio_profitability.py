@@ -0,0 +1,72 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+from octobot_commons.tests.test_config import load_test_config
+
+from octobot_trading.enums import ExchangeConstantsTickersColumns
+from octobot_trading.exchanges.exchange_builder import ExchangeBuilder
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+class TestPortfolioProfitability:
+    EXCHANGE_NAME = "binance"
+
+    @staticmethod
+    async def init_default(config=None):
+        if not config:
+            config = load_test_config()
+
+        exchange_builder = ExchangeBuilder(config, TestPortfolioProfitability.EXCHANGE_NAME).\
+            is_rest_only().\
+            is_simulated().\
+            disable_trading_mode()
+        exchange_manager = await exchange_builder.build()
+
+        return config, exchange_manager, exchange_manager.exchange_personal_data.portfolio_manager
+
+    @staticmethod
+    async def stop_default(exchange_manager):
+        await exchange_manager.stop()
+
+    @staticmethod
+    def _get_profitability_values(portfolio_profitability):
+        return (portfolio_profitability.profitability,
+                portfolio_profitability.profitability_percent,
+                portfolio_profitability.market_profitability_percent,
+                portfolio_profitability.initial_portfolio_current_profitability,
+                portfolio_profitability.portfolio_current_value,
+                portfolio_profitability.portfolio_origin_value)
+
+    async def test_ticker_updates_match_full_evaluation(self):
+        _, exchange_manager, portfolio_manager = await self.init_default()
+        portfolio_profitability = portfolio_manager.portfolio_profitability
+        symbols = exchange_manager.exchange_config.traded_symbol_pairs
+
+        for index, symbol in enumerate(symbols):
+            await portfolio_profitability.handle_ticker_update(
+                symbol, {ExchangeConstantsTickersColumns.LAST.value: index + 1})
+        for index, symbol in enumerate(symbols):
+            await portfolio_profitability.handle_ticker_update(
+                symbol, {ExchangeConstantsTickersColumns.LAST.value: (index + 1) * 1.5})
+        incremental_values = self._get_profitability_values(portfolio_profitability)
+
+        # a balance update re-evaluates every currency from scratch
+        await portfolio_profitability.handle_balance_update(portfolio_manager.portfolio.portfolio)
+        assert self._get_profitability_values(portfolio_profitability) == pytest.approx(incremental_values)
+
+        await self.stop_default(exchange_manager)
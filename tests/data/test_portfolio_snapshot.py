@@ -0,0 +1,176 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import copy
+
+import numpy as np
+import pytest
+from octobot_commons.constants import PORTFOLIO_AVAILABLE, PORTFOLIO_TOTAL, MARGIN_PORTFOLIO
+
+from octobot_trading.data.margin_portfolio import MarginPortfolio
+from octobot_trading.data.portfolio import Portfolio
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+
+
+async def _init_portfolio(portfolio_class=Portfolio):
+    portfolio = portfolio_class(EXCHANGE_NAME, is_simulated=True)
+    await portfolio.initialize()
+    await portfolio.update_portfolio_from_balance(portfolio.get_portfolio_from_amount_dict({"BTC": 10, "USDT": 1000}))
+    return portfolio
+
+
+async def test_snapshot_is_copied_on_write():
+    portfolio = await _init_portfolio()
+    snapshot = portfolio.get_snapshot()
+    assert snapshot.holdings is portfolio.holdings
+    assert not portfolio.has_changed_since(snapshot)
+    assert portfolio.get_changed_currencies_since(snapshot) == {}
+
+    portfolio.reset_portfolio_available("BTC", -2)
+    assert portfolio.has_changed_since(snapshot)
+    assert snapshot.holdings is not portfolio.holdings
+    assert snapshot.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 10
+    assert portfolio.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 8
+
+    portfolio._update_portfolio_data(["ETH"], np.array([5.]), np.array([True]), np.array([True]))
+    assert snapshot.get_currency_portfolio("ETH") == 0
+    assert portfolio.get_changed_currencies_since(snapshot) == {
+        "BTC": ({PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10}, {PORTFOLIO_AVAILABLE: 8, PORTFOLIO_TOTAL: 10}),
+        "ETH": (None, {PORTFOLIO_AVAILABLE: 5, PORTFOLIO_TOTAL: 5})
+    }
+
+    # a second update does not copy the holdings again
+    holdings = portfolio.holdings
+    portfolio.reset_portfolio_available("BTC", -2)
+    assert portfolio.holdings is holdings
+    assert snapshot.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 10
+
+    portfolio.reset_portfolio_available()
+    assert snapshot.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 10
+    assert portfolio.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 10
+    assert portfolio.get_currency_portfolio("ETH", PORTFOLIO_AVAILABLE) == 5
+
+
+async def test_copy():
+    portfolio = await _init_portfolio()
+    portfolio_copy = await portfolio.copy()
+    assert portfolio_copy.holdings is portfolio.holdings
+    assert portfolio_copy.portfolio == portfolio.portfolio
+
+    portfolio.reset_portfolio_available("BTC", -2)
+    portfolio_copy.reset_portfolio_available("USDT", -100)
+    assert portfolio.get_currency_portfolio("BTC") == 8
+    assert portfolio.get_currency_portfolio("USDT") == 1000
+    assert portfolio_copy.get_currency_portfolio("BTC") == 10
+    assert portfolio_copy.get_currency_portfolio("USDT") == 900
+
+
+async def test_unknown_currency_is_not_added_on_read():
+    portfolio = await _init_portfolio()
+    assert portfolio.get_currency_portfolio("ETH") == 0
+    assert portfolio.get_currency_portfolio("ETH", PORTFOLIO_TOTAL) == 0
+    assert portfolio.currencies == ["BTC", "USDT"]
+    assert "ETH" not in portfolio.portfolio
+
+
+async def test_portfolio_view():
+    portfolio = await _init_portfolio()
+    assert portfolio.portfolio == {
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10},
+        "USDT": {PORTFOLIO_AVAILABLE: 1000, PORTFOLIO_TOTAL: 1000}
+    }
+    # the view reads the current holdings
+    btc_portfolio = portfolio.portfolio["BTC"]
+    portfolio._update_portfolio_data(["BTC", "USDT"], np.array([1., -100.]),
+                                     np.array([True, True]), np.array([False, True]))
+    assert btc_portfolio == {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 11}
+    assert portfolio.portfolio == {
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 11},
+        "USDT": {PORTFOLIO_AVAILABLE: 900, PORTFOLIO_TOTAL: 900}
+    }
+    assert np.array_equal(portfolio.get_holdings(PORTFOLIO_TOTAL), [11, 900])
+    assert np.array_equal(portfolio.get_holdings(PORTFOLIO_AVAILABLE), [10, 900])
+    # copies are plain dicts
+    portfolio_dict = copy.deepcopy(portfolio.portfolio)
+    assert type(portfolio_dict) is dict and type(portfolio_dict["BTC"]) is dict
+    assert portfolio_dict == portfolio.portfolio
+
+
+async def test_portfolio_view_writes():
+    portfolio = await _init_portfolio()
+    snapshot = portfolio.get_snapshot()
+    portfolio_copy = await portfolio.copy()
+
+    portfolio.portfolio["ADA"] = {PORTFOLIO_AVAILABLE: 1500, PORTFOLIO_TOTAL: 1500}
+    portfolio.portfolio["USDT"] = {PORTFOLIO_TOTAL: 500}
+    portfolio.portfolio["BTC"][PORTFOLIO_AVAILABLE] = 2
+    assert portfolio.get_currency_portfolio("ADA") == 1500
+    assert portfolio.get_currency_portfolio("USDT") == 0
+    assert portfolio.get_currency_portfolio("USDT", PORTFOLIO_TOTAL) == 500
+    assert portfolio.get_currency_portfolio("BTC") == 2
+    assert portfolio.has_changed_since(snapshot)
+    assert portfolio.get_changed_currencies_since(snapshot) == {
+        "BTC": ({PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10}, {PORTFOLIO_AVAILABLE: 2, PORTFOLIO_TOTAL: 10}),
+        "USDT": ({PORTFOLIO_AVAILABLE: 1000, PORTFOLIO_TOTAL: 1000}, {PORTFOLIO_AVAILABLE: 0, PORTFOLIO_TOTAL: 500}),
+        "ADA": (None, {PORTFOLIO_AVAILABLE: 1500, PORTFOLIO_TOTAL: 1500})
+    }
+    with pytest.raises(KeyError):
+        portfolio.portfolio["BTC"]["xyz"] = 1
+    with pytest.raises(TypeError):
+        del portfolio.portfolio["BTC"][PORTFOLIO_TOTAL]
+
+    assert portfolio.portfolio.pop("USDT") == {PORTFOLIO_AVAILABLE: 0, PORTFOLIO_TOTAL: 500}
+    assert "USDT" not in portfolio.portfolio
+    assert portfolio.get_currency_portfolio("USDT", PORTFOLIO_TOTAL) == 0
+    assert portfolio.get_currency_portfolio("ADA") == 1500
+    assert portfolio.get_changed_currencies_since(snapshot)["USDT"] == \
+        ({PORTFOLIO_AVAILABLE: 1000, PORTFOLIO_TOTAL: 1000}, None)
+    with pytest.raises(KeyError):
+        del portfolio.portfolio["USDT"]
+
+    portfolio.portfolio = {"ETH": {PORTFOLIO_AVAILABLE: 1, PORTFOLIO_TOTAL: 2}}
+    assert portfolio.portfolio == {"ETH": {PORTFOLIO_AVAILABLE: 1, PORTFOLIO_TOTAL: 2}}
+
+    # copies and snapshots are not affected
+    assert snapshot.portfolio == portfolio_copy.portfolio == {
+        "BTC": {PORTFOLIO_AVAILABLE: 10, PORTFOLIO_TOTAL: 10},
+        "USDT": {PORTFOLIO_AVAILABLE: 1000, PORTFOLIO_TOTAL: 1000}
+    }
+
+
+async def test_currencies_capacity_growth():
+    portfolio = await _init_portfolio()
+    currencies = [f"C{i}" for i in range(100)]
+    portfolio._update_portfolio_data(currencies, np.arange(100, dtype=np.float64),
+                                     np.ones(100, dtype=bool), np.ones(100, dtype=bool))
+    assert portfolio.currencies[:2] == ["BTC", "USDT"]
+    assert len(portfolio.currencies) == 102
+    assert portfolio.get_currency_portfolio("C42", PORTFOLIO_TOTAL) == 42
+    assert portfolio.get_currency_portfolio("BTC", PORTFOLIO_TOTAL) == 10
+
+
+async def test_margin_portfolio():
+    portfolio = await _init_portfolio(MarginPortfolio)
+    assert portfolio.get_currency_portfolio("BTC", MARGIN_PORTFOLIO) == 0
+    snapshot = portfolio.get_snapshot()
+    portfolio._update_currency_portfolio("BTC", available=-1, total=0, margin=1)
+    assert portfolio.get_currency_portfolio("BTC", MARGIN_PORTFOLIO) == 1
+    assert portfolio.get_currency_portfolio("BTC", PORTFOLIO_AVAILABLE) == 9
+    assert snapshot.get_currency_portfolio("BTC", MARGIN_PORTFOLIO) == 0
+    assert portfolio.portfolio["BTC"] == {PORTFOLIO_AVAILABLE: 9, MARGIN_PORTFOLIO: 1, PORTFOLIO_TOTAL: 10}
@@ -0,0 +1,94 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import math
+
+import numpy as np
+import pytest
+
+from octobot_trading.constants import CONFIG_PORTFOLIO_TOTAL
+from octobot_trading.data.currency_conversion_graph import CurrencyConversionGraph
+from octobot_trading.data.portfolio import Portfolio
+from octobot_trading.data.portfolio_valuator import PortfolioValuator
+
+SYMBOLS = ["ETH/BTC", "BTC/USDT", "XRP/ETH", "BTC/EUR", "EUR/BTC", "ADA/USDT", "XYZ/XRP"]
+
+
+def test_conversion_routes():
+    portfolio_valuator = PortfolioValuator("BTC", CurrencyConversionGraph(SYMBOLS))
+    for symbol, price in (("ETH/BTC", 0.02), ("BTC/USDT", 10000), ("XRP/ETH", 0.001), ("EUR/BTC", 0.0001)):
+        assert portfolio_valuator.set_price(symbol, price)
+    assert not portfolio_valuator.set_price("LTC/BTC", 0.005)
+
+    assert portfolio_valuator.get_currency_value("BTC") == 1
+    # direct symbol
+    assert portfolio_valuator.get_currency_value("ETH") == 0.02
+    # inverted symbol
+    assert portfolio_valuator.get_currency_value("USDT") == 0.0001
+    # direct symbol is preferred over the inverted one
+    assert portfolio_valuator.get_currency_value("EUR") == 0.0001
+    # through an intermediate currency
+    assert math.isclose(portfolio_valuator.get_currency_value("XRP"), 0.00002)
+    portfolio_valuator.set_price("XYZ/XRP", 2)
+    assert math.isclose(portfolio_valuator.get_currency_value("XYZ"), 0.00004)
+    assert portfolio_valuator.get_symbol_currencies("ETH/BTC") == ["ETH", "XRP", "XYZ"]
+    # missing price
+    assert math.isnan(portfolio_valuator.get_currency_value("ADA"))
+    assert portfolio_valuator.has_route("ADA")
+    assert portfolio_valuator.get_missing_price_symbols("ADA") == ["ADA/USDT"]
+    # no route
+    assert math.isnan(portfolio_valuator.get_currency_value("LTC"))
+    assert not portfolio_valuator.has_route("LTC")
+
+    currencies_values = portfolio_valuator.get_currencies_values()
+    for currency, currency_index in portfolio_valuator.currencies_indexes.items():
+        np.testing.assert_equal(currencies_values[currency_index], portfolio_valuator.get_currency_value(currency))
+
+
+def test_missing_price_symbols():
+    portfolio_valuator = PortfolioValuator("BTC", CurrencyConversionGraph(SYMBOLS))
+    assert portfolio_valuator.get_missing_price_symbols("XRP") == ["XRP/ETH", "ETH/BTC"]
+    portfolio_valuator.set_price("ETH/BTC", 0.02)
+    assert portfolio_valuator.get_missing_price_symbols("XRP") == ["XRP/ETH"]
+
+
+def test_evaluate_portfolio_value():
+    portfolio_valuator = PortfolioValuator("BTC", CurrencyConversionGraph(SYMBOLS))
+    portfolio_valuator.set_price("ETH/BTC", 0.02)
+    portfolio_valuator.set_price("BTC/USDT", 0)
+    portfolio = {currency: {CONFIG_PORTFOLIO_TOTAL: holdings}
+                 for currency, holdings in (("BTC", 1), ("ETH", 10), ("USDT", 1000), ("LTC", 10))}
+    # USDT can't be valued from a 0 price and LTC has no route
+    assert portfolio_valuator.evaluate_portfolio_value(portfolio) == 1.2
+    portfolio_valuator.set_price("BTC/USDT", 10000)
+    assert portfolio_valuator.evaluate_portfolio_value(portfolio) == 1.3
+    assert portfolio_valuator.get_holdings(portfolio)[portfolio_valuator.add_currencies(["ETH", "LTC"])].tolist() \
+        == [10, 10]
+
+
+@pytest.mark.asyncio
+async def test_get_portfolio_holdings():
+    portfolio_valuator = PortfolioValuator("BTC", CurrencyConversionGraph(SYMBOLS))
+    portfolio_valuator.add_currency("USDT")
+    portfolio = Portfolio("binance", is_simulated=True)
+    await portfolio.initialize()
+    await portfolio.update_portfolio_from_balance(portfolio.get_portfolio_from_amount_dict({"BTC": 1, "ETH": 10}))
+    holdings = portfolio_valuator.get_portfolio_holdings(portfolio)
+    assert holdings[portfolio_valuator.add_currencies(["BTC", "ETH", "USDT"])].tolist() == [1, 10, 0]
+
+    # currencies added to the portfolio get valuator slots
+    portfolio._update_portfolio_data(["XRP"], np.array([100.]), np.array([True]), np.array([True]))
+    holdings = portfolio_valuator.get_portfolio_holdings(portfolio)
+    assert holdings[portfolio_valuator.add_currencies(["BTC", "ETH", "XRP", "USDT"])].tolist() == [1, 10, 100, 0]
@@ -20,7 +20,6 @@ from octobot_commons.enums import PriceIndexes, TimeFrames
 from octobot_trading.data_adapters.candles_adapter import get_symbol_close_candles, get_symbol_open_candles, \
     get_symbol_low_candles, get_symbol_high_candles, get_symbol_time_candles, get_symbol_volume_candles
 from octobot_trading.data_manager.candles_manager import CandlesManager
-from octobot_trading.data_manager.kline_manager import KlineManager
 from octobot_trading.exchanges.data.exchange_symbol_data import ExchangeSymbolData
 from octobot_trading.exchanges.exchange_manager import ExchangeManager
 
@@ -39,14 +38,11 @@ async def symbol_data(time_frame):
     symbol_candles = CandlesManager()
     await symbol_candles.initialize()
     symbol_candles.replace_all_candles(_get_candles())
-    symbol_kline = KlineManager()
-    await symbol_kline.initialize()
-    symbol_kline.kline_update(_get_candle(11))
     manager = ExchangeManager({}, "binance")
     symbol_data = ExchangeSymbolData(manager, "BTC/USDT")
     tf = TimeFrames(time_frame)
     symbol_data.symbol_candles[tf] = symbol_candles
-    symbol_data.symbol_klines[tf] = symbol_kline
+    await symbol_data.handle_kline_update(tf, _get_candle(11))
     return symbol_data
 
 
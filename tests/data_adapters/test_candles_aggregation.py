@@ -0,0 +1,134 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.data_adapters.candles_aggregation import aggregate_candles, can_aggregate_time_frame
+from octobot_trading.data_manager.candles_manager import CandlesManager
+from octobot_trading.exchanges.data.exchange_symbol_data import ExchangeSymbolData
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+MINUTE = 60
+
+
+async def test_can_aggregate_time_frame():
+    assert can_aggregate_time_frame(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert can_aggregate_time_frame(TimeFrames.ONE_MINUTE, TimeFrames.ONE_DAY)
+    assert can_aggregate_time_frame(TimeFrames.FIVE_MINUTES, TimeFrames.ONE_HOUR)
+    assert not can_aggregate_time_frame(TimeFrames.ONE_MINUTE, TimeFrames.ONE_MINUTE)
+    assert not can_aggregate_time_frame(TimeFrames.ONE_HOUR, TimeFrames.FIVE_MINUTES)
+    assert not can_aggregate_time_frame(TimeFrames.FIVE_MINUTES, TimeFrames.THREE_MINUTES)
+    assert not can_aggregate_time_frame(TimeFrames.ONE_MINUTE, TimeFrames.ONE_WEEK)
+
+
+async def test_aggregate_candles():
+    # 12 one minute candles from 00:00 to 00:11
+    candles = np.array(_get_minute_candles(0, 12), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    # 00:10 period is not completed
+    assert aggregated.shape == (len(PriceIndexes), 2)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [0, 5 * MINUTE]
+    assert list(aggregated[PriceIndexes.IND_PRICE_OPEN.value]) == [0, 5]
+    assert list(aggregated[PriceIndexes.IND_PRICE_HIGH.value]) == [4 + 10, 9 + 10]
+    assert list(aggregated[PriceIndexes.IND_PRICE_LOW.value]) == [0 - 10, 5 - 10]
+    assert list(aggregated[PriceIndexes.IND_PRICE_CLOSE.value]) == [4 + 1, 9 + 1]
+    assert list(aggregated[PriceIndexes.IND_PRICE_VOL.value]) == [5, 5]
+
+    # 00:10 period is completed with its last candle
+    candles = np.array(_get_minute_candles(0, 15), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [0, 5 * MINUTE, 10 * MINUTE]
+
+    assert aggregate_candles(np.empty((len(PriceIndexes), 0)), TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES) \
+        .shape == (len(PriceIndexes), 0)
+
+
+async def test_aggregate_candles_incomplete_first_period():
+    # starts in the middle of the 00:00 period
+    candles = np.array(_get_minute_candles(2, 15), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [5 * MINUTE, 10 * MINUTE]
+
+    # first candle of the 00:00 period is aligned but the others are missing
+    candles = np.array(_get_minute_candles(0, 1) + _get_minute_candles(5, 10), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [5 * MINUTE]
+
+    # single incomplete period
+    candles = np.array(_get_minute_candles(3, 5), dtype=np.float64).T
+    assert aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES).shape == (len(PriceIndexes), 0)
+
+
+async def test_aggregate_candles_missing_candles_period():
+    # 00:07 candle is missing: 00:05 period is skipped
+    candles = np.array(_get_minute_candles(0, 7) + _get_minute_candles(8, 15), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [0, 10 * MINUTE]
+    assert list(aggregated[PriceIndexes.IND_PRICE_OPEN.value]) == [0, 10]
+    assert list(aggregated[PriceIndexes.IND_PRICE_CLOSE.value]) == [4 + 1, 14 + 1]
+    assert list(aggregated[PriceIndexes.IND_PRICE_VOL.value]) == [5, 5]
+
+    # every 00:05 period candle is missing
+    candles = np.array(_get_minute_candles(0, 5) + _get_minute_candles(10, 15), dtype=np.float64).T
+    aggregated = aggregate_candles(candles, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert list(aggregated[PriceIndexes.IND_PRICE_TIME.value]) == [0, 10 * MINUTE]
+
+
+async def test_get_aggregated_candles():
+    symbol_data = ExchangeSymbolData(ExchangeManager({}, "binance"), "BTC/USDT")
+    minute_candles = CandlesManager()
+    # starts in the middle of a 5 minutes period
+    minute_candles.replace_all_candles(_get_minute_candles(3, 12))
+    symbol_data.symbol_candles[TimeFrames.ONE_MINUTE] = minute_candles
+
+    # without 5 minutes history: incomplete first period is skipped
+    aggregated = symbol_data.get_aggregated_candles(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in aggregated] == [5 * MINUTE]
+
+    five_minutes_candles = CandlesManager()
+    five_minutes_candles.replace_all_candles(aggregated)
+    symbol_data.symbol_candles[TimeFrames.FIVE_MINUTES] = five_minutes_candles
+    assert symbol_data.get_aggregated_candles(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES) == []
+
+    # new minute candles: only new periods are built
+    minute_candles.add_old_and_new_candles(_get_minute_candles(12, 20))
+    aggregated = symbol_data.get_aggregated_candles(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in aggregated] == [10 * MINUTE, 15 * MINUTE]
+    assert aggregated[0][PriceIndexes.IND_PRICE_VOL.value] == 5
+
+    # minute candles starting after the next 5 minutes period: its incomplete candle is skipped
+    five_minutes_candles.replace_all_candles(aggregated)
+    minute_candles.replace_all_candles(_get_minute_candles(32, 40))
+    aggregated = symbol_data.get_aggregated_candles(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in aggregated] == [35 * MINUTE]
+
+
+def _get_minute_candles(start_minute, end_minute):
+    candles = []
+    for minute in range(start_minute, end_minute):
+        candle = [0] * len(PriceIndexes)
+        candle[PriceIndexes.IND_PRICE_TIME.value] = minute * MINUTE
+        candle[PriceIndexes.IND_PRICE_OPEN.value] = minute
+        candle[PriceIndexes.IND_PRICE_HIGH.value] = minute + 10
+        candle[PriceIndexes.IND_PRICE_LOW.value] = minute - 10
+        candle[PriceIndexes.IND_PRICE_CLOSE.value] = minute + 1
+        candle[PriceIndexes.IND_PRICE_VOL.value] = 1
+        candles.append(candle)
+    return candles
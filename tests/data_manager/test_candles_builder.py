@@ -0,0 +1,57 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_commons.enums import TimeFrames, PriceIndexes
+
+from octobot_trading.data_manager.candles_builder import CandlesBuilder
+
+
+def test_add_trades_in_kline():
+    candles_builder = CandlesBuilder(TimeFrames.ONE_MINUTE)
+    assert not candles_builder.has_kline()
+    assert candles_builder.add_trades([61, 70, 65], [10, 12, 9], [1, 2, np.nan]).shape == (len(PriceIndexes), 0)
+    assert candles_builder.has_kline()
+    # trades are time sorted
+    assert list(candles_builder.kline) == [60, 10, 12, 9, 12, 3]
+    # first candle trades are received from its middle
+    assert not candles_builder.is_complete_candle(60)
+
+    assert candles_builder.add_trades([119], [8], [1]).shape == (len(PriceIndexes), 0)
+    assert list(candles_builder.kline) == [60, 10, 12, 8, 8, 4]
+
+
+def test_add_trades_closing_candles():
+    candles_builder = CandlesBuilder(TimeFrames.ONE_MINUTE)
+    candles_builder.add_trades([61, 62], [10, 11], [1, 1])
+    closed_candles = candles_builder.add_trades([110, 125, 130, 250], [12, 13, 11, 14], [1, 2, 3, 4])
+    assert closed_candles.tolist() == [[60, 120], [10, 13], [12, 13], [10, 11], [12, 11], [3, 5]]
+    assert list(candles_builder.kline) == [240, 14, 14, 14, 14, 4]
+    assert not candles_builder.is_complete_candle(60)
+    assert candles_builder.is_complete_candle(120)
+
+    # trades of closed candles are ignored
+    assert candles_builder.add_trades([100, 241], [20, 15], [1, 1]).shape == (len(PriceIndexes), 0)
+    assert list(candles_builder.kline) == [240, 14, 15, 14, 15, 5]
+
+
+def test_set_kline():
+    candles_builder = CandlesBuilder(TimeFrames.ONE_HOUR)
+    candles_builder.set_kline([3600, 10, 12, 9, 11, 100])
+    assert not candles_builder.is_complete_candle(3600)
+    closed_candles = candles_builder.add_trades([3700, 7200], [13, 12], [1, 1])
+    assert closed_candles.tolist() == [[3600], [10], [13], [9], [13], [101]]
+    assert list(candles_builder.kline) == [7200, 12, 12, 12, 12, 1]
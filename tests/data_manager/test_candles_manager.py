@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.data_manager.candles_manager import CandlesManager
@@ -22,18 +23,33 @@ from octobot_trading.data_manager.candles_manager import CandlesManager
 def test_constructor():
     candles_manager = CandlesManager()
     assert candles_manager.candles_initialized is False
-    assert candles_manager.close_candles_index == 0
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert all(np.isnan(value) for value in candles_manager.close_candles)
+    assert candles_manager.candles_index == 0
+    assert candles_manager.get_candles_count() == 0
+    assert candles_manager.candles.shape == (len(PriceIndexes), 2 * CandlesManager.MAX_CANDLES_COUNT)
+    assert np.isnan(candles_manager.candles).all()
+
+
+def test_constructor_with_max_candles_count():
+    candles_manager = CandlesManager(max_candles_count=10)
+    assert candles_manager.candles.shape == (len(PriceIndexes), 20)
+    assert candles_manager.get_memory_size() == CandlesManager.get_candles_memory_size(10)
+
+    all_candles = _gen_candles(15)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.reached_max is True
+    assert candles_manager.get_candles_count() == 10
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[5:]],
+                                   dtype=np.float64))
 
 
 def test_add_new_candle():
     candles_manager = CandlesManager()
     candle = _gen_candles(1)[0]
     candles_manager.add_new_candle(candle)
-    assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 1
+    assert candles_manager.candles.shape == (len(PriceIndexes), 2 * CandlesManager.MAX_CANDLES_COUNT)
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 0] == candle[PriceIndexes.IND_PRICE_CLOSE.value]
 
 
 def test_add_old_and_new_candles():
@@ -43,30 +59,65 @@ def test_add_old_and_new_candles():
     single_candle = _gen_candles(1)
     candles_manager.add_old_and_new_candles(single_candle)
     assert candles_manager.reached_max is False
-    assert candles_manager.close_candles_index == 1
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == single_candle[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 1
+    assert candles_manager.candles.shape == (len(PriceIndexes), 2 * CandlesManager.MAX_CANDLES_COUNT)
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 0] == single_candle[0][PriceIndexes.IND_PRICE_CLOSE.value]
 
     # with many candles including first one
     many_candles = _gen_candles(10)
     candles_manager.add_old_and_new_candles(many_candles)
     assert candles_manager.reached_max is False
-    assert candles_manager.close_candles_index == 10
-    assert len(candles_manager.close_candles) == CandlesManager.MAX_CANDLES_COUNT
-    assert candles_manager.close_candles[0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles_index == 10
+    assert candles_manager.candles.shape == (len(PriceIndexes), 2 * CandlesManager.MAX_CANDLES_COUNT)
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
 
 
 def test_replace_all_candles():
     candles_manager = CandlesManager()
     many_candles = _gen_candles(20)[10:]
     candles_manager.add_old_and_new_candles(many_candles)
-    assert candles_manager.close_candles[0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 0] == many_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 9] == many_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
     new_candles = _gen_candles(10)
     candles_manager.replace_all_candles(new_candles)
-    assert candles_manager.close_candles[0] == new_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
-    assert candles_manager.close_candles[9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 0] == new_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.candles[PriceIndexes.IND_PRICE_CLOSE.value, 9] == new_candles[9][PriceIndexes.IND_PRICE_CLOSE.value]
+
+
+def test_replace_all_candles_with_unordered_and_duplicated_candles():
+    candles_manager = CandlesManager(max_candles_count=10)
+    all_candles = _gen_candles(15)
+    duplicated_candle = _get_candle(14)
+    duplicated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 0
+    candles_manager.replace_all_candles(all_candles[10:] + [duplicated_candle] + all_candles[:10])
+    assert candles_manager.get_candles_count() == 10
+    assert candles_manager.get_symbol_time_candles().tolist() == list(range(6, 16))
+    assert np.array_equal(candles_manager.get_candles(), np.array(all_candles[5:], dtype=np.float64).T)
+    assert candles_manager.candles_times == set(range(6, 16))
+
+    # candles with missing values are added one by one
+    candles_manager.replace_all_candles(all_candles[:2] + [[3, 30]])
+    assert candles_manager.get_symbol_time_candles().tolist() == [1, 2]
+
+
+def test_replace_all_candles_from_array():
+    candles_manager = CandlesManager(max_candles_count=10)
+    candles_manager.add_old_and_new_candles(_gen_candles(5))
+    all_candles = np.array(_gen_candles(15), dtype=np.float64).T
+    candles_manager.replace_all_candles(all_candles)
+    assert candles_manager.candles_initialized is True
+    assert candles_manager.reached_max is True
+    assert candles_manager.get_candles_count() == 10
+    assert np.array_equal(candles_manager.get_candles(), all_candles[:, -10:])
+    assert candles_manager.candles_times == set(range(6, 16))
+
+    # candles following the replaced ones are appended
+    candles_manager.add_new_candle(_get_candle(16))
+    assert candles_manager.get_last_candle_time() == 16
+    assert candles_manager.get_symbol_time_candles(2).tolist() == [15, 16]
+    candles_manager.add_new_candle(_get_candle(10))
+    assert candles_manager.get_candles_count() == 10
 
 
 def test_get_symbol_prices():
@@ -122,12 +173,133 @@ def test_reach_max_candles_count():
     assert candles_manager.reached_max is True
     _test_data(candles_manager.get_symbol_close_candles(), candles_manager.MAX_CANDLES_COUNT,
                max_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
-    assert candles_manager.close_candles_index == candles_manager.MAX_CANDLES_COUNT - 1
+    assert candles_manager.candles_index == 0
+    assert candles_manager.get_candles_count() == candles_manager.MAX_CANDLES_COUNT
 
     # should remove oldest (first) candles and insert new ones instead
     candles_manager.add_old_and_new_candles(other_candles)
     _test_data(candles_manager.get_symbol_close_candles(), candles_manager.MAX_CANDLES_COUNT,
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
+    assert candles_manager.candles_index == len(other_candles)
+    assert candles_manager.get_candles_count() == candles_manager.MAX_CANDLES_COUNT
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in all_candles[3:]],
+                                   dtype=np.float64))
+
+
+def test_get_symbol_candles_with_limit_after_max_candles_count():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    last_times = candles_manager.get_symbol_time_candles(20)
+    assert last_times.flags.c_contiguous
+    assert np.array_equal(last_times,
+                          np.array([candle[PriceIndexes.IND_PRICE_TIME.value] for candle in all_candles[-20:]],
+                                   dtype=np.float64))
+    assert len(candles_manager.get_symbol_time_candles(candles_manager.MAX_CANDLES_COUNT + 5)) == \
+        candles_manager.MAX_CANDLES_COUNT
+
+
+def test_add_duplicated_candle():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(3)
+    candles_manager.add_old_and_new_candles(candles)
+    candles_manager.add_new_candle(candles[1])
+    candles_manager.add_old_and_new_candles(candles)
+    assert candles_manager.get_candles_count() == 3
+    assert candles_manager.candles_times == {1, 2, 3}
+
+
+def test_add_old_candle():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(5)
+    candles_manager.add_old_and_new_candles([candles[0], candles[2], candles[4]])
+    candles_manager.add_new_candle(candles[3])
+    candles_manager.add_old_and_new_candles([candles[1], candles[4]])
+    assert candles_manager.get_candles_count() == 5
+    assert np.array_equal(candles_manager.get_symbol_time_candles(), np.array([1, 2, 3, 4, 5], dtype=np.float64))
+    assert np.array_equal(candles_manager.get_symbol_close_candles(),
+                          np.array([candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles],
+                                   dtype=np.float64))
+
+    # new candles are still appended after the inserted ones
+    candles_manager.add_new_candle(_get_candle(6))
+    assert np.array_equal(candles_manager.get_symbol_time_candles(), np.array([1, 2, 3, 4, 5, 6], dtype=np.float64))
+
+
+def test_add_old_candle_after_max_candles_count():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 11)
+    missing_candle = all_candles.pop(-5)
+    candles_manager.add_old_and_new_candles(all_candles)
+    assert candles_manager.get_symbol_time_candles()[0] == 11
+
+    # older than any stored candle: ignored
+    candles_manager.add_new_candle(_get_candle(5))
+    assert candles_manager.get_symbol_time_candles()[0] == 11
+    assert 5 not in candles_manager.candles_times
+
+    # inserted, oldest candle is removed
+    candles_manager.add_new_candle(missing_candle)
+    assert candles_manager.get_candles_count() == candles_manager.MAX_CANDLES_COUNT
+    assert candles_manager.get_symbol_time_candles()[0] == 12
+    assert 11 not in candles_manager.candles_times
+    assert np.array_equal(candles_manager.get_symbol_time_candles(5),
+                          np.array([1007, 1008, 1009, 1010, 1011], dtype=np.float64))
+    assert len(candles_manager.candles_times) == candles_manager.MAX_CANDLES_COUNT
+
+    candles_manager.add_new_candle(_get_candle(1012))
+    assert candles_manager.get_symbol_time_candles()[0] == 13
+    assert candles_manager.get_symbol_time_candles()[-1] == 1012
+    assert len(candles_manager.candles_times) == candles_manager.MAX_CANDLES_COUNT
+
+
+def test_get_candles():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 10)
+    candles_manager.add_old_and_new_candles(all_candles)
+    candles = candles_manager.get_candles(3)
+    assert candles.shape == (len(PriceIndexes), 3)
+    assert np.array_equal(candles, np.array(all_candles[-3:], dtype=np.float64).T)
+    assert np.shares_memory(candles, candles_manager.candles)
+    assert candles_manager.get_candles().shape == (len(PriceIndexes), candles_manager.MAX_CANDLES_COUNT)
+
+    # views are read-only
+    for view in (candles[PriceIndexes.IND_PRICE_CLOSE.value],
+                 candles_manager.get_symbol_close_candles(),
+                 candles_manager.get_symbol_prices()[PriceIndexes.IND_PRICE_CLOSE.value]):
+        with pytest.raises(ValueError):
+            view[0] = 1
+    assert candles_manager.get_symbol_close_candles().flags.c_contiguous
+
+
+def test_get_candles_with_in_construction_candle():
+    candles_manager = CandlesManager(max_candles_count=10)
+    assert candles_manager.get_symbol_close_candles(include_in_construction=True).size == 0
+    candles_manager.add_old_and_new_candles(_gen_candles(5))
+    # no in construction candle yet
+    assert np.isnan(candles_manager.get_symbol_close_candles(include_in_construction=True)[-1])
+
+    candles_manager.set_in_construction_candle(_get_candle(6))
+    close_candles = candles_manager.get_symbol_close_candles(3, include_in_construction=True)
+    assert close_candles.tolist() == [40000, 50000, 60000]
+    assert np.shares_memory(close_candles, candles_manager.candles)
+    assert candles_manager.get_symbol_close_candles(include_in_construction=True).tolist() == [20000, 30000, 40000, 50000, 60000]
+    assert candles_manager.get_symbol_close_candles().tolist() == [10000, 20000, 30000, 40000, 50000]
+
+    # in construction candle follows the last candle after the ring is full and after candles replacement
+    for candle in _gen_candles(16)[5:]:
+        candles_manager.add_new_candle(candle)
+        candles_manager.set_in_construction_candle(_get_candle(candle[PriceIndexes.IND_PRICE_TIME.value] + 1))
+        time_candles = candles_manager.get_symbol_time_candles(include_in_construction=True)
+        assert time_candles[:-1].tolist() == candles_manager.get_symbol_time_candles()[1:].tolist()
+        assert time_candles[-1] == candle[PriceIndexes.IND_PRICE_TIME.value] + 1
+    candles_manager.add_new_candle(_get_candle(3))
+    assert candles_manager.get_candles(2, include_in_construction=True).T.tolist() == \
+        [_get_candle(16), _get_candle(17)]
+    candles_manager.replace_all_candles(_gen_candles(4))
+    assert candles_manager.get_symbol_time_candles(2, include_in_construction=True).tolist() == [4, 17]
+    assert candles_manager.get_symbol_time_candles().tolist() == [1, 2, 3, 4]
 
 
 def _test_data(candles_data, expected_len, expected_last_val):
@@ -0,0 +1,67 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+
+import numpy as np
+
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.data_manager.candles_manager import CandlesManager
+from octobot_trading.data_manager.candles_storage import CandlesStorage
+
+EXCHANGE_NAME = "binance"
+SYMBOL = "BTC/USDT"
+
+
+def test_save_and_load_candles(tmp_path):
+    candles_storage = CandlesStorage(str(tmp_path))
+    assert candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR) is None
+
+    candles_manager = CandlesManager(max_candles_count=10)
+    candles_manager.add_old_and_new_candles(_gen_candles(15))
+    candles_storage.save_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR, candles_manager.get_candles())
+    assert os.path.isfile(candles_storage.get_candles_file_path(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR))
+    assert candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_MINUTE) is None
+
+    stored_candles = candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR)
+    assert isinstance(stored_candles, np.memmap)
+    assert np.array_equal(stored_candles, candles_manager.get_candles())
+
+    # warm start a new candles manager
+    new_candles_manager = CandlesManager(max_candles_count=10)
+    new_candles_manager.replace_all_candles(stored_candles)
+    assert np.array_equal(new_candles_manager.get_candles(), candles_manager.get_candles())
+    assert new_candles_manager.get_last_candle_time() == 15
+
+
+def test_save_empty_candles(tmp_path):
+    candles_storage = CandlesStorage(str(tmp_path))
+    candles_storage.save_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR, CandlesManager().get_candles())
+    assert candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR) is None
+
+
+def test_load_invalid_candles(tmp_path):
+    candles_storage = CandlesStorage(str(tmp_path))
+    file_path = candles_storage.get_candles_file_path(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR)
+    os.makedirs(os.path.dirname(file_path))
+    np.save(file_path, np.ones((len(PriceIndexes) + 1, 3)))
+    assert candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR) is None
+    with open(file_path, "w") as candles_file:
+        candles_file.write("invalid")
+    assert candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR) is None
+
+
+def _gen_candles(size) -> list:
+    return [[seed, seed * 10, seed * 100, seed * 1000, seed * 10000, seed * 100000] for seed in range(1, size + 1)]
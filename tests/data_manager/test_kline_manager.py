@@ -0,0 +1,79 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes
+
+from octobot_trading.data_manager.kline_manager import KlineManager
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_init():
+    kline_manager = await _init_kline_manager()
+    assert kline_manager.kline.dtype == np.float64
+    assert len(kline_manager.kline) == len(PriceIndexes)
+    assert np.isnan(kline_manager.kline).all()
+
+
+async def test_kline_update():
+    kline_manager = await _init_kline_manager()
+    kline_manager.kline_update([1, 10, 12, 9, 11, 100])
+    assert list(kline_manager.kline) == [1, 10, 12, 9, 11, 100]
+
+    # same candle: high and low are extended, close is replaced, time, open and volume are kept
+    kline_manager.kline_update([1, 15, 13, 10, 12, 150])
+    assert list(kline_manager.kline) == [1, 10, 13, 9, 12, 100]
+    kline_manager.kline_update([1, 15, 11, 8, 10, 150])
+    assert list(kline_manager.kline) == [1, 10, 13, 8, 10, 100]
+
+    # new candle
+    kline_manager.kline_update([2, 10, 11, 9, 10, 10])
+    assert list(kline_manager.kline) == [2, 10, 11, 9, 10, 10]
+
+
+async def test_kline_update_with_missing_values():
+    kline_manager = await _init_kline_manager()
+    kline_manager.kline_update([1, None, 12, None, 11, None])
+    kline_manager.kline_update([1, 10, None, 9, 11, 100])
+    assert list(kline_manager.kline) == [1, 10, 12, 9, 11, 100]
+
+
+async def test_kline_update_with_invalid_values():
+    kline_manager = await _init_kline_manager()
+    kline_manager.kline_update([1, 10, 12, 9, 11, 100])
+    kline_manager.kline_update([1, "a", 12, 9, 11, 100])
+    kline_manager.kline_update(None)
+    assert list(kline_manager.kline) == [1, 10, 12, 9, 11, 100]
+
+
+async def test_get_kline():
+    kline_manager = await _init_kline_manager()
+    kline = kline_manager.get_kline()
+    assert not kline.flags.writeable
+    kline_manager.kline_update([1, 10, 12, 9, 11, 100])
+    # view is updated in place
+    assert list(kline) == [1, 10, 12, 9, 11, 100]
+    with pytest.raises(ValueError):
+        kline[0] = 2
+
+
+async def _init_kline_manager():
+    kline_manager = KlineManager()
+    await kline_manager.initialize()
+    return kline_manager
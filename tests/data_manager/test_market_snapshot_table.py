@@ -0,0 +1,62 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+from octobot_trading.data_manager.market_snapshot_table import MarketSnapshotTable
+from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsMarketSnapshotColumns
+
+
+def test_update_row():
+    market_snapshot_table = MarketSnapshotTable()
+    btc_row = market_snapshot_table.get_symbol_row("BTC/USDT")
+    eth_row = market_snapshot_table.get_symbol_row("ETH/USDT")
+    assert market_snapshot_table.get_symbol_row("BTC/USDT") == btc_row
+    market_snapshot_table.update_row(btc_row, {
+        ExchangeConstantsTickersColumns.LAST.value: 10000,
+        ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value: 10001,
+        ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value: None,
+        "unknown": "value"
+    })
+    market_snapshot_table.update_row(eth_row, {ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value: 0.01})
+    assert market_snapshot_table.get_row_value(btc_row, ExchangeConstantsTickersColumns.LAST.value) == 10000
+    assert np.isnan(market_snapshot_table.get_row_value(btc_row,
+                                                        ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value))
+    columns = market_snapshot_table.get_columns((ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value,
+                                                 ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value))
+    assert columns[ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value][0] == 10001
+    assert np.isnan(columns[ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value][1])
+    assert columns[ExchangeConstantsMarketSnapshotColumns.FUNDING_RATE.value][1] == 0.01
+    assert set(market_snapshot_table.get_columns()) == set(MarketSnapshotTable.COLUMNS)
+
+
+def test_reset_row():
+    market_snapshot_table = MarketSnapshotTable()
+    row = market_snapshot_table.get_symbol_row("BTC/USDT")
+    market_snapshot_table.update_row(row, {
+        ExchangeConstantsTickersColumns.LAST.value: 10000,
+        ExchangeConstantsTickersColumns.TIMESTAMP.value: 1,
+        ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value: 10001,
+    })
+    market_snapshot_table.reset_row(row, MarketSnapshotTable.TICKER_COLUMNS)
+    assert np.isnan(market_snapshot_table.get_row_value(row, ExchangeConstantsTickersColumns.LAST.value))
+    assert market_snapshot_table.get_row_value(row, ExchangeConstantsTickersColumns.TIMESTAMP.value) == 0
+    assert market_snapshot_table.get_row_value(row, ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value) == 10001
+    market_snapshot_table.reset_row(row)
+    assert np.isnan(market_snapshot_table.get_row_value(row, ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value))
+
+
+def test_market_columns():
+    assert MarketSnapshotTable.MARKET_COLUMNS == tuple(column.value for column in ExchangeConstantsMarketSnapshotColumns)
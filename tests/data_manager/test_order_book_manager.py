@@ -0,0 +1,174 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_trading.data_manager.order_book_manager import OrderBookManager
+from octobot_trading.enums import ExchangeConstantsOrderColumns, TradeOrderSide
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_order_book_update():
+    order_book_manager = await _init_order_book_manager()
+    assert order_book_manager.get_best_ask() is None
+    assert order_book_manager.get_best_bid() is None
+
+    order_book_manager.order_book_update([[12, 1], [11, 2], [13, 3]], [[9, 1], [10, 2], [8, 3]])
+    assert order_book_manager.order_book_initialized is True
+    assert order_book_manager.get_best_ask() == (11, 2)
+    assert order_book_manager.get_best_bid() == (10, 2)
+    assert order_book_manager.get_asks() == [[11, 2], [12, 1], [13, 3]]
+    assert order_book_manager.get_bids() == [[10, 2], [9, 1], [8, 3]]
+    assert order_book_manager.get_asks(2) == [[11, 2], [12, 1]]
+    assert order_book_manager.get_bids(2) == [[10, 2], [9, 1]]
+    assert order_book_manager.get_bids(10) == [[10, 2], [9, 1], [8, 3]]
+    # read-only levels attributes
+    assert order_book_manager.asks == [[11, 2], [12, 1], [13, 3]]
+    assert order_book_manager.bids == [[10, 2], [9, 1], [8, 3]]
+    with pytest.raises(AttributeError):
+        order_book_manager.asks = []
+
+    # only given sides are replaced
+    order_book_manager.order_book_update([[14, 1]], [])
+    assert order_book_manager.get_asks() == [[14, 1]]
+    assert order_book_manager.get_bids() == [[10, 2], [9, 1], [8, 3]]
+
+
+async def test_order_book_delta_update():
+    order_book_manager = await _init_order_book_manager()
+    order_book_manager.order_book_update([[11, 2], [12, 1]], [[10, 2], [9, 1]])
+    order_book_manager.order_book_delta_update([[10.5, 4], [12, 0], [11, 1]], [[10, 0], [9.5, 3]])
+    assert order_book_manager.get_asks() == [[10.5, 4], [11, 1]]
+    assert order_book_manager.get_bids() == [[9.5, 3], [9, 1]]
+    # removing a missing level is ignored
+    order_book_manager.order_book_delta_update([[20, 0]], [])
+    assert order_book_manager.get_asks() == [[10.5, 4], [11, 1]]
+
+
+async def test_depth_queries():
+    order_book_manager = await _init_order_book_manager()
+    order_book_manager.order_book_update([[11, 2], [12, 1], [13, 3]], [[10, 2], [9, 1], [8, 3]])
+    assert order_book_manager.get_depth_at_price(TradeOrderSide.SELL, 12) == 1
+    assert order_book_manager.get_depth_at_price(TradeOrderSide.BUY, 12) == 0
+    assert order_book_manager.get_depth_at_price(TradeOrderSide.BUY, 8) == 3
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.SELL, 12) == 3
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.SELL, 12.5) == 3
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.SELL, 10) == 0
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.BUY, 9) == 3
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.BUY, 1) == 6
+
+
+async def test_order_book_orders_updates():
+    order_book_manager = await _init_order_book_manager()
+    order_book_manager.order_book_orders_update([
+        _get_order(1, TradeOrderSide.SELL.value, 11, 1),
+        _get_order(2, TradeOrderSide.SELL.value, 11, 0.5),
+        _get_order(3, TradeOrderSide.SELL.value, 12, 2),
+        _get_order(4, "Buy", 10, 3),
+    ])
+    assert order_book_manager.get_asks() == [[11, 1.5], [12, 2]]
+    assert order_book_manager.get_bids() == [[10, 3]]
+
+    order_book_manager.order_book_orders_delta_insert([_get_order(5, TradeOrderSide.BUY.value, 10.5, 1)])
+    assert order_book_manager.get_best_bid() == (10.5, 1)
+
+    # price and amount changes
+    order_book_manager.order_book_orders_delta_update([
+        {ExchangeConstantsOrderColumns.ID.value: 1, ExchangeConstantsOrderColumns.PRICE.value: 12},
+        {ExchangeConstantsOrderColumns.ID.value: 4, ExchangeConstantsOrderColumns.AMOUNT.value: 1},
+        {ExchangeConstantsOrderColumns.ID.value: 42, ExchangeConstantsOrderColumns.AMOUNT.value: 1},
+    ])
+    assert order_book_manager.get_asks() == [[11, 0.5], [12, 3]]
+    assert order_book_manager.get_bids() == [[10.5, 1], [10, 1]]
+
+    # levels without orders are removed
+    order_book_manager.order_book_orders_delta_delete([{ExchangeConstantsOrderColumns.ID.value: 2},
+                                                       {ExchangeConstantsOrderColumns.ID.value: 5},
+                                                       {ExchangeConstantsOrderColumns.ID.value: 42}])
+    assert order_book_manager.get_asks() == [[12, 3]]
+    assert order_book_manager.get_bids() == [[10, 1]]
+    assert len(order_book_manager.orders) == 3
+
+
+async def test_analytics():
+    order_book_manager = await _init_order_book_manager()
+    assert np.isnan(order_book_manager.get_vwap(TradeOrderSide.SELL, 1))
+    assert np.isnan(order_book_manager.get_slippage(TradeOrderSide.SELL, 1))
+    assert np.isnan(order_book_manager.get_imbalance(5))
+
+    order_book_manager.order_book_update([[10, 1], [11, 2], [12, 3]], [[9, 1], [8, 1], [7, 1]])
+    assert order_book_manager.get_vwap(TradeOrderSide.SELL, 0.5) == 10
+    assert order_book_manager.get_vwap(TradeOrderSide.SELL, 2) == (10 + 11) / 2
+    assert order_book_manager.get_vwap(TradeOrderSide.SELL, 6) == (10 + 22 + 36) / 6
+    assert np.isnan(order_book_manager.get_vwap(TradeOrderSide.SELL, 7))
+    assert order_book_manager.get_vwap(TradeOrderSide.BUY, 3) == 8
+    assert order_book_manager.get_slippage(TradeOrderSide.SELL, 2) == 0.05
+    assert order_book_manager.get_slippage(TradeOrderSide.BUY, 3) == 1 / 9
+    assert order_book_manager.get_imbalance(1) == 0
+    assert order_book_manager.get_imbalance(10) == (3 - 6) / 9
+    prices, cumulative_sizes = order_book_manager.get_cumulative_depth_arrays(TradeOrderSide.BUY)
+    assert prices.tolist() == [9, 8, 7]
+    assert cumulative_sizes.tolist() == [1, 2, 3]
+
+    # results are cached until the next update
+    version = order_book_manager.version
+    assert order_book_manager.get_cumulative_depth_arrays(TradeOrderSide.BUY)[0] is prices
+    order_book_manager.order_book_delta_update([[10, 0]], [])
+    assert order_book_manager.version == version + 1
+    assert order_book_manager.get_cumulative_depth_arrays(TradeOrderSide.BUY)[0] is not prices
+    assert order_book_manager.get_vwap(TradeOrderSide.SELL, 2) == 11
+    assert order_book_manager.get_cumulative_depth(TradeOrderSide.SELL, 11) == 2
+
+
+async def test_invalid_sides():
+    order_book_manager = await _init_order_book_manager()
+    order_book_manager.order_book_update([[11, 2]], [[10, 2]])
+    # sides are TradeOrderSide values, raw strings are rejected instead of being read as bids
+    for side in (TradeOrderSide.SELL.value, "bids", None):
+        with pytest.raises(ValueError):
+            order_book_manager.get_depth_at_price(side, 11)
+        with pytest.raises(ValueError):
+            order_book_manager.get_cumulative_depth(side, 11)
+        with pytest.raises(ValueError):
+            order_book_manager.get_cumulative_depth_arrays(side)
+        with pytest.raises(ValueError):
+            order_book_manager.get_vwap(side, 1)
+        with pytest.raises(ValueError):
+            order_book_manager.get_slippage(side, 1)
+
+    # L3 orders raw sides are parsed
+    with pytest.raises(ValueError):
+        order_book_manager.order_book_orders_delta_insert([_get_order(1, "ask", 11, 1)])
+    order_book_manager.order_book_orders_delta_insert([_get_order(2, "SELL", 12, 1)])
+    assert order_book_manager.orders[2] == (TradeOrderSide.SELL, 12, 1)
+    assert order_book_manager.get_depth_at_price(TradeOrderSide.SELL, 12) == 1
+
+
+async def _init_order_book_manager():
+    order_book_manager = OrderBookManager()
+    await order_book_manager.initialize()
+    return order_book_manager
+
+
+def _get_order(order_id, side, price, amount):
+    return {
+        ExchangeConstantsOrderColumns.ID.value: order_id,
+        ExchangeConstantsOrderColumns.SIDE.value: side,
+        ExchangeConstantsOrderColumns.PRICE.value: price,
+        ExchangeConstantsOrderColumns.AMOUNT.value: amount
+    }
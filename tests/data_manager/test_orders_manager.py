@@ -0,0 +1,100 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import pytest
+
+from octobot_commons.tests.test_config import load_test_config
+from octobot_trading.enums import TraderOrderType, OrderStatus
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.orders.order_factory import create_order_instance
+from octobot_trading.traders.trader_simulator import TraderSimulator
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_get_orders_by_symbol_and_status():
+    exchange_manager, trader = await _init_trader()
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    btc_order_1 = _create_order(trader, "BTC/USDT", 3)
+    eth_order = _create_order(trader, "ETH/USDT", 2)
+    btc_order_2 = _create_order(trader, "BTC/USDT", 1)
+    for order in (btc_order_1, eth_order, btc_order_2):
+        assert orders_manager.upsert_order_instance(order)
+
+    # insertion sorted
+    assert orders_manager.get_open_orders() == [btc_order_1, eth_order, btc_order_2]
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [btc_order_1, btc_order_2]
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [eth_order]
+    assert orders_manager.get_open_orders(symbol="XRP/USDT") == []
+    assert orders_manager.get_open_orders(since=3) == [eth_order, btc_order_2]
+    assert orders_manager.get_open_orders(since=0) == []
+    assert orders_manager.get_open_orders(limit=1) == [btc_order_1]
+    assert orders_manager.get_closed_orders() == []
+
+    # status updated outside of the orders manager
+    btc_order_1.status = OrderStatus.CLOSED
+    assert orders_manager.orders_index_keys[btc_order_1.order_id][1] is OrderStatus.CLOSED
+    assert orders_manager.get_open_orders(symbol="BTC/USDT") == [btc_order_2]
+    assert orders_manager.get_closed_orders() == [btc_order_1]
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == [btc_order_1, btc_order_2]
+
+    orders_manager.remove_order_instance(btc_order_2)
+    assert orders_manager.get_open_orders() == [eth_order]
+    assert orders_manager.get_all_orders(symbol="BTC/USDT") == [btc_order_1]
+    await exchange_manager.stop()
+
+
+async def test_get_triggered_open_orders():
+    exchange_manager, trader = await _init_trader()
+    orders_manager = exchange_manager.exchange_personal_data.orders_manager
+    buy_limit = _create_order(trader, "BTC/USDT", 1, order_type=TraderOrderType.BUY_LIMIT, price=9)
+    sell_limit = _create_order(trader, "BTC/USDT", 2, order_type=TraderOrderType.SELL_LIMIT, price=11)
+    stop_loss = _create_order(trader, "BTC/USDT", 3, order_type=TraderOrderType.STOP_LOSS, price=5)
+    market = _create_order(trader, "BTC/USDT", 4, order_type=TraderOrderType.BUY_MARKET, price=10)
+    for order in (buy_limit, sell_limit, stop_loss, market):
+        orders_manager.upsert_order_instance(order)
+
+    # market orders are always checked
+    assert orders_manager.get_triggered_open_orders("BTC/USDT", 10, 10) == [market]
+    assert orders_manager.get_triggered_open_orders("BTC/USDT", 8, 10) == [buy_limit, market]
+    assert orders_manager.get_triggered_open_orders("BTC/USDT", 4, 12) == [buy_limit, sell_limit, stop_loss, market]
+    assert orders_manager.get_triggered_open_orders("ETH/USDT", 4, 12) == []
+
+    # status updated outside of the orders manager
+    buy_limit.status = OrderStatus.FILLED
+    assert orders_manager.get_triggered_open_orders("BTC/USDT", 8, 10) == [market]
+    await exchange_manager.stop()
+
+
+async def _init_trader():
+    config = load_test_config()
+    exchange_manager = ExchangeManager(config, "binance")
+    exchange_manager.is_simulated = True
+    await exchange_manager.initialize()
+
+    trader = TraderSimulator(config, exchange_manager)
+    await trader.initialize()
+    return exchange_manager, trader
+
+
+def _create_order(trader, symbol, timestamp, order_type=TraderOrderType.BUY_LIMIT, price=10):
+    return create_order_instance(trader=trader,
+                                 order_type=order_type,
+                                 symbol=symbol,
+                                 current_price=10,
+                                 quantity=1,
+                                 price=price,
+                                 timestamp=timestamp)
@@ -0,0 +1,104 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_trading.data_manager.recent_trades_manager import RecentTradesManager
+from octobot_trading.enums import ExchangeConstantsOrderColumns, TradeOrderSide
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_add_new_trades():
+    recent_trades_manager = await _init_recent_trades_manager()
+    trades = _gen_trades(10)
+    assert recent_trades_manager.add_new_trades(trades) == trades
+    assert recent_trades_manager.get_recent_trades_count() == 10
+    assert recent_trades_manager.get_recent_trades_prices().tolist() == [trade["price"] for trade in trades]
+    assert recent_trades_manager.get_recent_trades_timestamps(2).tolist() == [9, 10]
+    assert recent_trades_manager.get_recent_trades_amounts(1).tolist() == [10]
+    assert recent_trades_manager.get_recent_trades_sides(2).tolist() == [RecentTradesManager.BUY_SIDE_VALUE,
+                                                                         RecentTradesManager.SELL_SIDE_VALUE]
+    assert recent_trades_manager.get_recent_trades_ids(1).tolist() == ["10"]
+
+    # already stored trades are ignored
+    new_trades = _gen_trades(12)[8:]
+    assert recent_trades_manager.add_new_trades(new_trades) == new_trades[2:]
+    assert recent_trades_manager.get_recent_trades_count() == 12
+    with pytest.raises(ValueError):
+        recent_trades_manager.get_recent_trades_prices()[0] = 1
+
+
+async def test_add_new_trades_without_id():
+    recent_trades_manager = await _init_recent_trades_manager()
+    trade = {
+        ExchangeConstantsOrderColumns.TIMESTAMP.value: 1,
+        ExchangeConstantsOrderColumns.PRICE.value: 10
+    }
+    assert recent_trades_manager.add_new_trades([trade, dict(trade)]) == [trade]
+    assert recent_trades_manager.add_recent_trade(dict(trade)) == []
+    assert np.isnan(recent_trades_manager.get_recent_trades_amounts()).all()
+    assert np.isnan(recent_trades_manager.get_recent_trades_sides()).all()
+    assert recent_trades_manager.get_recent_trades_ids().tolist() == [None]
+    # invalid trade
+    assert recent_trades_manager.add_recent_trade({ExchangeConstantsOrderColumns.PRICE.value: 10}) == []
+    assert recent_trades_manager.get_recent_trades_count() == 1
+
+
+async def test_reach_max_recent_trades_count():
+    recent_trades_manager = await _init_recent_trades_manager()
+    max_count = RecentTradesManager.MAX_RECENT_TRADES_COUNT
+    trades = _gen_trades(max_count + 10)
+    recent_trades_manager.add_new_trades(trades)
+    assert recent_trades_manager.reached_max is True
+    assert recent_trades_manager.get_recent_trades_count() == max_count
+    assert recent_trades_manager.get_recent_trades_timestamps().tolist() == list(range(11, max_count + 11))
+    assert len(recent_trades_manager.recent_trades_keys) == max_count
+
+    # removed trades are not known anymore
+    assert recent_trades_manager.add_recent_trade(trades[0]) == [trades[0]]
+    assert recent_trades_manager.add_recent_trade(trades[-1]) == []
+    assert recent_trades_manager.get_recent_trades_timestamps(2).tolist() == [max_count + 10, 1]
+
+
+async def test_set_all_recent_trades():
+    recent_trades_manager = await _init_recent_trades_manager()
+    recent_trades_manager.add_new_trades(_gen_trades(10))
+    trades = _gen_trades(3)
+    assert recent_trades_manager.set_all_recent_trades(trades) == trades
+    assert recent_trades_manager.get_recent_trades_count() == 3
+    assert recent_trades_manager.get_recent_trades_timestamps().tolist() == [1, 2, 3]
+
+
+async def _init_recent_trades_manager():
+    recent_trades_manager = RecentTradesManager()
+    await recent_trades_manager.initialize()
+    return recent_trades_manager
+
+
+def _gen_trades(size):
+    return [
+        {
+            ExchangeConstantsOrderColumns.ID.value: str(seed),
+            ExchangeConstantsOrderColumns.TIMESTAMP.value: seed,
+            ExchangeConstantsOrderColumns.PRICE.value: seed * 10,
+            ExchangeConstantsOrderColumns.AMOUNT.value: seed,
+            ExchangeConstantsOrderColumns.SIDE.value:
+                TradeOrderSide.BUY.value if seed % 2 else TradeOrderSide.SELL.value
+        }
+        for seed in range(1, size + 1)
+    ]
@@ -0,0 +1,93 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_trading.data_manager.ticker_manager import TickerManager
+from octobot_trading.data_manager.market_snapshot_table import MarketSnapshotTable
+from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsMiniTickerColumns
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_ticker_update():
+    ticker_manager = await _init_ticker_manager("BTC/USDT")
+    ticker = ticker_manager.get_ticker()
+    assert ticker[ExchangeConstantsTickersColumns.SYMBOL.value] == "BTC/USDT"
+    assert ticker[ExchangeConstantsTickersColumns.TIMESTAMP.value] == 0
+    assert np.isnan(ticker[ExchangeConstantsTickersColumns.LAST.value])
+
+    ticker_manager.ticker_update({
+        ExchangeConstantsTickersColumns.LAST.value: 10,
+        ExchangeConstantsTickersColumns.BID.value: 9,
+        ExchangeConstantsTickersColumns.ASK.value: None,
+        ExchangeConstantsTickersColumns.TIMESTAMP.value: 1,
+        ExchangeConstantsTickersColumns.INFO.value: {"last": "10"},
+    })
+    assert ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.LAST.value) == 10
+    assert ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.BID.value) == 9
+    assert np.isnan(ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.ASK.value))
+    assert ticker_manager.get_ticker()[ExchangeConstantsTickersColumns.TIMESTAMP.value] == 1
+    assert list(ticker_manager.ticker) == list(ticker_manager.get_ticker())
+    assert ticker_manager.ticker[ExchangeConstantsTickersColumns.BID.value] == 9
+
+    # partial updates keep other values
+    ticker_manager.ticker_update({ExchangeConstantsTickersColumns.LAST.value: 11})
+    assert ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.LAST.value) == 11
+    assert ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.BID.value) == 9
+
+    # invalid updates are ignored
+    ticker_manager.ticker_update({ExchangeConstantsTickersColumns.LAST.value: "invalid"})
+    assert ticker_manager.get_ticker_value(ExchangeConstantsTickersColumns.LAST.value) == 11
+
+
+async def test_mini_ticker_update():
+    ticker_manager = await _init_ticker_manager("BTC/USDT")
+    ticker_manager.mini_ticker_update({
+        ExchangeConstantsMiniTickerColumns.CLOSE_PRICE.value: 10,
+        ExchangeConstantsMiniTickerColumns.SYMBOL.value: "BTC/USDT",
+    })
+    mini_ticker = ticker_manager.get_mini_ticker()
+    assert mini_ticker[ExchangeConstantsMiniTickerColumns.CLOSE_PRICE.value] == 10
+    assert mini_ticker[ExchangeConstantsMiniTickerColumns.TIMESTAMP.value] == 0
+    assert np.isnan(mini_ticker[ExchangeConstantsMiniTickerColumns.VOLUME.value])
+    assert ticker_manager.mini_ticker[ExchangeConstantsMiniTickerColumns.CLOSE_PRICE.value] == 10
+    assert ticker_manager.mini_ticker[ExchangeConstantsMiniTickerColumns.SYMBOL.value] == "BTC/USDT"
+
+
+async def test_shared_market_snapshot_table():
+    market_snapshot_table = MarketSnapshotTable()
+    symbols = [f"{index}/USDT" for index in range(MarketSnapshotTable.INITIAL_SYMBOLS_CAPACITY + 5)]
+    ticker_managers = [await _init_ticker_manager(symbol, market_snapshot_table) for symbol in symbols]
+    for index, ticker_manager in enumerate(ticker_managers):
+        ticker_manager.ticker_update({ExchangeConstantsTickersColumns.LAST.value: index})
+    assert market_snapshot_table.symbols == symbols
+    last_prices = market_snapshot_table.get_column(ExchangeConstantsTickersColumns.LAST.value)
+    assert last_prices.tolist() == list(range(len(symbols)))
+    with pytest.raises(ValueError):
+        last_prices[0] = 1
+    assert ticker_managers[0].get_ticker_value(ExchangeConstantsTickersColumns.LAST.value) == 0
+    assert market_snapshot_table.get_symbol_row(symbols[2]) == 2
+
+    market_snapshot_table.reset_row(1)
+    assert np.isnan(market_snapshot_table.get_column(ExchangeConstantsTickersColumns.LAST.value)[1])
+
+
+async def _init_ticker_manager(symbol, market_snapshot_table=None):
+    ticker_manager = TickerManager(symbol=symbol, market_snapshot_table=market_snapshot_table)
+    await ticker_manager.initialize()
+    return ticker_manager
@@ -0,0 +1,96 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_trading.data_manager.trades_journal import TradesJournal
+from octobot_trading.enums import ExchangeConstantsOrderColumns, FeePropertyColumns
+
+
+def test_add_and_get_trades(tmp_path):
+    journal_path = str(tmp_path / "history" / "binance.sqlite")
+    trades_journal = TradesJournal(journal_path)
+    trades = [_gen_trade(str(i), "BTC/USDT" if i % 2 else "ETH/USDT", i) for i in range(1, 11)]
+    for trade in trades:
+        trades_journal.add_trade(trade)
+    # written on flush
+    assert trades_journal.pending_trades
+    assert trades_journal.flush() == 10
+    assert trades_journal.pending_trades == []
+    trades_journal.add_trade(trades[0])
+    assert trades_journal.flush() == 0
+    assert trades_journal.has_trade("1")
+    assert not trades_journal.has_trade("11")
+    assert trades_journal.get_trades_count() == 10
+    assert trades_journal.get_trades() == trades
+    assert trades_journal.get_trades(symbol="BTC/USDT", since=5) == [trades[6], trades[8]]
+    assert trades_journal.get_trades(limit=2) == trades[-2:]
+    assert trades_journal.get_paid_fees() == {"BTC": 25, "ETH": 30}
+    trades_journal.close()
+
+    # the journal is reloaded from disk
+    trades_journal = TradesJournal(journal_path)
+    assert trades_journal.get_trades_count() == 10
+    assert trades_journal.get_paid_fees() == {"BTC": 25, "ETH": 30}
+    trades_journal.close()
+
+
+def test_flush(tmp_path):
+    journal_path = str(tmp_path / "binance.sqlite")
+    trades_journal = TradesJournal(journal_path)
+    for i in range(1, TradesJournal.FLUSH_SIZE):
+        trades_journal.add_trade(_gen_trade(str(i), "BTC/USDT", i))
+    assert len(trades_journal.pending_trades) == TradesJournal.FLUSH_SIZE - 1
+    trades_journal.add_trade(_gen_trade(str(TradesJournal.FLUSH_SIZE), "BTC/USDT", TradesJournal.FLUSH_SIZE))
+    assert trades_journal.pending_trades == []
+
+    # reads flush pending trades
+    trades_journal.add_trade(_gen_trade("a", "BTC/USDT", 1000))
+    assert trades_journal.has_trade("a")
+    trades_journal.add_trade(_gen_trade("b", "BTC/USDT", 1001))
+    assert trades_journal.get_trades_count() == TradesJournal.FLUSH_SIZE + 2
+
+    # flushed after FLUSH_INTERVAL
+    trades_journal.last_flush_time -= TradesJournal.FLUSH_INTERVAL
+    trades_journal.add_trade(_gen_trade("c", "BTC/USDT", 1002))
+    assert trades_journal.pending_trades == []
+
+    # pending trades are written on close
+    trades_journal.add_trade(_gen_trade("d", "BTC/USDT", 1003))
+    trades_journal.close()
+    trades_journal = TradesJournal(journal_path)
+    assert trades_journal.get_trades(limit=1) == [_gen_trade("d", "BTC/USDT", 1003)]
+    trades_journal.close()
+
+
+def test_temporary_journal():
+    trades_journal = TradesJournal()
+    trade = _gen_trade("1", "BTC/USDT", 1)
+    trade[ExchangeConstantsOrderColumns.FEE.value] = None
+    trades_journal.add_trade(trade)
+    assert trades_journal.get_trades() == [trade]
+    assert trades_journal.get_paid_fees() == {}
+    trades_journal.close()
+
+
+def _gen_trade(trade_id, symbol, timestamp) -> dict:
+    return {
+        ExchangeConstantsOrderColumns.ID.value: trade_id,
+        ExchangeConstantsOrderColumns.SYMBOL.value: symbol,
+        ExchangeConstantsOrderColumns.TIMESTAMP.value: timestamp,
+        ExchangeConstantsOrderColumns.PRICE.value: timestamp * 10,
+        ExchangeConstantsOrderColumns.FEE.value: {
+            FeePropertyColumns.CURRENCY.value: symbol.split("/")[0],
+            FeePropertyColumns.COST.value: timestamp
+        }
+    }
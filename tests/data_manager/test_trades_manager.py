@@ -0,0 +1,115 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import os
+
+import pytest
+
+from octobot_commons.tests.test_config import load_test_config
+from octobot_trading.constants import CONFIG_TRADES_HISTORY, CONFIG_TRADES_HISTORY_STORAGE_PATH
+from octobot_trading.data_manager.trades_manager import TradesManager
+from octobot_trading.enums import TraderOrderType, FeePropertyColumns
+from octobot_trading.exchanges.exchange_manager import ExchangeManager
+from octobot_trading.trades.trade_factory import create_trade_instance
+from octobot_trading.traders.trader_simulator import TraderSimulator
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_upsert_trade_instance(monkeypatch):
+    exchange_manager, trader, trades_manager = await _init_trades_manager()
+    monkeypatch.setattr(TradesManager, "MAX_TRADES_COUNT", 10)
+    trades = [_create_trade(trader, str(i), i) for i in range(1, 16)]
+    for trade in trades:
+        trades_manager.upsert_trade_instance(trade)
+    trades_manager.upsert_trade_instance(trades[-1])
+
+    # the oldest trades are removed from memory but remain in the trades history
+    assert list(trades_manager.trades) == [str(i) for i in range(6, 16)]
+    assert [trade["id"] for trade in trades_manager.get_trades_history()] == [str(i) for i in range(1, 16)]
+    assert [trade["id"] for trade in trades_manager.get_trades_history(limit=2)] == ["14", "15"]
+    assert trades_manager.get_total_paid_fees() == {"BTC": sum(range(1, 16))}
+    trades_manager.clear()
+    await exchange_manager.stop()
+
+
+async def test_reinitialize_from_journal(tmp_path):
+    config = load_test_config()
+    config[CONFIG_TRADES_HISTORY] = {CONFIG_TRADES_HISTORY_STORAGE_PATH: str(tmp_path)}
+    exchange_manager, trader, trades_manager = await _init_trades_manager(config)
+    trades = [_create_trade(trader, str(i), i) for i in range(1, 4)]
+    for trade in trades:
+        trades_manager.upsert_trade_instance(trade)
+    trades_manager.clear()
+
+    # journaled trades and their fees are loaded back in memory
+    trades_manager = TradesManager(config, trader, exchange_manager)
+    await trades_manager.initialize()
+    assert list(trades_manager.trades) == ["1", "2", "3"]
+    assert trades_manager.get_trade("3").executed_price == 3
+    assert trades_manager.get_total_paid_fees() == {"BTC": 1 + 2 + 3}
+
+    # already known trades are not added again
+    for trade in trades:
+        trades_manager.upsert_trade_instance(trade)
+    trades_manager.upsert_trade_instance(_create_trade(trader, "4", 4))
+    assert list(trades_manager.trades) == ["1", "2", "3", "4"]
+    assert trades_manager.get_total_paid_fees() == {"BTC": 1 + 2 + 3 + 4}
+    assert trades_manager.trades_journal.get_trades_count() == 4
+    trades_manager.clear()
+    await exchange_manager.stop()
+
+
+async def test_trades_journal_path(tmp_path):
+    config = load_test_config()
+    exchange_manager, trader, trades_manager = await _init_trades_manager(config)
+    # no storage path: temporary journal
+    assert trades_manager._get_trades_journal_path() == ""
+
+    config[CONFIG_TRADES_HISTORY] = {CONFIG_TRADES_HISTORY_STORAGE_PATH: str(tmp_path)}
+    assert trades_manager._get_trades_journal_path() == os.path.join(str(tmp_path), "binance_simulated.sqlite")
+
+    # backtesting runs don't share their trades history
+    exchange_manager.is_backtesting = True
+    assert trades_manager._get_trades_journal_path() == ""
+    trades_manager.clear()
+    await exchange_manager.stop()
+
+
+async def _init_trades_manager(config=None):
+    config = config or load_test_config()
+    exchange_manager = ExchangeManager(config, "binance")
+    exchange_manager.is_simulated = True
+    await exchange_manager.initialize()
+
+    trader = TraderSimulator(config, exchange_manager)
+    await trader.initialize()
+    trades_manager = TradesManager(config, trader, exchange_manager)
+    await trades_manager.initialize()
+    return exchange_manager, trader, trades_manager
+
+
+def _create_trade(trader, trade_id, price):
+    trade = create_trade_instance(trader=trader,
+                                  order_type=TraderOrderType.BUY_LIMIT,
+                                  symbol="BTC/USDT",
+                                  order_id=trade_id,
+                                  filled_price=price,
+                                  quantity_filled=1,
+                                  total_cost=price,
+                                  executed_time=price)
+    trade.fee = {FeePropertyColumns.CURRENCY.value: "BTC", FeePropertyColumns.COST.value: price}
+    return trade
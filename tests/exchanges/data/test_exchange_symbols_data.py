@@ -13,8 +13,14 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import numpy as np
 import pytest
 
+from octobot_commons.enums import TimeFrames
+from octobot_trading.constants import CONFIG_CANDLES_HISTORY, CONFIG_CANDLES_HISTORY_TIME_FRAMES, \
+    CONFIG_CANDLES_HISTORY_MEMORY_BUDGET, MIN_CANDLES_HISTORY_SIZE
+from octobot_trading.data_manager.candles_manager import CandlesManager
+from octobot_trading.enums import ExchangeConstantsTickersColumns, ExchangeConstantsMarketSnapshotColumns
 from octobot_trading.exchanges.data.exchange_symbols_data import ExchangeSymbolsData
 
 # Import required fixtures
@@ -42,3 +48,89 @@ async def test_get_exchange_symbol_data_without_creation(exchange_symbols_data):
     exchange_symbols_data.get_exchange_symbol_data("ETH/USDT", allow_creation=True)
     with pytest.raises(KeyError):
         exchange_symbols_data.get_exchange_symbol_data("ETH/BTC", allow_creation=False)
+
+
+async def test_get_candles_history_size_without_config(exchange_symbols_data):
+    exchange_symbols_data.config.pop(CONFIG_CANDLES_HISTORY, None)
+    assert exchange_symbols_data.get_configured_candles_history_size(TimeFrames.ONE_HOUR) is None
+    assert exchange_symbols_data.get_candles_history_size("BTC/USDT", TimeFrames.ONE_HOUR) == \
+        CandlesManager.MAX_CANDLES_COUNT
+
+
+async def test_get_candles_history_size_with_time_frames_config(exchange_symbols_data):
+    exchange_symbols_data.config[CONFIG_CANDLES_HISTORY] = {
+        CONFIG_CANDLES_HISTORY_TIME_FRAMES: {
+            TimeFrames.ONE_MINUTE.value: 5000,
+            TimeFrames.ONE_DAY.value: 200
+        }
+    }
+    _set_traded(exchange_symbols_data, ["BTC/USDT", "ETH/USDT"], [TimeFrames.ONE_MINUTE, TimeFrames.ONE_DAY])
+    assert exchange_symbols_data.get_configured_candles_history_size(TimeFrames.ONE_MINUTE) == 5000
+    assert exchange_symbols_data.get_candles_history_size("BTC/USDT", TimeFrames.ONE_MINUTE) == 5000
+    assert exchange_symbols_data.get_candles_history_size("ETH/USDT", "1d") == 200
+    assert exchange_symbols_data.get_candles_history_size("ETH/USDT", TimeFrames.ONE_HOUR) == \
+        CandlesManager.MAX_CANDLES_COUNT
+
+
+async def test_get_candles_history_size_with_memory_budget(exchange_symbols_data):
+    symbols = ["BTC/USDT", "ETH/USDT", "XRP/USDT"]
+    wanted_size = 1000
+    min_symbol_memory = CandlesManager.get_candles_memory_size(MIN_CANDLES_HISTORY_SIZE)
+    full_symbol_memory = CandlesManager.get_candles_memory_size(wanted_size)
+    # budget: every symbol at min size, first symbol at full size and half of the second symbol extra size
+    budget = 3 * min_symbol_memory + (full_symbol_memory - min_symbol_memory) * 1.5
+    exchange_symbols_data.config[CONFIG_CANDLES_HISTORY] = {
+        CONFIG_CANDLES_HISTORY_TIME_FRAMES: {TimeFrames.ONE_HOUR.value: wanted_size},
+        CONFIG_CANDLES_HISTORY_MEMORY_BUDGET: budget / 1024 / 1024
+    }
+    _set_traded(exchange_symbols_data, symbols, [TimeFrames.ONE_HOUR])
+    assert exchange_symbols_data.get_candles_history_size("BTC/USDT", TimeFrames.ONE_HOUR) == wanted_size
+    assert exchange_symbols_data.get_candles_history_size("ETH/USDT", TimeFrames.ONE_HOUR) == \
+        MIN_CANDLES_HISTORY_SIZE + (wanted_size - MIN_CANDLES_HISTORY_SIZE) // 2
+    assert exchange_symbols_data.get_candles_history_size("XRP/USDT", TimeFrames.ONE_HOUR) == \
+        MIN_CANDLES_HISTORY_SIZE
+    # not traded symbol
+    assert exchange_symbols_data.get_candles_history_size("LTC/USDT", TimeFrames.ONE_HOUR) == \
+        MIN_CANDLES_HISTORY_SIZE
+
+
+async def test_get_memory_usage(exchange_symbols_data):
+    exchange_symbols_data.config.pop(CONFIG_CANDLES_HISTORY, None)
+    symbol_data = exchange_symbols_data.get_exchange_symbol_data("BTC/USDT")
+    await symbol_data.handle_candles_update(TimeFrames.ONE_HOUR, [[1, 1, 1, 1, 1, 1]], replace_all=True)
+    exchange_symbols_data.get_exchange_symbol_data("ETH/USDT")
+    assert exchange_symbols_data.get_memory_usage() == {
+        "BTC/USDT": CandlesManager.get_candles_memory_size(CandlesManager.MAX_CANDLES_COUNT),
+        "ETH/USDT": 0
+    }
+
+
+async def test_get_market_snapshot(exchange_manager):
+    exchange_symbols_data = exchange_manager.exchange_symbols_data
+    btc_data = exchange_symbols_data.get_exchange_symbol_data("BTC/USDT")
+    eth_data = exchange_symbols_data.get_exchange_symbol_data("ETH/USDT")
+    btc_data.handle_ticker_update({ExchangeConstantsTickersColumns.LAST.value: 10000,
+                                   ExchangeConstantsTickersColumns.BASE_VOLUME.value: 10})
+    eth_data.handle_ticker_update({ExchangeConstantsTickersColumns.LAST.value: 200})
+    eth_data.handle_mark_price_update(201)
+    btc_data.handle_order_book_ticker_update(1, 10001, 2, 9999)
+
+    symbols, last_prices = exchange_symbols_data.get_last_prices()
+    assert symbols == ["BTC/USDT", "ETH/USDT"]
+    assert last_prices.tolist() == [10000, 200]
+
+    symbols, snapshot = exchange_symbols_data.get_market_snapshot()
+    assert snapshot[ExchangeConstantsTickersColumns.ASK.value][0] == 10001
+    assert snapshot[ExchangeConstantsTickersColumns.BID_VOLUME.value][0] == 2
+    assert snapshot[ExchangeConstantsTickersColumns.BASE_VOLUME.value][0] == 10
+    assert np.isnan(snapshot[ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value][0])
+    assert snapshot[ExchangeConstantsMarketSnapshotColumns.MARK_PRICE.value][1] == 201
+    assert snapshot[ExchangeConstantsMarketSnapshotColumns.MARK_PRICE_TIMESTAMP.value][1] > 0
+
+    symbols, snapshot = exchange_symbols_data.get_market_snapshot((ExchangeConstantsTickersColumns.LAST.value, ))
+    assert list(snapshot) == [ExchangeConstantsTickersColumns.LAST.value]
+
+
+def _set_traded(exchange_symbols_data, symbols, time_frames):
+    exchange_symbols_data.exchange_manager.exchange_config.traded_symbol_pairs = symbols
+    exchange_symbols_data.exchange_manager.exchange_config.traded_time_frames = time_frames
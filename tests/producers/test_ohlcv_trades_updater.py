@@ -0,0 +1,170 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+
+import pytest
+from mock import AsyncMock
+
+from octobot_commons.constants import MINUTE_TO_SECONDS
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.enums import ExchangeConstantsOrderColumns
+from octobot_trading.exchanges.data.exchange_symbols_data import ExchangeSymbolsData
+from octobot_trading.producers.ohlcv_trades_updater import OHLCVTradesUpdater
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+SYMBOL = "BTC/USDT"
+# REST candles close price
+REST_CANDLE_CLOSE = -1
+
+
+async def test_first_partial_candle_is_repaired(monkeypatch):
+    updater = await _init_updater(monkeypatch, 10)
+    exchange = updater.channel.exchange_manager.exchange
+
+    # trades of the in construction candle are received from its middle: it is fetched once closed
+    _set_current_minute(monkeypatch, 11)
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Bitcoin", SYMBOL,
+                                       _get_trades([(10, 40, 100), (11, 10, 101)]))
+    exchange.get_symbol_prices.assert_called_once_with(SYMBOL, TimeFrames.ONE_MINUTE, limit=2)
+    updater.push.assert_called_once()
+    assert _get_candles(updater)[-1][PriceIndexes.IND_PRICE_TIME.value] == 10 * MINUTE_TO_SECONDS
+    assert _get_candles(updater)[-1][PriceIndexes.IND_PRICE_CLOSE.value] == REST_CANDLE_CLOSE
+
+
+async def test_push_contiguous_candles(monkeypatch):
+    updater = await _init_updater(monkeypatch, 10)
+    _set_current_minute(monkeypatch, 11)
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Bitcoin", SYMBOL, _get_trades([(11, 10, 101)]))
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_symbol_prices.reset_mock()
+    updater.push.reset_mock()
+
+    # candles following the last stored one are built from trades
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Bitcoin", SYMBOL,
+                                       _get_trades([(11, 30, 105), (11, 50, 99), (12, 5, 102), (13, 1, 103)]))
+    exchange.get_symbol_prices.assert_not_called()
+    updater.push.assert_called_once()
+    assert _get_candles(updater)[-2:] == [
+        [11 * MINUTE_TO_SECONDS, 101, 105, 99, 99, 3],
+        [12 * MINUTE_TO_SECONDS, 102, 102, 102, 102, 1]
+    ]
+
+    # trades of other symbols are ignored
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Ethereum", "ETH/USDT", _get_trades([(14, 1, 103)]))
+    updater.push.assert_called_once()
+
+
+async def test_gap_is_repaired(monkeypatch):
+    updater = await _init_updater(monkeypatch, 10)
+    _set_current_minute(monkeypatch, 11)
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Bitcoin", SYMBOL, _get_trades([(11, 10, 101)]))
+    exchange = updater.channel.exchange_manager.exchange
+    exchange.get_symbol_prices.reset_mock()
+
+    # no trade during 00:13 and 00:15: 00:14 is not following 00:12
+    _set_current_minute(monkeypatch, 16)
+    await updater.handle_recent_trades(EXCHANGE_NAME, "", "Bitcoin", SYMBOL,
+                                       _get_trades([(12, 5, 102), (14, 1, 103), (16, 1, 104)]))
+    # 00:11 and 00:12 are pushed from trades then 00:13 and 00:14 are fetched until the in construction candle
+    exchange.get_symbol_prices.assert_called_once_with(SYMBOL, TimeFrames.ONE_MINUTE, limit=4)
+    assert [candle[PriceIndexes.IND_PRICE_TIME.value] // MINUTE_TO_SECONDS
+            for candle in _get_candles(updater)[-4:]] == [11, 12, 13, 14]
+    assert _get_candles(updater)[-3][PriceIndexes.IND_PRICE_CLOSE.value] == 102
+    assert _get_candles(updater)[-1][PriceIndexes.IND_PRICE_CLOSE.value] == REST_CANDLE_CLOSE
+
+
+async def _init_updater(monkeypatch, current_minute):
+    _set_current_minute(monkeypatch, current_minute)
+    exchange_manager = _ExchangeManager()
+    updater = OHLCVTradesUpdater(_Channel(exchange_manager))
+
+    async def _push(time_frame, pair, candles, replace_all=False, partial=False):
+        await exchange_manager.get_symbol_data(pair) \
+            .handle_candles_update(time_frame, candles, replace_all=replace_all, partial=partial)
+    updater.push = AsyncMock(side_effect=_push)
+    await updater._initialize_candles(TimeFrames.ONE_MINUTE, SYMBOL)
+    exchange_manager.exchange.get_symbol_prices.reset_mock()
+    return updater
+
+
+def _set_current_minute(monkeypatch, minute):
+    monkeypatch.setattr(time, "time", lambda: minute * MINUTE_TO_SECONDS + MINUTE_TO_SECONDS / 2)
+
+
+def _get_candles(updater):
+    return updater.channel.exchange_manager.get_symbol_data(SYMBOL).symbol_candles[TimeFrames.ONE_MINUTE] \
+        .get_candles().T.tolist()
+
+
+def _get_trades(trades):
+    return [{
+        ExchangeConstantsOrderColumns.TIMESTAMP.value: minute * MINUTE_TO_SECONDS + second,
+        ExchangeConstantsOrderColumns.PRICE.value: price,
+        ExchangeConstantsOrderColumns.AMOUNT.value: 1
+    } for minute, second, price in trades]
+
+
+async def _get_symbol_prices(symbol, time_frame, limit=None):
+    # candles up to the current in construction one
+    last_minute = int(time.time() // MINUTE_TO_SECONDS)
+    candles = []
+    for minute in range(last_minute - limit + 1, last_minute + 1):
+        candle = [minute] * len(PriceIndexes)
+        candle[PriceIndexes.IND_PRICE_TIME.value] = minute * MINUTE_TO_SECONDS
+        candle[PriceIndexes.IND_PRICE_CLOSE.value] = REST_CANDLE_CLOSE
+        candles.append(candle)
+    return candles
+
+
+class _Channel:
+    def __init__(self, exchange_manager):
+        self.exchange_manager = exchange_manager
+
+
+class _ExchangeConfig:
+    traded_time_frames = [TimeFrames.ONE_MINUTE]
+    traded_symbol_pairs = [SYMBOL]
+
+
+class _Exchange:
+    def __init__(self):
+        self.get_symbol_prices = AsyncMock(side_effect=_get_symbol_prices)
+
+
+class _ExchangeManager:
+    exchange_name = EXCHANGE_NAME
+    is_margin = False
+
+    def __init__(self):
+        self.config = {}
+        self.exchange = _Exchange()
+        self.exchange_config = _ExchangeConfig()
+        self.exchange_symbols_data = ExchangeSymbolsData(self)
+
+    def get_symbol_data(self, symbol):
+        return self.exchange_symbols_data.get_exchange_symbol_data(symbol)
+
+    def is_built_from_recent_trades(self, channel):
+        return False
+
+    def get_uniformized_timestamp(self, timestamp):
+        return timestamp
+
+    def uniformize_candles_if_necessary(self, candles):
+        return candles
@@ -0,0 +1,150 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+
+import numpy as np
+import pytest
+from mock import AsyncMock
+
+from octobot_commons.constants import HOURS_TO_SECONDS
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.constants import CONFIG_CANDLES_HISTORY, CONFIG_CANDLES_HISTORY_STORAGE_PATH
+from octobot_trading.exchanges.data.exchange_symbols_data import ExchangeSymbolsData
+from octobot_trading.producers.ohlcv_updater import OHLCVUpdater
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EXCHANGE_NAME = "binance"
+SYMBOL = "BTC/USDT"
+# in construction one hour candle
+CURRENT_HOUR = 100
+
+
+async def test_initialize_candles_without_storage(monkeypatch):
+    _set_current_hour(monkeypatch, CURRENT_HOUR)
+    updater = _create_updater({})
+    assert updater.candles_storage is None
+    assert await updater._initialize_candles(TimeFrames.ONE_HOUR, SYMBOL) == _get_hour_candles(CURRENT_HOUR, 1)[0]
+    updater.channel.exchange_manager.exchange.get_symbol_prices.assert_called_once_with(
+        SYMBOL, TimeFrames.ONE_HOUR, limit=OHLCVUpdater.OHLCV_OLD_LIMIT)
+    assert _get_candles_times(updater) == list(range(CURRENT_HOUR - OHLCVUpdater.OHLCV_OLD_LIMIT + 1, CURRENT_HOUR))
+
+
+async def test_initialize_candles_from_storage(monkeypatch, tmp_path):
+    config = {CONFIG_CANDLES_HISTORY: {CONFIG_CANDLES_HISTORY_STORAGE_PATH: str(tmp_path)}}
+    _set_current_hour(monkeypatch, CURRENT_HOUR)
+    updater = _create_updater(config)
+    # no stored candles: fetch the whole history, stored on stop
+    await updater._initialize_candles(TimeFrames.ONE_HOUR, SYMBOL)
+    updater.channel.exchange_manager.exchange.get_symbol_prices.assert_called_once_with(
+        SYMBOL, TimeFrames.ONE_HOUR, limit=OHLCVUpdater.OHLCV_OLD_LIMIT)
+    assert updater.candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR) is None
+    await updater.stop()
+    stored_candles = updater.candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR)
+    assert stored_candles[PriceIndexes.IND_PRICE_TIME.value, -1] == (CURRENT_HOUR - 1) * HOURS_TO_SECONDS
+
+    # 3 hours later: only fetch the 3 candles closed since the last stored one and the in construction one
+    _set_current_hour(monkeypatch, CURRENT_HOUR + 3)
+    updater = _create_updater(config)
+    assert await updater._initialize_candles(TimeFrames.ONE_HOUR, SYMBOL) == \
+        _get_hour_candles(CURRENT_HOUR + 3, 1)[0]
+    updater.channel.exchange_manager.exchange.get_symbol_prices.assert_called_once_with(
+        SYMBOL, TimeFrames.ONE_HOUR, limit=4)
+    assert _get_candles_times(updater) == list(range(CURRENT_HOUR - OHLCVUpdater.OHLCV_OLD_LIMIT + 1,
+                                                     CURRENT_HOUR + 3))
+
+    # stored candles are too old: fetch the whole history
+    _set_current_hour(monkeypatch, CURRENT_HOUR + 3 + OHLCVUpdater.OHLCV_OLD_LIMIT)
+    updater = _create_updater(config)
+    await updater._initialize_candles(TimeFrames.ONE_HOUR, SYMBOL)
+    updater.channel.exchange_manager.exchange.get_symbol_prices.assert_called_once_with(
+        SYMBOL, TimeFrames.ONE_HOUR, limit=OHLCVUpdater.OHLCV_OLD_LIMIT)
+
+
+async def test_stop_saves_candles(monkeypatch, tmp_path):
+    config = {CONFIG_CANDLES_HISTORY: {CONFIG_CANDLES_HISTORY_STORAGE_PATH: str(tmp_path)}}
+    _set_current_hour(monkeypatch, CURRENT_HOUR)
+    updater = _create_updater(config)
+    await updater._initialize_candles(TimeFrames.ONE_HOUR, SYMBOL)
+    symbol_data = updater.channel.exchange_manager.get_symbol_data(SYMBOL)
+    await symbol_data.handle_candles_update(TimeFrames.ONE_HOUR, _get_hour_candles(CURRENT_HOUR, 1), partial=True)
+
+    await updater.stop()
+    stored_candles = updater.candles_storage.load_candles(EXCHANGE_NAME, SYMBOL, TimeFrames.ONE_HOUR)
+    assert np.array_equal(stored_candles, symbol_data.symbol_candles[TimeFrames.ONE_HOUR].get_candles())
+    assert stored_candles[PriceIndexes.IND_PRICE_TIME.value, -1] == CURRENT_HOUR * HOURS_TO_SECONDS
+
+
+def _create_updater(config):
+    exchange_manager = _ExchangeManager(config)
+    return OHLCVUpdater(_Channel(exchange_manager))
+
+
+def _set_current_hour(monkeypatch, hour):
+    monkeypatch.setattr(time, "time", lambda: hour * HOURS_TO_SECONDS + HOURS_TO_SECONDS / 2)
+
+
+def _get_candles_times(updater):
+    candles = updater.channel.exchange_manager.get_symbol_data(SYMBOL).symbol_candles[TimeFrames.ONE_HOUR]
+    return (candles.get_symbol_time_candles() // HOURS_TO_SECONDS).astype(int).tolist()
+
+
+async def _get_symbol_prices(symbol, time_frame, limit=None):
+    # candles up to the current in construction one
+    return _get_hour_candles(int(time.time() // HOURS_TO_SECONDS), limit)
+
+
+def _get_hour_candles(last_hour, count):
+    candles = []
+    for hour in range(last_hour - count + 1, last_hour + 1):
+        candle = [0] * len(PriceIndexes)
+        candle[PriceIndexes.IND_PRICE_TIME.value] = hour * HOURS_TO_SECONDS
+        candle[PriceIndexes.IND_PRICE_CLOSE.value] = hour
+        candles.append(candle)
+    return candles
+
+
+class _Channel:
+    def __init__(self, exchange_manager):
+        self.exchange_manager = exchange_manager
+
+
+class _ExchangeConfig:
+    traded_time_frames = [TimeFrames.ONE_HOUR]
+    traded_symbol_pairs = [SYMBOL]
+
+
+class _Exchange:
+    def __init__(self):
+        self.get_symbol_prices = AsyncMock(side_effect=_get_symbol_prices)
+
+
+class _ExchangeManager:
+    exchange_name = EXCHANGE_NAME
+    is_margin = False
+
+    def __init__(self, config):
+        self.config = config
+        self.exchange = _Exchange()
+        self.exchange_config = _ExchangeConfig()
+        self.exchange_symbols_data = ExchangeSymbolsData(self)
+
+    def get_symbol_data(self, symbol):
+        return self.exchange_symbols_data.get_exchange_symbol_data(symbol)
+
+    def uniformize_candles_if_necessary(self, candles):
+        return candles